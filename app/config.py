@@ -1,4 +1,6 @@
 """Configuration settings class"""
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -10,6 +12,74 @@ class Settings(BaseSettings):
     API_BASE_URL: str
     API_SERVER: str
     ENVIRONMENT: str = "development"
+    # "asgi" serves frontend API calls in-process; "http" goes over the network
+    API_TRANSPORT: str = "asgi"
+    # Shared httpx client used by the frontend layer
+    HTTP_POOL_MAX_CONNECTIONS: int = 20
+    HTTP_POOL_MAX_KEEPALIVE: int = 10
+    HTTP_POOL_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_DEFAULT_TIMEOUT: float = 10.0
+    HTTP2_ENABLED: bool = False
+    # Runtime stats on GET /api/health/stats (signed-in users only)
+    HEALTH_STATS_ENABLED: bool = True
+    # Resolved-user cache used by core.security.get_current_user
+    USER_CACHE_TTL_SECONDS: float = 60.0
+    USER_CACHE_MAX_SIZE: int = 1024
+    # Verified-JWT cache used by services.token_service.TokenService
+    TOKEN_CACHE_MAX_SIZE: int = 4096
+    # Rendered dashboard fragments (app/utils/templates.py)
+    FRAGMENT_CACHE_MAX_ENTRIES: int = 2048
+    FRAGMENT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # Per-data-version analytics results (services/analytics_service.py)
+    ANALYTICS_CACHE_MAX_SIZE: int = 512
+    ANALYTICS_CACHE_TTL_SECONDS: float = 3600.0
+    # Day-of-month spend curves behind the overview forecast
+    # (services/forecast_service.py), built from this many completed months
+    FORECAST_HISTORY_MONTHS: int = 6
+    FORECAST_CACHE_MAX_SIZE: int = 1024
+    FORECAST_CURVE_TTL_SECONDS: float = 6 * 3600.0
+    # Report jobs (services/report_service.py): threads run the jobs, processes
+    # render the files (0 renders in the job thread). Empty cache dir = a
+    # "bajeti-reports" folder in the system temp dir.
+    REPORT_THREAD_WORKERS: int = 2
+    REPORT_PROCESS_WORKERS: int = 1
+    REPORT_MAX_QUEUE: int = 32
+    REPORT_MAX_JOBS: int = 1000
+    REPORT_CACHE_DIR: str = ""
+    REPORT_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    # Production template mode (no auto_reload, bytecode cache, precompile at
+    # startup); unset follows ENVIRONMENT. Empty cache dir = Jinja's temp dir.
+    TEMPLATE_PRODUCTION_MODE: Optional[bool] = None
+    TEMPLATE_BYTECODE_CACHE_DIR: str = ""
+    # Database; empty URL falls back to the bundled SQLite file (see data/db/db.py)
+    SQLALCHEMY_DATABASE_URL: str = ""
+    # Pool options, ignored for SQLite
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 disables
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # PostgreSQL only; 0 disables
+    # bcrypt worker pool and cost (see core/passwords.py); unset BCRYPT_ROUNDS
+    # calibrates the cost at startup to BCRYPT_TARGET_MS, except in production,
+    # which falls back to the fixed BCRYPT_PRODUCTION_ROUNDS
+    BCRYPT_WORKERS: int = 2
+    BCRYPT_MAX_QUEUE: int = 32
+    BCRYPT_ROUNDS: Optional[int] = None
+    BCRYPT_TARGET_MS: float = 250.0
+    BCRYPT_MIN_ROUNDS: int = 10
+    BCRYPT_MAX_ROUNDS: int = 14
+    BCRYPT_PRODUCTION_ROUNDS: int = 12
+    # SQLite connection profile applied on connect (see data/db/db.py)
+    SQLITE_TUNED: bool = True
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 268435456  # bytes (256 MiB)
+    SQLITE_CACHE_SIZE: int = -65536  # negative = KiB (64 MiB)
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    # PRAGMA optimize + wal_checkpoint interval; 0 disables the task
+    SQLITE_MAINTENANCE_INTERVAL_SECONDS: int = 3600
 
     class Config:
         """Pydantic class for telling it to load .env"""
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Optional
 from fastapi import Depends, Request, Form, Response, status
 from fastapi.responses import RedirectResponse, HTMLResponse
+from app.handlers.task_graph import TaskGraph
 from app.services.allocation_service import fetch_budget_overview
 from app.services.budget_service import get_active_budget, get_all_budgets
 from app.utils.active_budget import resolve_active_budget_id
@@ -20,6 +21,18 @@ from fastapi import HTTPException
 logger = logging.getLogger(__name__)
 HTMLResponse = HTMLResponse  # expose to router
 
+# Upper bound (seconds) for any single backend call while building the dashboard
+DASHBOARD_FETCH_TIMEOUT = 8.0
+
+# Expensive dashboard blocks served from the fragment cache
+DASHBOARD_FRAGMENTS = {
+    name: f"partials/dashboard/{name}.html"
+    for name in (
+        "budget_selector", "category_cards", "allocations_table",
+        "category_modals", "budget_modals", "allocation_modals",
+    )
+}
+
 
 async def profile(request: Request):
     token: str = get_current_user(request)
@@ -88,25 +101,114 @@ async def dashboard(
     token: str = Depends(get_current_user),
     budget_id: Optional[int] = None
 ):
-    # 1. Resolve authenticated user
-    user_response = await svc_get_current_user(token=token)
-    if user_response.status_code != status.HTTP_200_OK:
-        return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
+    def resolve_active_budget(all_budgets):
+        """Pick the active budget: valid query param, then cookie, then first."""
+        if not all_budgets:
+            return None
+
+        valid_budget_ids = {b["id"] for b in all_budgets}
+
+        resolved_budget_id = None
+
+        # Explicit query param wins if valid
+        if budget_id and budget_id in valid_budget_ids:
+            resolved_budget_id = budget_id
+        else:
+            # Fallback to cookie
+            cookie_budget = request.cookies.get("active_budget_id")
+
+            if cookie_budget:
+                try:
+                    cookie_budget = int(cookie_budget)
+                    if cookie_budget in valid_budget_ids:
+                        resolved_budget_id = cookie_budget
+                except ValueError:
+                    pass  # corrupted cookie
+
+        # Final fallback → first available budget
+        if not resolved_budget_id:
+            resolved_budget_id = all_budgets[0]["id"]
+
+        # Get selected budget object directly
+        return next(
+            b for b in all_budgets if b["id"] == resolved_budget_id
+        )
 
-    user = user_response.json()
+    # X-Data-Version of every API read feeding the cached fragments
+    data_versions = []
+
+    def read_json(response, fallback):
+        # 404 is how these APIs say "none yet": still a complete, versioned answer
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_404_NOT_FOUND):
+            data_versions.append(response.headers.get("x-data-version"))
+        if response.status_code != status.HTTP_200_OK:
+            return fallback
+        return response.json()
+
+    async def fetch_user():
+        response = await svc_get_current_user(token=token)
+        return response.json() if response.status_code == status.HTTP_200_OK else None
+
+    async def fetch_all_budgets():
+        response = await get_all_budgets(token=token)
+        return read_json(response, None)
+
+    async def fetch_categories_with_stats(active_budget):
+        if not active_budget:
+            return []
+        response = await svc_get_categories(
+            token=token,
+            budget_id=active_budget["id"]
+        )
+        return read_json(response, [])
+
+    async def fetch_budget_allocations(active_budget):
+        if not active_budget:
+            return {}
+        response = await fetch_budget_overview(
+            token=token,
+            budget_id=active_budget["id"],
+            forecast=True
+        )
+        return read_json(response, {})
+
+    async def fetch_budget_categories(active_budget):
+        if not active_budget:
+            return []
+        response = await get_categories_by_type(
+            token=token,
+            category_type=active_budget["type"]
+        )
+        return read_json(response, [])
+
+    # 1. Fetch everything concurrently; the last three only wait on the budget id
+    graph = TaskGraph(timeout=DASHBOARD_FETCH_TIMEOUT)
+    graph.add("user", fetch_user)
+    graph.add("all_budgets", fetch_all_budgets)
+    graph.add("active_budget", resolve_active_budget, after=["all_budgets"])
+    graph.add("categories_with_stats", fetch_categories_with_stats,
+              after=["active_budget"], fallback=[])
+    graph.add("budget_allocations", fetch_budget_allocations,
+              after=["active_budget"], fallback={})
+    graph.add("budget_categories", fetch_budget_categories,
+              after=["active_budget"], fallback=[])
+    results = await graph.run()
+
+    # 2. Resolve authenticated user
+    user = results["user"]
+    if user is None:
+        return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
 
-    # 2. Fetch ALL budgets for this user FIRST
-    all_budgets_response = await get_all_budgets(token=token)
+    # 3. Budgets
+    all_budgets = results["all_budgets"]
 
-    if all_budgets_response.status_code != status.HTTP_200_OK:
+    if all_budgets is None:
         return redirect_with_toast(
             "/dashboard",
             "Unable to load budgets.",
             "error"
         )
 
-    all_budgets = all_budgets_response.json()
-
     # If user truly has no budgets → correct message
     if not all_budgets:
         return redirect_with_toast(
@@ -130,70 +232,24 @@ async def dashboard(
     total_expense_amount = sum(
         Decimal(str(b["amount"])) for b in expense_budgets
     )
-    # 3. Safely resolve active budget
-    valid_budget_ids = {b["id"] for b in all_budgets}
-
-    resolved_budget_id = None
-
-    # Explicit query param wins if valid
-    if budget_id and budget_id in valid_budget_ids:
-        resolved_budget_id = budget_id
-    else:
-        # Fallback to cookie
-        cookie_budget = request.cookies.get("active_budget_id")
-
-        if cookie_budget:
-            try:
-                cookie_budget = int(cookie_budget)
-                if cookie_budget in valid_budget_ids:
-                    resolved_budget_id = cookie_budget
-            except ValueError:
-                pass  # corrupted cookie
-
-    # Final fallback → first available budget
-    if not resolved_budget_id:
-        resolved_budget_id = all_budgets[0]["id"]
-
-    # Get selected budget object directly
-    active_budget = next(
-        b for b in all_budgets if b["id"] == resolved_budget_id
-    )
-
-    # 4. Fetch dashboard data safely
-    categories_response = await svc_get_categories(
-        token=token,
-        budget_id=resolved_budget_id
-    )
-
-    categories_with_stats = (
-        categories_response.json()
-        if categories_response.status_code == status.HTTP_200_OK
-        else []
-    )
-
-    budget_allocations_response = await fetch_budget_overview(
-        token=token,
-        budget_id=resolved_budget_id
-    )
-
-    budget_allocations = (
-        budget_allocations_response.json()
-        if budget_allocations_response.status_code == status.HTTP_200_OK
-        else {}
-    )
 
-    budget_categories_response = await get_categories_by_type(
-        token=token,
-        category_type=active_budget["type"]
-    )
-
-    budget_categories = (
-        budget_categories_response.json()
-        if budget_categories_response.status_code == status.HTTP_200_OK
-        else []
-    )
+    # 4. Dashboard data (already fetched, falls back to empty on failure)
+    active_budget = results["active_budget"]
+    resolved_budget_id = active_budget["id"]
+    categories_with_stats = results["categories_with_stats"]
+    budget_allocations = results["budget_allocations"]
+    budget_categories = results["budget_categories"]
+
+    # 5. Render template. Fragments are cached only when every read saw
+    # the same data version; otherwise a write landed mid-fetch. The
+    # allocation forecasts move with the day, so the key does too; the key
+    # and the dates shown come from the same (UTC) clock reading.
+    today = datetime.utcnow()
+    fragment_key = None
+    if len(data_versions) == 4 and None not in data_versions and len(set(data_versions)) == 1:
+        fragment_key = (user["id"], resolved_budget_id,
+                        today.date().isoformat(), data_versions[0])
 
-    # 5. Render template
     template_response = await render_with_user(
         "dashboard.html",
         request,
@@ -206,10 +262,12 @@ async def dashboard(
             "total_expense_amount": total_expense_amount,
             "budget_categories": budget_categories,
             "token": token,
-            "current_month": datetime.now().strftime("%B"),
+            "current_month": today.strftime("%B"),
             "user": user,
-            "now": datetime.now().strftime("%Y-%m"),
-        }
+            "now": today.strftime("%Y-%m"),
+        },
+        fragments=DASHBOARD_FRAGMENTS,
+        fragment_key=fragment_key
     )
     # 6. Normalize / Repair Cookie
     existing_cookie = request.cookies.get("active_budget_id")
@@ -1,17 +1,48 @@
 # app/handlers/page_handlers.py
-from fastapi import Request
+from typing import Optional
+
+from fastapi import Query, Request, status
 from fastapi.responses import HTMLResponse
+from app.services.analytics_service import fetch_budget_analytics
+from app.services.budget_service import get_all_budgets
+from app.utils.active_budget import resolve_active_budget_id
 from app.utils.templates import render_with_user
+from app.utils.tokens import get_current_user
 
 HTMLResponse = HTMLResponse
 
+# Month ranges offered on the analytics page
+ANALYTICS_RANGES = (6, 12, 24, 60)
+
+
+async def analytics_page(request: Request,
+                         budget_id: Optional[int] = None,
+                         months: int = Query(12, ge=1, le=60)):
+    token = get_current_user(request)  # may raise redirect HTTPException
+
+    budgets_response = await get_all_budgets(token=token)
+    budgets = budgets_response.json() \
+        if budgets_response.status_code == status.HTTP_200_OK else []
 
-async def reports_page(request: Request):
-    return await render_with_user("reports.html", request)
+    # Query param, then cookie, then the first budget
+    valid_budget_ids = [b["id"] for b in budgets]
+    active_budget_id = resolve_active_budget_id(request, budget_id)
+    if active_budget_id not in valid_budget_ids:
+        active_budget_id = valid_budget_ids[0] if valid_budget_ids else None
 
+    analytics = None
+    if active_budget_id:
+        response = await fetch_budget_analytics(token, active_budget_id, months)
+        if response.status_code == status.HTTP_200_OK:
+            analytics = response.json()
 
-async def analytics_page(request: Request):
-    return await render_with_user("analytics.html", request)
+    return await render_with_user("analytics.html", request, {
+        "budgets": budgets,
+        "active_budget_id": active_budget_id,
+        "analytics": analytics,
+        "months": months,
+        "ranges": ANALYTICS_RANGES,
+    })
 
 
 async def settings_page(request: Request):
@@ -0,0 +1,78 @@
+# app/handlers/report_handlers.py
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Form, Request, Response, status
+from fastapi.responses import HTMLResponse, RedirectResponse
+
+from app.services.budget_service import get_all_budgets
+from app.services.report_service import create_report, download_report, get_report
+from app.utils.active_budget import resolve_active_budget_id
+from app.utils.redirects import redirect_with_toast
+from app.utils.templates import render_with_user
+from app.utils.tokens import get_current_user
+
+HTMLResponse = HTMLResponse  # expose to router
+
+# Seconds between status checks while a report is generating
+REPORT_POLL_SECONDS = 2
+
+
+async def reports_page(request: Request, job: Optional[str] = None):
+    token = get_current_user(request)  # may raise redirect HTTPException
+
+    budgets_response = await get_all_budgets(token=token)
+    budgets = budgets_response.json() \
+        if budgets_response.status_code == status.HTTP_200_OK else []
+
+    report_job = None
+    if job:
+        response = await get_report(token, job)
+        if response.status_code == status.HTTP_200_OK:
+            report_job = response.json()
+
+    now = datetime.now()
+    return await render_with_user("reports.html", request, {
+        "budgets": budgets,
+        "active_budget_id": resolve_active_budget_id(request, None),
+        "job": report_job,
+        "poll_seconds": REPORT_POLL_SECONDS,
+        "this_month": now.strftime("%Y-%m"),
+        "this_year": now.year,
+    })
+
+
+async def request_report(request: Request,
+                         budget_id: int = Form(...),
+                         period_type: str = Form(...),
+                         month: Optional[str] = Form(None),
+                         year: Optional[str] = Form(None),
+                         report_format: str = Form(...)):
+    token = get_current_user(request)
+    period = month if period_type == "monthly" else year
+
+    response = await create_report(token, budget_id, period or "", report_format)
+    if response.status_code == status.HTTP_202_ACCEPTED:
+        return RedirectResponse(url=f"/reports?job={response.json()['id']}",
+                                status_code=status.HTTP_303_SEE_OTHER)
+
+    message = "Too many reports are being generated, please try again shortly" \
+        if response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE \
+        else "Could not generate that report"
+    return redirect_with_toast(base_url="/reports", message=message, type_="error")
+
+
+async def report_download(request: Request, job_id: str):
+    token = get_current_user(request)
+    response = await download_report(token, job_id)
+    if response.status_code != status.HTTP_200_OK:
+        return redirect_with_toast(
+            base_url="/reports",
+            message="That report is no longer available, please request it again",
+            type_="error",
+        )
+    return Response(
+        content=response.content,
+        media_type=response.headers["content-type"],
+        headers={"Content-Disposition": response.headers["content-disposition"]},
+    )
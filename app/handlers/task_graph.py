@@ -0,0 +1,68 @@
+# app/handlers/task_graph.py
+import asyncio
+import inspect
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TaskGraph:
+    """
+    Run page data fetches concurrently. Each task starts as soon as the tasks
+    it depends on have resolved and receives their results positionally.
+
+    A task that raises or exceeds its timeout resolves to its fallback, and
+    every task depending on it is skipped (also resolving to its fallback),
+    so one slow or broken backend call degrades the page instead of failing it.
+    """
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self._nodes: Dict[str, dict] = {}
+        self.failed: set = set()
+
+    def add(self,
+            name: str,
+            func: Callable[..., Any],
+            after: Iterable[str] = (),
+            timeout: Optional[float] = None,
+            fallback: Any = None):
+        for dep in after:
+            if dep not in self._nodes:
+                raise ValueError(f"Unknown dependency '{dep}' for task '{name}'")
+        self._nodes[name] = {
+            "func": func,
+            "after": tuple(after),
+            "timeout": timeout or self.timeout,
+            "fallback": fallback,
+        }
+        return self
+
+    async def run(self) -> Dict[str, Any]:
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_node(name: str, node: dict):
+            deps = [await tasks[dep] for dep in node["after"]]
+            if any(dep in self.failed for dep in node["after"]):
+                self.failed.add(name)
+                return node["fallback"]
+            try:
+                result = node["func"](*deps)
+                if inspect.isawaitable(result):
+                    result = await asyncio.wait_for(result, node["timeout"])
+                return result
+            except asyncio.TimeoutError:
+                logger.warning("Task '%s' timed out after %ss",
+                               name, node["timeout"])
+            except Exception:
+                logger.exception("Task '%s' failed", name)
+            self.failed.add(name)
+            return node["fallback"]
+
+        # Nodes can only depend on earlier ones, so insertion order is a valid
+        # topological order and every dependency task exists before it's awaited.
+        for name, node in self._nodes.items():
+            tasks[name] = asyncio.create_task(run_node(name, node))
+
+        return {name: await task for name, task in tasks.items()}
@@ -5,11 +5,12 @@ import logging
 from typing import Optional
 from fastapi import APIRouter, Form, HTTPException, Request, Depends, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 import httpx
-from jose import JWTError, jwt
 from urllib.parse import urlencode
-from app.config import settings, ENVIRONMENT
+from app.config import settings
+from app.services import http_client
+from app.utils.templates import templates
+from services.token_service import TokenService
 
 # Logging setup
 logger = logging.getLogger(__name__)
@@ -19,41 +20,17 @@ SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 API_BASE_URL = settings.API_BASE_URL
 
-# Setup templates
-templates = Jinja2Templates(directory="app/templates")
-templates.env.globals["ENVIRONMENT"] = ENVIRONMENT
-
 router = APIRouter()
 
 # ---------- Helper Functions ----------
 
 
-def commafy(value, decimals=0):
-    try:
-        # Convert to float first to handle both int and float values
-        num_value = float(value)
-
-        # Format with commas and specified decimal places
-        if decimals == 0:
-            return f"{int(num_value):,}"
-        else:
-            return f"{num_value:,.{decimals}f}"
-    except (ValueError, TypeError):
-        return value
-
-
-# Register the filter manually
-templates.env.filters["commafy"] = commafy
-
-
 def verify_token(token: str):
     """Verify JWT Token"""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError as e:
-        logger.error("Token verification failed: %s", e)
-        return None
+    payload = TokenService.decode_token(token)
+    if payload is None:
+        logger.error("Token verification failed")
+    return payload
 
 
 def get_current_user(request: Request):
@@ -79,16 +56,13 @@ async def get_user_from_cookie(request: Request):
     token = request.cookies.get("access_token")
     if not token:
         return None
-    try:
-        jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    except JWTError:
+    if TokenService.decode_token(token) is None:
         return None
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{API_BASE_URL}/auth/users/me",
-                                    headers={"Authorization": f"Bearer {token}"})
-        if response.status_code == status.HTTP_200_OK:
-            return response.json()
+    response = await http_client.get("/auth/users/me",
+                                     headers={"Authorization": f"Bearer {token}"})
+    if response.status_code == status.HTTP_200_OK:
+        return response.json()
     return None
 
 
@@ -109,9 +83,8 @@ def redirect_with_toast(base_url: str, message: str, type_: str = "success", sta
 
 async def handle_authenticated_login(username: str, password: str, request: Request):
     """Handles the login for an authenticated user"""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(f"{API_BASE_URL}/auth/token",
-                                     data={"username": username, "password": password})
+    response = await http_client.post("/auth/token",
+                                      data={"username": username, "password": password})
 
     if response.status_code != status.HTTP_200_OK:
         return await render_with_user("login.html", request, {
@@ -164,15 +137,14 @@ async def register_user(request: Request,
             "security_answer": security_answer,
         })
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(f"{API_BASE_URL}/auth/",
-                                     json={
-                                         "first_name": first_name,
-                                         "last_name": last_name,
-                                         "email": email,
-                                         "password": password,
-                                         "security_answer": security_answer
-                                     })
+    response = await http_client.post("/auth/",
+                                      json={
+                                          "first_name": first_name,
+                                          "last_name": last_name,
+                                          "email": email,
+                                          "password": password,
+                                          "security_answer": security_answer
+                                      })
 
     if response.status_code == status.HTTP_409_CONFLICT:
         return await render_with_user("register.html", request, {
@@ -226,9 +198,8 @@ async def reset_password(request: Request,
                          new_password: str = Form(...)):
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(f"{API_BASE_URL}/users/password/reset",
-                                         json={"email": email, "security_answer": security_answer, "new_password": new_password})
+        response = await http_client.post("/users/password/reset",
+                                          json={"email": email, "security_answer": security_answer, "new_password": new_password})
     except httpx.RequestError:
         return await render_with_user("forgot_password.html", request, {
             "error": "Unable to reach server. Please try again later."
@@ -262,18 +233,17 @@ async def profile_update(request: Request,
                          security_answer: str = Form(...)
                          ):
 
-    async with httpx.AsyncClient() as client:
-        response = await client.put(
-            f"{API_BASE_URL}/users/me",
-            json={
-                "first_name": first_name,
-                "last_name": last_name,
-                "email": email,
-                "security_answer": security_answer
-            },
-            headers={
-                "Authorization": f"Bearer {request.cookies.get('access_token')}"}
-        )
+    response = await http_client.put(
+        "/users/me",
+        json={
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": email,
+            "security_answer": security_answer
+        },
+        headers={
+            "Authorization": f"Bearer {request.cookies.get('access_token')}"}
+    )
 
     if response.status_code in (status.HTTP_200_OK, status.HTTP_201_CREATED):
         # Handle success (200 OK from backend)
@@ -311,18 +281,17 @@ async def profile_update(request: Request,
 
 @router.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(request: Request, token: str = Depends(get_current_user)):
-    async with httpx.AsyncClient() as client:
-        user_response = await client.get(f"{API_BASE_URL}/auth/users/me",
-                                         headers={"Authorization": f"Bearer {token}"})
-        if user_response.status_code != status.HTTP_200_OK:
-            return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
-
-        user = user_response.json()
-        categories_response = await client.get(
-            f"{API_BASE_URL}/categories/with-stats",
-            headers={"Authorization": f"Bearer {token}"})
-        categories_with_stats = categories_response.json(
-        ) if categories_response.status_code == status.HTTP_200_OK else []
+    user_response = await http_client.get("/auth/users/me",
+                                          headers={"Authorization": f"Bearer {token}"})
+    if user_response.status_code != status.HTTP_200_OK:
+        return RedirectResponse(url="/login", status_code=status.HTTP_303_SEE_OTHER)
+
+    user = user_response.json()
+    categories_response = await http_client.get(
+        "/categories/with-stats",
+        headers={"Authorization": f"Bearer {token}"})
+    categories_with_stats = categories_response.json(
+    ) if categories_response.status_code == status.HTTP_200_OK else []
 
     return await render_with_user("dashboard.html", request, {
         "categories_with_stats": categories_with_stats,
@@ -341,11 +310,10 @@ async def add_category(request: Request,
                        limit_amount: float = Form(...),
                        token: str = Depends(get_current_user)):
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(f"{API_BASE_URL}/categories/",
-                                     json={"name": name,
-                                           "limit_amount": limit_amount},
-                                     headers={"Authorization": f"Bearer {token}"})
+    response = await http_client.post("/categories/",
+                                      json={"name": name,
+                                            "limit_amount": limit_amount},
+                                      headers={"Authorization": f"Bearer {token}"})
 
     logger.info("Response Code", response.status_code)
 
@@ -370,11 +338,10 @@ async def edit_category(request: Request,
                         limit_amount: float = Form(...),
                         token: str = Depends(get_current_user)):
 
-    async with httpx.AsyncClient() as client:
-        response = await client.put(f"{API_BASE_URL}/categories/{category_id}",
-                                    json={"name": name,
-                                          "limit_amount": limit_amount},
-                                    headers={"Authorization": f"Bearer {token}"})
+    response = await http_client.put(f"/categories/{category_id}",
+                                     json={"name": name,
+                                           "limit_amount": limit_amount},
+                                     headers={"Authorization": f"Bearer {token}"})
 
     if response.status_code == status.HTTP_200_OK:
         return redirect_with_toast("/dashboard", f"{name} updated successfully!", "info")
@@ -392,9 +359,8 @@ async def delete_category(request: Request,
                           category_id: int,
                           token: str = Depends(get_current_user)):
 
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(f"{API_BASE_URL}/categories/{category_id}",
-                                       headers={"Authorization": f"Bearer {token}"})
+    response = await http_client.delete(f"/categories/{category_id}",
+                                        headers={"Authorization": f"Bearer {token}"})
 
     if response.status_code == 204:
         return redirect_with_toast("/dashboard", "Category Deleted successfully!", "warning")
@@ -422,9 +388,8 @@ async def add_expense(request: Request,
     if month:
         payload["month"] = month
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(f"{API_BASE_URL}/expenses/", json=payload,
-                                     headers={"Authorization": f"Bearer {token}"})
+    response = await http_client.post("/expenses/", json=payload,
+                                      headers={"Authorization": f"Bearer {token}"})
 
     if response.status_code == status.HTTP_201_CREATED:
         return redirect_with_toast("/dashboard", "Expense created successfully!", "success")
@@ -451,9 +416,8 @@ async def edit_expense(request: Request,
     if month:
         payload["month"] = month
 
-    async with httpx.AsyncClient() as client:
-        response = await client.put(f"{API_BASE_URL}/expenses/{expense_id}",
-                                    json=payload, headers={"Authorization": f"Bearer {token}"})
+    response = await http_client.put(f"/expenses/{expense_id}",
+                                     json=payload, headers={"Authorization": f"Bearer {token}"})
 
     if response.status_code == status.HTTP_200_OK:
         return redirect_with_toast("/dashboard", "Expense updated successfully!", "info")
@@ -471,9 +435,8 @@ async def delete_expense(request: Request,
                          expense_id: int,
                          token: str = Depends(get_current_user)):
 
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(f"{API_BASE_URL}/expenses/{expense_id}",
-                                       headers={"Authorization": f"Bearer {token}"})
+    response = await http_client.delete(f"/expenses/{expense_id}",
+                                        headers={"Authorization": f"Bearer {token}"})
 
     if response.status_code == 204:
         return redirect_with_toast("/dashboard", "Expense deleted successfully!", "warning")
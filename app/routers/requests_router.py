@@ -9,6 +9,7 @@ from app.handlers import (
     category_handlers,
     expense_handlers,
     page_handlers,
+    report_handlers,
     transfer_handlers
 )
 
@@ -64,9 +65,12 @@ router.post(
     "/dashboard/allocations/{budget_id}/edit")(allocation_handlers.edit_allocation)
 router.post(
     "/dashboard/allocations/{budget_id}/delete/{allocation_id}")(allocation_handlers.delete_allocation)
-# ---------- STATIC PAGES ----------
+# ---------- REPORTS ----------
 router.get(
-    "/reports", response_class=page_handlers.HTMLResponse)(page_handlers.reports_page)
+    "/reports", response_class=report_handlers.HTMLResponse)(report_handlers.reports_page)
+router.post("/reports")(report_handlers.request_report)
+router.get("/reports/{job_id}/download")(report_handlers.report_download)
+# ---------- STATIC PAGES ----------
 router.get("/analytics",
            response_class=page_handlers.HTMLResponse)(page_handlers.analytics_page)
 router.get("/settings",
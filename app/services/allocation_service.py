@@ -1,8 +1,11 @@
 from app.services.http_client import delete, get, post, put
 
 
-async def fetch_budget_overview(token: str, budget_id: int):
-    resp = await get(path=f"/budgets/{budget_id}/allocations/overview", headers={
+async def fetch_budget_overview(token: str, budget_id: int, forecast: bool = False):
+    path = f"/budgets/{budget_id}/allocations/overview"
+    if forecast:
+        path += "?forecast=true"
+    resp = await get(path=path, headers={
         "Authorization": f"Bearer {token}"
     })
     return resp
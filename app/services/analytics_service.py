@@ -0,0 +1,8 @@
+# app/services/analytics_service.py
+from app.services.http_client import get
+
+
+async def fetch_budget_analytics(token: str, budget_id: int, months: int = 12):
+    resp = await get(path=f"/analytics/{budget_id}?months={months}",
+                     headers={"Authorization": f"Bearer {token}"})
+    return resp
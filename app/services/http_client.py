@@ -8,46 +8,135 @@ import logging
 logger = logging.getLogger(__name__)
 API_BASE_URL = settings.API_BASE_URL
 
+# Per-route timeouts (seconds), matched on the API path prefix.
+# Anything not listed uses settings.HTTP_DEFAULT_TIMEOUT.
+ROUTE_TIMEOUTS = {
+    "/auth/token": 5.0,
+    "/auth/users/me": 5.0,
+    "/categories/with-stats": 15.0,
+    "/budgets/": 10.0,
+}
 
-async def post(path: str, json=None, data=None, headers: Optional[dict] = None, timeout: float = 10.0):
-    url = f"{API_BASE_URL.rstrip('/')}/{path.lstrip('/')}"
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            resp = await client.post(url, json=json, data=data, headers=headers)
-            return resp
-        except httpx.RequestError as e:
-            logger.error("HTTP POST request failed: %s %s", url, str(e))
-            raise
+# ASGI app that API calls are dispatched into when API_TRANSPORT is "asgi".
+_asgi_app = None
 
+# Shared client, opened in the app lifespan and reused by every call.
+_client: Optional[httpx.AsyncClient] = None
 
-async def get(path: str, headers: Optional[dict] = None, timeout: float = 10.0):
-    url = f"{API_BASE_URL.rstrip('/')}/{path.lstrip('/')}"
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            resp = await client.get(url, headers=headers)
-            return resp
-        except httpx.RequestError as e:
-            logger.error("HTTP GET request failed: %s %s", url, str(e))
-            raise
+_stats = {"requests": 0, "in_flight": 0, "errors": 0}
 
 
-async def put(path: str, json=None, headers: Optional[dict] = None, timeout: float = 10.0):
-    url = f"{API_BASE_URL.rstrip('/')}/{path.lstrip('/')}"
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            resp = await client.put(url, json=json, headers=headers)
-            return resp
-        except httpx.RequestError as e:
-            logger.error("HTTP PUT request failed: %s %s", url, str(e))
-            raise
+def use_asgi_app(app):
+    """Register the API app so calls can skip the network when API_TRANSPORT=asgi"""
+    global _asgi_app
+    _asgi_app = app
+
+
+def _http2_enabled() -> bool:
+    if not settings.HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("HTTP2_ENABLED is set but 'h2' is not installed "
+                       "(pip install 'httpx[http2]'); falling back to HTTP/1.1")
+        return False
+    return True
+
+
+def _build_client() -> httpx.AsyncClient:
+    timeout = httpx.Timeout(settings.HTTP_DEFAULT_TIMEOUT)
+    if settings.API_TRANSPORT == "asgi" and _asgi_app is not None:
+        # Same request/response objects as over HTTP, but the call is served
+        # in-process: no socket, no TCP handshake, no uvicorn round trip.
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=_asgi_app), timeout=timeout)
+
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=settings.HTTP_POOL_KEEPALIVE_EXPIRY,
+    )
+    return httpx.AsyncClient(limits=limits, timeout=timeout, http2=_http2_enabled())
+
+
+async def start_client():
+    """Open the shared client. Called from the app lifespan on startup."""
+    global _client
+    if _client is None:
+        _client = _build_client()
+        logger.info("Shared HTTP client started (transport=%s)",
+                    settings.API_TRANSPORT)
+
+
+async def close_client():
+    """Close the shared client and its pooled connections on shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it if the lifespan has not run (scripts, tests)."""
+    global _client
+    if _client is None:
+        _client = _build_client()
+    return _client
 
 
-async def delete(path: str, headers: Optional[dict] = None, timeout: float = 10.0):
+def timeout_for(path: str) -> float:
+    path = "/" + path.lstrip("/")
+    for prefix, timeout in ROUTE_TIMEOUTS.items():
+        if path.startswith(prefix):
+            return timeout
+    return settings.HTTP_DEFAULT_TIMEOUT
+
+
+def pool_stats() -> dict:
+    """Request counters plus open/idle connection counts of the shared pool"""
+    stats = dict(_stats)
+    stats["transport"] = settings.API_TRANSPORT
+    stats["started"] = _client is not None
+
+    # httpx keeps the httpcore pool on the transport; it is absent for ASGI.
+    pool = getattr(getattr(_client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    stats["connections"] = len(connections)
+    stats["idle_connections"] = sum(1 for c in connections if c.is_idle())
+    stats["http2_connections"] = sum(
+        1 for c in connections if "HTTP/2" in c.info())
+    return stats
+
+
+async def _request(method: str, path: str, timeout: Optional[float], **kwargs):
     url = f"{API_BASE_URL.rstrip('/')}/{path.lstrip('/')}"
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            resp = await client.delete(url, headers=headers)
-            return resp
-        except httpx.RequestError as e:
-            logger.error("HTTP DELETE request failed: %s %s", url, str(e))
-            raise
+    client = get_client()
+    _stats["requests"] += 1
+    _stats["in_flight"] += 1
+    try:
+        resp = await client.request(
+            method, url, timeout=timeout or timeout_for(path), **kwargs)
+        return resp
+    except httpx.RequestError as e:
+        _stats["errors"] += 1
+        logger.error("HTTP %s request failed: %s %s", method, url, str(e))
+        raise
+    finally:
+        _stats["in_flight"] -= 1
+
+
+async def post(path: str, json=None, data=None, headers: Optional[dict] = None, timeout: Optional[float] = None):
+    return await _request("POST", path, timeout, json=json, data=data, headers=headers)
+
+
+async def get(path: str, headers: Optional[dict] = None, timeout: Optional[float] = None):
+    return await _request("GET", path, timeout, headers=headers)
+
+
+async def put(path: str, json=None, headers: Optional[dict] = None, timeout: Optional[float] = None):
+    return await _request("PUT", path, timeout, json=json, headers=headers)
+
+
+async def delete(path: str, headers: Optional[dict] = None, timeout: Optional[float] = None):
+    return await _request("DELETE", path, timeout, headers=headers)
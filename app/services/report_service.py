@@ -0,0 +1,23 @@
+# app/services/report_service.py
+from app.services.http_client import get, post
+
+
+async def create_report(token: str, budget_id: int, period: str, report_format: str):
+    resp = await post(path="/reports/", json={
+        "budget_id": budget_id,
+        "period": period,
+        "format": report_format
+    }, headers={"Authorization": f"Bearer {token}"})
+    return resp
+
+
+async def get_report(token: str, job_id: str):
+    resp = await get(path=f"/reports/{job_id}",
+                     headers={"Authorization": f"Bearer {token}"})
+    return resp
+
+
+async def download_report(token: str, job_id: str):
+    resp = await get(path=f"/reports/{job_id}/download",
+                     headers={"Authorization": f"Bearer {token}"})
+    return resp
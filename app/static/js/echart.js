@@ -0,0 +1,56 @@
+// echart.js — charts for the analytics page (data from /api/analytics)
+document.addEventListener("DOMContentLoaded", () => {
+  const source = document.getElementById("analyticsData");
+  if (!source || typeof echarts === "undefined") return;
+
+  const data = JSON.parse(source.textContent);
+  const last = data.months.length - 1;
+
+  const spendChart = echarts.init(document.getElementById("analyticsSpendChart"));
+  spendChart.setOption({
+    tooltip: { trigger: "axis" },
+    legend: { type: "scroll", bottom: 0 },
+    grid: { left: 48, right: 16, top: 24, bottom: 48 },
+    xAxis: { type: "category", data: data.months },
+    yAxis: { type: "value" },
+    series: [
+      ...data.categories.map((category) => ({
+        name: category.name,
+        type: "bar",
+        stack: "spent",
+        data: category.spent,
+      })),
+      {
+        name: "3-month average",
+        type: "line",
+        smooth: true,
+        data: data.total.rolling_average["3"],
+      },
+      {
+        name: "12-month average",
+        type: "line",
+        smooth: true,
+        data: data.total.rolling_average["12"],
+      },
+    ],
+  });
+
+  const shareChart = echarts.init(document.getElementById("analyticsShareChart"));
+  shareChart.setOption({
+    tooltip: { trigger: "item", formatter: "{b}: {d}%" },
+    series: [
+      {
+        type: "pie",
+        radius: ["40%", "70%"],
+        data: data.categories
+          .filter((category) => category.spent[last] > 0)
+          .map((category) => ({ name: category.name, value: category.spent[last] })),
+      },
+    ],
+  });
+
+  window.addEventListener("resize", () => {
+    spendChart.resize();
+    shareChart.resize();
+  });
+});
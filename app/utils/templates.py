@@ -1,14 +1,24 @@
 # app/utils/templates.py
+import os
+import time
+from pathlib import Path
 from fastapi.templating import Jinja2Templates
-from typing import Optional, Dict
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from typing import Optional, Dict, Tuple
 from fastapi import Request
-from app.config import ENVIRONMENT
+from markupsafe import Markup
+from app.config import ENVIRONMENT, IS_PRODUCTION, settings
+from app.utils.fragment_cache import FragmentCache
 import logging
 
 logger = logging.getLogger(__name__)
 
-templates = Jinja2Templates(directory="app/templates")
-templates.env.globals["ENVIRONMENT"] = ENVIRONMENT
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+TEMPLATE_PRODUCTION_MODE = (
+    IS_PRODUCTION if settings.TEMPLATE_PRODUCTION_MODE is None
+    else settings.TEMPLATE_PRODUCTION_MODE
+)
 
 
 def commafy(value, decimals=0):
@@ -22,13 +32,79 @@ def commafy(value, decimals=0):
         return value
 
 
-# register filter
-templates.env.filters["commafy"] = commafy
+def build_environment(production: bool = TEMPLATE_PRODUCTION_MODE) -> Environment:
+    """
+    The one Jinja environment every page renders through. Production mode
+    trusts the deployed files (no stat per render) and keeps compiled
+    bytecode on disk so restarted workers skip recompiling.
+    """
+    options = {"loader": FileSystemLoader(TEMPLATES_DIR), "autoescape": True}
+    if production:
+        cache_dir = settings.TEMPLATE_BYTECODE_CACHE_DIR or None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        options.update(
+            auto_reload=False,
+            bytecode_cache=FileSystemBytecodeCache(cache_dir),
+            cache_size=-1,  # never evict a compiled template
+        )
+    env = Environment(**options)
+    env.globals["ENVIRONMENT"] = ENVIRONMENT
+    env.filters["commafy"] = commafy
+    return env
+
+
+templates = Jinja2Templates(env=build_environment())
+
+
+def precompile_templates() -> int:
+    """Compile every template into the environment (and bytecode cache) up front."""
+    start = time.perf_counter()
+    names = templates.env.list_templates(extensions=["html"])
+    for name in names:
+        templates.env.get_template(name)
+    logger.info("Precompiled %s templates in %.1fms",
+                len(names), (time.perf_counter() - start) * 1000)
+    return len(names)
+
+
+fragment_cache = FragmentCache(
+    max_entries=settings.FRAGMENT_CACHE_MAX_ENTRIES,
+    max_bytes=settings.FRAGMENT_CACHE_MAX_BYTES,
+)
+
+
+def render_fragments(fragments: Dict[str, str], context: Dict, cache_key: Tuple) -> Dict[str, Markup]:
+    """
+    Render each fragment template (name -> template path) with `context`,
+    reusing cached HTML. cache_key is (user_id, budget_id, month,
+    data_version) and must cover everything the fragments read.
+    """
+    *scope, data_version = cache_key
+    rendered = {}
+    for name, template_path in fragments.items():
+        key = (*scope, name)
+        html = fragment_cache.get(key, data_version)
+        if html is None:
+            html = templates.get_template(template_path).render(context)
+            fragment_cache.set(key, data_version, html)
+        rendered[name] = Markup(html)
+    return rendered
+
 
+async def render_with_user(template_name: str, request: Request, context: Optional[Dict] = None,
+                           fragments: Optional[Dict[str, str]] = None,
+                           fragment_key: Optional[Tuple] = None):
+    """
+    Render templates with global user context. Handlers call get_user_from_cookie before this.
 
-async def render_with_user(template_name: str, request: Request, context: Optional[Dict] = None):
-    """Render templates with global user context. Handlers call get_user_from_cookie before this."""
+    With `fragments` and a `fragment_key`, those blocks come from the
+    fragment cache and the page template only renders what is left
+    (toasts, user greeting, forms). Without a key the page renders in full.
+    """
     if context is None:
         context = {}
     context.update({"request": request})
+    if fragments and fragment_key is not None:
+        context["fragments"] = render_fragments(fragments, context, fragment_key)
     return templates.TemplateResponse(template_name, context)
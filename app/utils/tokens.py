@@ -1,8 +1,8 @@
 # app/utils/tokens.py
-from jose import jwt, JWTError
 from fastapi import HTTPException, status
 from fastapi import Request
 from app.config import settings
+from services.token_service import TokenService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,13 +12,8 @@ ALGORITHM = settings.ALGORITHM
 
 
 def verify_token(token: str):
-    """Verify JWT Token. Returns payload or None."""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError as e:
-        logger.debug("Token verification failed: %s", e)
-        return None
+    """Verify JWT Token. Returns payload or None. Shares the verified-token cache."""
+    return TokenService.decode_token(token)
 
 
 def get_current_user(request: Request):
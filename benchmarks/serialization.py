@@ -0,0 +1,120 @@
+"""Time JSON serialization of a large /api/categories/with-stats payload.
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --categories 100 --expenses 300 --repeat 10
+
+Compares FastAPI's default path (response_model validation, then
+jsonable_encoder, then json.dumps) with FastJSONResponse rendering the
+service output directly, as the with-stats route now does.
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from core.responses import FastJSONResponse
+from schema.category import CategoryStats
+
+
+def build_payload(categories: int, expenses: int, transfers: int) -> list:
+    """Synthetic with-stats output shaped exactly like CategoryService builds it."""
+    now = datetime(2031, 1, 1, 12, 30, 15, 123456)
+    payload = []
+    for c in range(categories):
+        transfer_rows = [
+            {
+                "id": c * transfers + t,
+                "user_id": 1,
+                "created_at": now + timedelta(minutes=t),
+                "updated_at": now + timedelta(minutes=t),
+                "amount": 25.5,
+                "description": f"Move {t}",
+                "month": "2031-01",
+                "from_category_id": c,
+                "to_category_id": (c + 1) % categories,
+                "from_category_name": f"Category {c}",
+                "to_category_name": f"Category {(c + 1) % categories}",
+            }
+            for t in range(transfers)
+        ]
+        payload.append({
+            "id": c,
+            "name": f"Category {c}",
+            "allocated_amount": 5000.0,
+            "user_id": 1,
+            "type": "expense",
+            "created_at": now,
+            "updated_at": now,
+            "expense_count": expenses,
+            "balance": 1234.56,
+            "expenses": [
+                {
+                    "id": c * expenses + e,
+                    "amount": 12.75 + e,
+                    "month": "2031-01",
+                    "description": f"Expense {e}",
+                    "category_id": c,
+                    "user_id": 1,
+                    "type": "spend",
+                    "created_at": now + timedelta(seconds=e),
+                    "updated_at": now + timedelta(seconds=e),
+                }
+                for e in range(expenses)
+            ],
+            "used": 3765.44,
+            "transfers_in": transfer_rows,
+            "transfers_out": transfer_rows,
+            "total_transfers_in": 25.5 * transfers,
+            "total_transfers_out": 25.5 * transfers,
+        })
+    return payload
+
+
+def _timed(func, repeat: int) -> float:
+    """Best of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--expenses", type=int, default=200,
+                        help="expenses per category")
+    parser.add_argument("--transfers", type=int, default=20,
+                        help="transfers in and out per category")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = build_payload(args.categories, args.expenses, args.transfers)
+    field = create_model_field(
+        "Response_get_categories_with_stats", List[CategoryStats], mode="serialization")
+
+    def default_path():
+        content = asyncio.run(serialize_response(field=field, response_content=payload))
+        return JSONResponse(content).body
+
+    def fast_path():
+        return FastJSONResponse(payload).body
+
+    size = len(fast_path())
+    default_ms = _timed(default_path, args.repeat)
+    fast_ms = _timed(fast_path, args.repeat)
+
+    print(f"payload: {args.categories} categories x {args.expenses} expenses, "
+          f"{size / 1024:.0f} KiB")
+    print(f"response_model + json: {default_ms:8.1f} ms")
+    print(f"FastJSONResponse:      {fast_ms:8.1f} ms  ({default_ms / fast_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
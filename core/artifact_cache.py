@@ -0,0 +1,100 @@
+# core/artifact_cache.py
+import logging
+import os
+import tempfile
+import threading
+from typing import Optional
+
+logger = logging.getLogger("app.artifact_cache")
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class ArtifactCache:
+    """
+    Generated files on disk, capped by total size. Lookups refresh a file's
+    mtime, so eviction removes the least recently used files first.
+
+    Names are built by the caller from everything that determines the
+    content (e.g. the user's data version), so a stale file is never
+    looked up again and simply ages out.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def get(self, name: str) -> Optional[str]:
+        path = self.path(name)
+        with self._lock:
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return path
+
+    def put(self, name: str, content: bytes) -> str:
+        """Write atomically (readers never see a partial file), then evict."""
+        path = self.path(name)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            _remove_quietly(tmp)
+            raise
+        with self._lock:
+            self._evict(keep=path)
+        return path
+
+    def _files(self):
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith(".tmp-"):
+                stat = entry.stat()
+                yield stat.st_mtime, stat.st_size, entry.path
+
+    def _evict(self, keep: str) -> None:
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            _remove_quietly(path)
+            total -= size
+            self.evictions += 1
+            logger.debug("Evicted cached artifact %s (%s bytes)", path, size)
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, _, path in list(self._files()):
+                _remove_quietly(path)
+
+    def stats(self) -> dict:
+        with self._lock:
+            files = list(self._files())
+            return {
+                "files": len(files),
+                "bytes": sum(size for _, size, _ in files),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,67 @@
+# core/data_version.py
+import logging
+from typing import Iterable
+
+from sqlalchemy import event, or_, select, update
+from sqlalchemy.orm import Session
+
+from data.db.models.models import Allocation, Budget, Category, Expense, Transfer, User
+
+logger = logging.getLogger("app.data_version")
+
+# Models whose changes alter what the user's API reads return
+_OWNED_MODELS = (Budget, Category, Expense, Transfer)
+
+
+def get_data_version(db: Session, user_id: int) -> int:
+    return db.query(User.data_version).filter(User.id == user_id).scalar() or 0
+
+
+def _bump_statement(user_ids: Iterable[int] = (), budget_ids: Iterable[int] = ()):
+    """UPDATE adding one to data_version for the users and budget owners given."""
+    users = User.__table__
+    conditions = []
+    if user_ids:
+        conditions.append(users.c.id.in_(set(user_ids)))
+    if budget_ids:
+        conditions.append(users.c.id.in_(
+            select(Budget.user_id).where(Budget.id.in_(set(budget_ids)))))
+    return update(users).where(or_(*conditions)).values(
+        data_version=users.c.data_version + 1)
+
+
+def bump_data_version(db: Session, user_id=None) -> None:
+    """
+    Bump explicitly after Core-level writes the flush hook cannot see
+    (bulk inserts, raw SQL). user_id=None bumps every user.
+    """
+    if user_id is None:
+        users = User.__table__
+        db.execute(update(users).values(data_version=users.c.data_version + 1))
+    else:
+        db.execute(_bump_statement(user_ids=[user_id]))
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_touched_users(session: Session, flush_context) -> None:
+    """
+    After every ORM flush, bump data_version for the owners of the rows
+    written. It runs inside the flush's transaction, so the bump commits
+    or rolls back together with the change.
+    """
+    user_ids = set()
+    budget_ids = set()
+    # New users start at version 0; nothing can have cached their data yet
+    changed = [obj for obj in session.dirty if session.is_modified(obj)]
+    for obj in (*session.new, *changed, *session.deleted):
+        if isinstance(obj, _OWNED_MODELS):
+            user_ids.add(obj.user_id)
+        elif isinstance(obj, Allocation):
+            budget_ids.add(obj.budget_id)
+        elif isinstance(obj, User) and obj in changed:
+            user_ids.add(obj.id)
+
+    user_ids.discard(None)
+    budget_ids.discard(None)
+    if user_ids or budget_ids:
+        session.connection().execute(_bump_statement(user_ids, budget_ids))
@@ -0,0 +1,112 @@
+# core/etag.py
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from fastapi.security.utils import get_authorization_scheme_param
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.data_version import get_data_version
+from core.security import get_current_user
+from data.db.db import get_async_db, get_db
+from schema.user import UserOut
+from services.auth_service import AuthService
+
+
+def make_etag(user_id: int, data_version: int) -> str:
+    # Reads that default to "this month" change when the month does, and
+    # the overview forecast with every day
+    day = datetime.utcnow().strftime("%Y-%m-%d")
+    return f'W/"{user_id}-{data_version}-{day}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison against an If-None-Match header value."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(_opaque(candidate) == _opaque(etag) for candidate in if_none_match.split(","))
+
+
+def _tag_response(request: Request, response: Response, user_id: int, data_version: int):
+    """Set the version headers, or answer 304 when the client already has them."""
+    etag = make_etag(user_id, data_version)
+    headers = {
+        "ETag": etag,
+        "X-Data-Version": str(data_version),
+        # Private per-user data: always revalidate, never share
+        "Cache-Control": "private, no-cache",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+
+
+def _with_version(exc: HTTPException, data_version: int) -> HTTPException:
+    exc.headers = {**(exc.headers or {}), "X-Data-Version": str(data_version)}
+    return exc
+
+
+def data_version_etag(
+    request: Request,
+    response: Response,
+    current_user: UserOut = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Router dependency for sync GET endpoints: tags the response with the
+    user's data version and answers 304 Not Modified, before the endpoint
+    runs, when the client already holds that version. Error responses (e.g.
+    the 404s for empty lists) carry X-Data-Version too.
+    """
+    if request.method != "GET":
+        yield
+        return
+
+    data_version = get_data_version(db, current_user.id)
+    _tag_response(request, response, current_user.id, data_version)
+    try:
+        yield
+    except HTTPException as exc:
+        raise _with_version(exc, data_version)
+
+
+def _token_user_id(request: Request) -> Optional[int]:
+    """user_id claim of a valid bearer token, from the verified-token cache."""
+    scheme, token = get_authorization_scheme_param(request.headers.get("Authorization"))
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = AuthService.validate_token(token)
+    return payload.get("user_id") if payload else None
+
+
+async def async_data_version_etag(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    data_version_etag for routers served from an AsyncSession. It reads the
+    version through the request's own session, and only for GET. The user
+    comes from the verified token, so no sync Session is opened. Requests
+    without a valid token are left to the endpoint's own auth.
+    """
+    user_id = _token_user_id(request) if request.method == "GET" else None
+    if user_id is None:
+        yield
+        return
+
+    data_version = await db.run_sync(get_data_version, user_id)
+    _tag_response(request, response, user_id, data_version)
+    try:
+        yield
+    except HTTPException as exc:
+        raise _with_version(exc, data_version)
@@ -0,0 +1,138 @@
+# core/passwords.py
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+import bcrypt
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from app.config import IS_PRODUCTION, settings
+
+logger = logging.getLogger("app.passwords")
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def configure_rounds(rounds: int) -> None:
+    """
+    Hash new passwords with `rounds` and flag any stored hash below that
+    cost as needing an update (see verify_and_update). There is no upper
+    bound, so stronger hashes are never rewritten at a lower cost.
+    """
+    pwd_context.update(
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        # passlib caps at the default cost unless told otherwise; lift the
+        # cap to bcrypt's own ceiling so nothing counts as "too strong"
+        bcrypt__max_rounds=pwd_context.handler("bcrypt").max_rounds,
+    )
+    logger.info("bcrypt cost set to %s", rounds)
+
+
+def current_rounds() -> int:
+    return pwd_context.handler("bcrypt").default_rounds
+
+
+def calibrate_rounds(target_ms: float, min_rounds: int, max_rounds: int) -> int:
+    """
+    Highest bcrypt cost whose hash fits in target_ms on this machine.
+    Times a single hash at min_rounds and extrapolates (each round doubles the work).
+    """
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", bcrypt.gensalt(min_rounds))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    rounds = min_rounds
+    while rounds < max_rounds and elapsed_ms * 2 ** (rounds + 1 - min_rounds) <= target_ms:
+        rounds += 1
+    logger.info("bcrypt calibrated: %sms at cost %s -> cost %s (target %sms)",
+                round(elapsed_ms, 1), min_rounds, rounds, target_ms)
+    return rounds
+
+
+def startup_rounds() -> int:
+    """
+    bcrypt cost for this process: BCRYPT_ROUNDS when set, otherwise
+    calibrated to BCRYPT_TARGET_MS. Production never calibrates: without
+    BCRYPT_ROUNDS it uses the fixed BCRYPT_PRODUCTION_ROUNDS, so every
+    worker and restart agrees on one cost.
+    """
+    if settings.BCRYPT_ROUNDS:
+        return settings.BCRYPT_ROUNDS
+    if IS_PRODUCTION:
+        logger.warning("BCRYPT_ROUNDS is not set; using the production default cost %s",
+                       settings.BCRYPT_PRODUCTION_ROUNDS)
+        return settings.BCRYPT_PRODUCTION_ROUNDS
+    rounds = calibrate_rounds(
+        settings.BCRYPT_TARGET_MS, settings.BCRYPT_MIN_ROUNDS, settings.BCRYPT_MAX_ROUNDS)
+    logger.warning("BCRYPT_ROUNDS is not set; using calibrated cost %s "
+                   "(set BCRYPT_ROUNDS=%s to pin it)", rounds, rounds)
+    return rounds
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool (bcrypt releases the GIL),
+    so a login burst is capped at `workers` hashes at a time instead of
+    occupying every request thread. Callers beyond workers + max_queue are
+    turned away with a 503 rather than left queueing.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="bcrypt")
+        self._workers = workers
+        self._limit = workers + max_queue
+        self._pending = 0
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.rejected = 0
+
+    def _run(self, func: Callable, *args):
+        with self._lock:
+            if self._pending >= self._limit:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many sign-in requests right now. Please try again.",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+        try:
+            return self._executor.submit(func, *args).result()
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self.completed += 1
+
+    def hash(self, password: str) -> str:
+        return self._run(pwd_context.hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(pwd_context.verify, plain_password, hashed_password)
+
+    def verify_and_update(self, plain_password: str,
+                          hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """(valid, new_hash); new_hash is set when the stored cost is out of date."""
+        return self._run(pwd_context.verify_and_update, plain_password, hashed_password)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "workers": self._workers,
+                "pending": self._pending,
+                "limit": self._limit,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "rounds": current_rounds(),
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.BCRYPT_WORKERS, max_queue=settings.BCRYPT_MAX_QUEUE)
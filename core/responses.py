@@ -0,0 +1,54 @@
+# core/responses.py
+import logging
+from decimal import Decimal
+from typing import Any
+
+from fastapi import Response
+from fastapi.encoders import decimal_encoder, jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+logger = logging.getLogger("app.responses")
+
+if orjson is None:
+    logger.warning("orjson is not installed; API responses use the stdlib json encoder")
+
+
+def _default(obj: Any) -> Any:
+    """Types orjson doesn't know, encoded the way jsonable_encoder would."""
+    if isinstance(obj, Decimal):
+        return decimal_encoder(obj)
+    return jsonable_encoder(obj)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson. Datetimes, dataclasses and UUIDs are
+    encoded natively; Decimals become int/float exactly as jsonable_encoder
+    would, so raw dict payloads serialize the same as before.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def trusted_json(content: Any, response: Response, status_code: int = 200) -> FastJSONResponse:
+    """
+    Send service output that is already shaped like the route's response
+    model straight to orjson. FastAPI skips response_model validation and
+    jsonable_encoder for returned Response objects, so this is only for
+    services that build their payloads field by field.
+
+    `response` is the route's injected Response; headers that dependencies
+    set on it (ETag, X-Data-Version) are carried over.
+    """
+    fast = FastJSONResponse(content, status_code=status_code)
+    fast.raw_headers.extend(
+        (name, value) for name, value in response.raw_headers if name != b"content-length")
+    return fast
@@ -4,6 +4,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
+from core.user_cache import get_request_memo, user_cache
 from data.db.db import get_db
 from services.auth_service import AuthService
 from services.user_service import UserService
@@ -23,7 +24,22 @@ def get_current_user(
     """
     Resolve and return the current user from JWT token.
     Preserves the original behavior and error messages used by tests.
+    Resolved users are memoised for the current request and cached
+    across requests by (user_id, token exp).
     """
+    memo = get_request_memo()
+    if memo is None:
+        return resolve_user(token, db)
+
+    # Concurrent in-process API calls of one page wait for a single lookup
+    with memo.lock:
+        if token not in memo.users:
+            memo.users[token] = resolve_user(token, db)
+        return memo.users[token]
+
+
+def resolve_user(token: str, db: Session):
+    """Validate the token and load its user, going through the user cache."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -42,13 +58,20 @@ def get_current_user(
         logger.error("JWT payload invalid: %s", payload)
         raise credentials_exception
 
-    user = UserService.get_user_by_email(db, email)
-    if not user or user.id != user_id:
-        logger.error(
-            "User from token not found or ID mismatch: token_user_id=%s db_user_id=%s",
-            user_id, getattr(user, "id", None)
-        )
-        raise credentials_exception
+    exp = payload.get("exp")
+    user = user_cache.get(user_id, exp)
+    if user is None or user.email != email:
+        user = UserService.get_user_by_email(db, email)
+        if not user or user.id != user_id:
+            logger.error(
+                "User from token not found or ID mismatch: token_user_id=%s db_user_id=%s",
+                user_id, getattr(user, "id", None)
+            )
+            raise credentials_exception
+
+        # Detach so later commits in this session don't expire the cached copy
+        db.expunge(user)
+        user_cache.set(user_id, exp, user)
 
     logger.info("Current user resolved: id=%s email=%s", user.id, user.email)
     return user
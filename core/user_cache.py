@@ -0,0 +1,77 @@
+# core/user_cache.py
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from app.config import settings
+from core.cache import ExpiringLRUCache
+
+logger = logging.getLogger("app.user_cache")
+
+
+class UserCache(ExpiringLRUCache):
+    """
+    TTL + LRU cache of resolved users keyed by (user_id, token exp).
+    Entries never outlive the token they were resolved for.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        super().__init__(max_size)
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, user_id: int, exp) -> Optional[Any]:
+        return super().get((user_id, exp))
+
+    def set(self, user_id: int, exp, user) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        super().set((user_id, exp), user, expires_at)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached entry for a user (all of their tokens)."""
+        self.discard_where(lambda key: key[0] == user_id)
+        logger.debug("User cache invalidated for user_id=%s", user_id)
+
+
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+class RequestUserMemo:
+    """token -> user for the request being served"""
+
+    def __init__(self):
+        self.users: dict = {}
+        self.lock = threading.Lock()
+
+
+# In-process API calls made while rendering a page share the page request's
+# memo, so the user is resolved once per render.
+_request_users: ContextVar[Optional[RequestUserMemo]] = ContextVar(
+    "request_users", default=None)
+
+
+def get_request_memo() -> Optional[RequestUserMemo]:
+    return _request_users.get()
+
+
+class RequestUserMemoMiddleware:
+    """Open a per-request user memo unless an outer request already has one."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or _request_users.get() is not None:
+            await self.app(scope, receive, send)
+            return
+        reset_token = _request_users.set(RequestUserMemo())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_users.reset(reset_token)
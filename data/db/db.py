@@ -1,9 +1,18 @@
 """Describes the database operations with sqlalchemy"""
 
+import asyncio
+import logging
 import os
-from sqlalchemy import create_engine, event
+import sqlite3
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects.sqlite.aiosqlite import AsyncAdapt_aiosqlite_connection
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+
+from app.config import settings
+
+logger = logging.getLogger("app.db")
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -13,13 +22,53 @@ os.makedirs(DATA_DIR, exist_ok=True)
 
 DB_PATH = os.path.join(DATA_DIR, "bajeti.db")
 
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
+SQLALCHEMY_DATABASE_URL = settings.SQLALCHEMY_DATABASE_URL or f"sqlite:///{DB_PATH}"
+
+
+def engine_options(url: str):
+    """create_engine keyword arguments for the backend named in `url`."""
+    if make_url(url).get_backend_name() == "sqlite":
+        return {"connect_args": {"check_same_thread": False}}
+
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS and make_url(url).get_backend_name() == "postgresql":
+        timeout = str(int(settings.DB_STATEMENT_TIMEOUT_MS))
+        if make_url(url).get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+
+# Async drivers used for the same database by the AsyncSession path
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+
+def async_database_url(url: str) -> str:
+    """`url` rewritten to use the backend's asyncio driver."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}'")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False)
+
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+ASYNC_DATABASE_URL = async_database_url(SQLALCHEMY_DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL))
+# Objects stay loaded after commit: response models read them outside the session
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -32,8 +81,71 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Returns an AsyncSession for Dependency injection.
+
+    The service layer is written against Session; call it through
+    ``await db.run_sync(Service.method, ...)`` so its SQL is awaited on the
+    async driver instead of blocking the event loop.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def sqlite_pragmas():
+    """PRAGMA statements applied to every new SQLite connection."""
+    pragmas = ["PRAGMA foreign_keys=ON"]
+    if settings.SQLITE_TUNED:
+        pragmas += [
+            # Readers no longer block on writers (and vice versa)
+            f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}",
+            # Safe with WAL: only the last commits can be lost on power failure
+            f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+            f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}",
+            f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}",
+            f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}",
+            # Wait for a competing writer instead of failing with "database is locked"
+            f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}",
+        ]
+    return pragmas
+
+
 @event.listens_for(Engine, "connect")
 def enable_sqlite_fk(dbapi_connection, connection_record):
+    if not isinstance(dbapi_connection, (sqlite3.Connection, AsyncAdapt_aiosqlite_connection)):
+        return
     cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
+    for pragma in sqlite_pragmas():
+        cursor.execute(pragma)
     cursor.close()
+
+
+def session_bind(get_session=get_db) -> Engine:
+    """Engine behind a get_db-style dependency, so overrides are honoured."""
+    sessions = get_session()
+    db = next(sessions)
+    try:
+        return db.get_bind()
+    finally:
+        sessions.close()
+
+
+def run_sqlite_maintenance(bind: Engine):
+    """Refresh planner statistics and fold the WAL back into the database file."""
+    if bind.dialect.name != "sqlite":
+        return
+    with bind.connect() as connection:
+        connection.execute(text("PRAGMA optimize"))
+        if settings.SQLITE_JOURNAL_MODE.upper() == "WAL":
+            connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+        connection.commit()
+
+
+async def sqlite_maintenance_loop(bind: Engine, interval: int):
+    """Run run_sqlite_maintenance on `bind` every `interval` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(run_sqlite_maintenance, bind)
+        except Exception:
+            logger.exception("SQLite maintenance failed")
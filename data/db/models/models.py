@@ -1,7 +1,8 @@
 from datetime import datetime
-from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Integer, Numeric, String, UniqueConstraint
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 from data.db.db import Base
+from data.db.types import Money
 
 
 class User(Base):
@@ -16,6 +17,9 @@ class User(Base):
     updated_at = Column(DateTime, default=datetime.utcnow,
                         onupdate=datetime.utcnow)
     security_answer = Column(String(255), nullable=True)
+    # Bumped in the same transaction as any change to the user's data;
+    # API reads derive their ETags from it (see core/data_version.py)
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     categories = relationship("Category", back_populates="owner")
     expenses = relationship("Expense", back_populates="owner")
@@ -28,7 +32,7 @@ class Budget(Base):
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
-    amount = Column(Numeric, nullable=False)
+    amount = Column(Money, nullable=False)
 
     type = Column(String(20), nullable=False,
                   default="expense", server_default="expense")
@@ -59,7 +63,7 @@ class Category(Base):
     name = Column(String, nullable=False)
     type = Column(String(20), nullable=False,
                   default="expense", server_default="expense")
-    limit_amount = Column(Numeric, nullable=True)
+    limit_amount = Column(Money, nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow,
@@ -97,7 +101,7 @@ class Expense(Base):
     __tablename__ = "expenses"
 
     id = Column(Integer, primary_key=True, index=True)
-    amount = Column(Numeric, nullable=False)
+    amount = Column(Money, nullable=False)
     description = Column(String, nullable=True)
     type = Column(String(20), nullable=False,
                   default="spend", server_default="spend")
@@ -115,6 +119,22 @@ class Expense(Base):
             "type IN ('spend','withdrawal')",
             name="ck_expenses_type"
         ),
+        # Covers the per-month grouped sums (stats, overview) without
+        # touching the table rows
+        Index(
+            "ix_expenses_user_month_type_category_amount",
+            "user_id", "month", "type", "category_id", "amount"
+        ),
+        # Per-category listings across months
+        Index(
+            "ix_expenses_user_category_month",
+            "user_id", "category_id", "month"
+        ),
+        # Keyset pagination, newest first
+        Index(
+            "ix_expenses_user_created_id",
+            "user_id", "created_at", "id"
+        ),
     )
 
 
@@ -128,7 +148,7 @@ class Transfer(Base):
     to_category_id = Column(Integer, ForeignKey(
         "categories.id"), nullable=True)
 
-    amount = Column(Numeric, nullable=False)
+    amount = Column(Money, nullable=False)
     description = Column(String, nullable=True)
     month = Column(String, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -144,6 +164,27 @@ class Transfer(Base):
     to_category = relationship("Category", foreign_keys=[
                                to_category_id], back_populates="incoming_transfers")
 
+    __table_args__ = (
+        # Month listings and the combined in/out fetch for category stats
+        Index(
+            "ix_transfers_user_month",
+            "user_id", "month"
+        ),
+        Index(
+            "ix_transfers_user_to_category_month_amount",
+            "user_id", "to_category_id", "month", "amount"
+        ),
+        Index(
+            "ix_transfers_user_from_category_month_amount",
+            "user_id", "from_category_id", "month", "amount"
+        ),
+        # Keyset pagination, newest first
+        Index(
+            "ix_transfers_user_created_id",
+            "user_id", "created_at", "id"
+        ),
+    )
+
 
 class Allocation(Base):
     __tablename__ = "allocations"
@@ -156,7 +197,7 @@ class Allocation(Base):
     category_id = Column(Integer, ForeignKey(
         "categories.id", ondelete="CASCADE"), nullable=False)
 
-    allocated_amount = Column(Numeric, nullable=False)
+    allocated_amount = Column(Money, nullable=False)
 
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow,
@@ -172,3 +213,23 @@ class Allocation(Base):
             name="uq_budget_category_allocation"
         ),
     )
+
+
+class CategoryMonthTotal(Base):
+    """
+    Per (user, category, month) running totals of expenses and transfers,
+    kept in step by ExpenseService/TransferService (see services/rollup_service.py).
+    """
+    __tablename__ = "category_month_totals"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    category_id = Column(Integer, ForeignKey(
+        "categories.id", ondelete="CASCADE"), primary_key=True)
+    month = Column(String, primary_key=True)
+
+    spent = Column(Money, nullable=False, default=0, server_default="0")
+    withdrawn = Column(Money, nullable=False, default=0, server_default="0")
+    transfers_in = Column(Money, nullable=False, default=0, server_default="0")
+    transfers_out = Column(Money, nullable=False, default=0, server_default="0")
+    spend_count = Column(Integer, nullable=False, default=0, server_default="0")
+    withdrawal_count = Column(Integer, nullable=False, default=0, server_default="0")
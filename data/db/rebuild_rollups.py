@@ -0,0 +1,29 @@
+"""Rebuild category_month_totals from expenses and transfers.
+
+    python -m data.db.rebuild_rollups              # every user
+    python -m data.db.rebuild_rollups --user-id 7  # one user
+"""
+import argparse
+import logging
+
+from data.db.db import SessionLocal
+from services.rollup_service import RollupService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user-id", type=int, default=None,
+                        help="only rebuild this user's rows")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        rows = RollupService.rebuild(db, user_id=args.user_id)
+    finally:
+        db.close()
+    print(f"category_month_totals rebuilt: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,44 @@
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional
+
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
 CATEGORY_TYPES = ("expense", "savings")
 EXPENSE_TYPES = ("spend", "withdrawal")
+
+CENT = Decimal("0.01")
+ZERO = Decimal("0.00")
+
+
+def round_money(value) -> Decimal:
+    """Amount (Decimal, float, int or str) rounded half-up to whole cents."""
+    if isinstance(value, float):
+        value = str(value)
+    return Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def to_minor_units(value) -> int:
+    """Amount in major units as a whole number of cents."""
+    return int(round_money(value).scaleb(2))
+
+
+def from_minor_units(value: int) -> Decimal:
+    """Whole cents as a Decimal with exactly two places."""
+    return Decimal(int(value)).scaleb(-2)
+
+
+class Money(TypeDecorator):
+    """
+    Money stored as an integer number of cents. Python sees Decimals with
+    two places; SQL sees integers, so SUM and +/- in queries are exact.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        return None if value is None else to_minor_units(value)
+
+    def process_result_value(self, value, dialect) -> Optional[Decimal]:
+        return None if value is None else from_minor_units(value)
@@ -1,3 +1,6 @@
+import asyncio
+import contextlib
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.gzip import GZipMiddleware
@@ -5,10 +8,17 @@ from pathlib import Path
 from contextlib import asynccontextmanager
 
 from app.routers import requests_router
-from data.db.db import engine, Base
-from routers import allocations, auth, budgets, categories, expenses, transfers, users
+from data.db.db import (
+    async_engine, engine, Base, get_db, run_sqlite_maintenance, session_bind, sqlite_maintenance_loop)
+from routers import allocations, analytics, auth, batch, budgets, categories, expenses, export, health, reports, transfers, users
 from app import requests
-from app.config import IS_PRODUCTION
+from app.config import IS_PRODUCTION, settings
+from app.services import http_client
+from app.utils.templates import TEMPLATE_PRODUCTION_MODE, precompile_templates
+from core.responses import FastJSONResponse
+from core.passwords import configure_rounds, password_hasher, startup_rounds
+from services.report_service import report_jobs
+from core.user_cache import RequestUserMemoMiddleware
 
 # Lifespan for DB setup
 
@@ -17,14 +27,34 @@ from app.config import IS_PRODUCTION
 async def lifespan(app: FastAPI):
     # Startup
     # Base.metadata.create_all(bind=engine)
+    await http_client.start_client()
+    configure_rounds(await asyncio.to_thread(startup_rounds))
+    if TEMPLATE_PRODUCTION_MODE:
+        await asyncio.to_thread(precompile_templates)
+    # Maintain whatever database get_db actually serves (tests override it)
+    bind = session_bind(app.dependency_overrides.get(get_db, get_db))
+    maintenance = None
+    if bind.dialect.name == "sqlite" and settings.SQLITE_MAINTENANCE_INTERVAL_SECONDS > 0:
+        maintenance = asyncio.create_task(
+            sqlite_maintenance_loop(bind, settings.SQLITE_MAINTENANCE_INTERVAL_SECONDS))
     yield
-    # Shutdown (optional future cleanup)
+    # Shutdown
+    if maintenance is not None:
+        maintenance.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await maintenance
+        await asyncio.to_thread(run_sqlite_maintenance, bind)
+    await http_client.close_client()
+    await async_engine.dispose()
+    password_hasher.shutdown()
+    report_jobs.shutdown()
 
 
 app = FastAPI(
     title="Bajeti",
     debug=not IS_PRODUCTION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 
@@ -39,6 +69,9 @@ app.mount("/static", StaticFiles(directory=static_dir), name="static")
 # --- End static block ---
 
 
+# Resolve the current user once per page render, across in-process API calls
+app.add_middleware(RequestUserMemoMiddleware)
+
 # Gzip for production
 if IS_PRODUCTION:
     app.add_middleware(GZipMiddleware, minimum_size=500)
@@ -52,4 +85,12 @@ app.include_router(users.router)
 app.include_router(transfers.router)
 app.include_router(budgets.router)
 app.include_router(allocations.router)
+app.include_router(analytics.router)
+app.include_router(batch.router)
+app.include_router(export.router)
+app.include_router(reports.router)
+app.include_router(health.router)
 app.include_router(requests_router.router)
+
+# Frontend handlers call the API routers above without leaving the process
+http_client.use_asgi_app(app)
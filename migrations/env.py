@@ -4,6 +4,7 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from alembic import context
+from app.config import settings
 from data.db.db import Base
 from data.db.models import models
 
@@ -12,6 +13,11 @@ from data.db.models import models
 # access to the values within the .ini file in use.
 config = context.config  # noqa
 
+# A configured application database wins over alembic.ini
+if settings.SQLALCHEMY_DATABASE_URL:
+    config.set_main_option(
+        "sqlalchemy.url", settings.SQLALCHEMY_DATABASE_URL.replace("%", "%%"))
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
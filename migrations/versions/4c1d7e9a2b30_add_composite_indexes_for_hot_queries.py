@@ -0,0 +1,57 @@
+"""add composite indexes for hot expense and transfer queries
+
+Revision ID: 4c1d7e9a2b30
+Revises: 877adbb8bce2
+Create Date: 2026-10-18 09:12:44.502318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1d7e9a2b30'
+down_revision: Union[str, Sequence[str], None] = '877adbb8bce2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_expenses_user_month_type_category_amount",
+        "expenses",
+        ["user_id", "month", "type", "category_id", "amount"]
+    )
+    op.create_index(
+        "ix_expenses_user_category_month",
+        "expenses",
+        ["user_id", "category_id", "month"]
+    )
+    op.create_index(
+        "ix_transfers_user_month",
+        "transfers",
+        ["user_id", "month"]
+    )
+    op.create_index(
+        "ix_transfers_user_to_category_month_amount",
+        "transfers",
+        ["user_id", "to_category_id", "month", "amount"]
+    )
+    op.create_index(
+        "ix_transfers_user_from_category_month_amount",
+        "transfers",
+        ["user_id", "from_category_id", "month", "amount"]
+    )
+
+
+def downgrade():
+    op.drop_index("ix_transfers_user_from_category_month_amount",
+                  table_name="transfers")
+    op.drop_index("ix_transfers_user_to_category_month_amount",
+                  table_name="transfers")
+    op.drop_index("ix_transfers_user_month", table_name="transfers")
+    op.drop_index("ix_expenses_user_category_month", table_name="expenses")
+    op.drop_index("ix_expenses_user_month_type_category_amount",
+                  table_name="expenses")
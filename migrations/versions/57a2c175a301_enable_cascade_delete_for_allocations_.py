@@ -18,8 +18,13 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _recreate():
+    # SQLite can only change constraints by copying the table; elsewhere ALTER in place
+    return "always" if op.get_bind().dialect.name == "sqlite" else "auto"
+
+
 def upgrade():
-    with op.batch_alter_table("allocations", recreate="always") as batch_op:
+    with op.batch_alter_table("allocations", recreate=_recreate()) as batch_op:
 
         batch_op.create_foreign_key(
             "fk_allocations_category",
@@ -44,7 +49,7 @@ def upgrade():
 
 
 def downgrade():
-    with op.batch_alter_table("allocations", recreate="always") as batch_op:
+    with op.batch_alter_table("allocations", recreate=_recreate()) as batch_op:
 
         batch_op.create_foreign_key(
             "fk_allocations_category",
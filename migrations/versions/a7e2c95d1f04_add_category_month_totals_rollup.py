@@ -0,0 +1,71 @@
+"""add category_month_totals rollup
+
+Revision ID: a7e2c95d1f04
+Revises: 4c1d7e9a2b30
+Create Date: 2026-10-18 14:05:31.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e2c95d1f04'
+down_revision: Union[str, Sequence[str], None] = '4c1d7e9a2b30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "category_month_totals",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("month", sa.String(), nullable=False),
+        sa.Column("spent", sa.Numeric(), nullable=False, server_default="0"),
+        sa.Column("withdrawn", sa.Numeric(), nullable=False, server_default="0"),
+        sa.Column("transfers_in", sa.Numeric(), nullable=False, server_default="0"),
+        sa.Column("transfers_out", sa.Numeric(), nullable=False, server_default="0"),
+        sa.Column("spend_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("withdrawal_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("user_id", "category_id", "month"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(
+            ["category_id"], ["categories.id"], ondelete="CASCADE"),
+    )
+
+    # Backfill from the existing rows (same query as RollupService.rebuild)
+    op.execute("""
+        INSERT INTO category_month_totals (
+            user_id, category_id, month, spent, withdrawn,
+            transfers_in, transfers_out, spend_count, withdrawal_count
+        )
+        SELECT user_id, category_id, month,
+               SUM(spent), SUM(withdrawn), SUM(transfers_in), SUM(transfers_out),
+               SUM(spend_count), SUM(withdrawal_count)
+        FROM (
+            SELECT user_id, category_id, month,
+                   CASE WHEN type = 'withdrawal' THEN 0 ELSE amount END AS spent,
+                   CASE WHEN type = 'withdrawal' THEN amount ELSE 0 END AS withdrawn,
+                   0 AS transfers_in, 0 AS transfers_out,
+                   CASE WHEN type = 'withdrawal' THEN 0 ELSE 1 END AS spend_count,
+                   CASE WHEN type = 'withdrawal' THEN 1 ELSE 0 END AS withdrawal_count
+            FROM expenses
+            WHERE user_id IS NOT NULL AND category_id IS NOT NULL AND month IS NOT NULL
+            UNION ALL
+            SELECT user_id, to_category_id, month, 0, 0, amount, 0, 0, 0
+            FROM transfers
+            WHERE user_id IS NOT NULL AND to_category_id IS NOT NULL AND month IS NOT NULL
+            UNION ALL
+            SELECT user_id, from_category_id, month, 0, 0, 0, amount, 0, 0
+            FROM transfers
+            WHERE user_id IS NOT NULL AND from_category_id IS NOT NULL AND month IS NOT NULL
+        ) AS source_rows
+        GROUP BY user_id, category_id, month
+    """)
+
+
+def downgrade():
+    op.drop_table("category_month_totals")
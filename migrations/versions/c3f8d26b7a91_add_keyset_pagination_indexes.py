@@ -0,0 +1,36 @@
+"""add keyset pagination indexes for expenses and transfers
+
+Revision ID: c3f8d26b7a91
+Revises: a7e2c95d1f04
+Create Date: 2026-10-18 15:22:07.640913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8d26b7a91'
+down_revision: Union[str, Sequence[str], None] = 'a7e2c95d1f04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_expenses_user_created_id",
+        "expenses",
+        ["user_id", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_transfers_user_created_id",
+        "transfers",
+        ["user_id", "created_at", "id"]
+    )
+
+
+def downgrade():
+    op.drop_index("ix_transfers_user_created_id", table_name="transfers")
+    op.drop_index("ix_expenses_user_created_id", table_name="expenses")
@@ -0,0 +1,30 @@
+"""add users.data_version for ETags
+
+Revision ID: e5b1a0c47d92
+Revises: c3f8d26b7a91
+Create Date: 2026-10-18 17:04:51.212394
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b1a0c47d92'
+down_revision: Union[str, Sequence[str], None] = 'c3f8d26b7a91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(
+            sa.Column("data_version", sa.Integer(), nullable=False, server_default="0")
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("data_version")
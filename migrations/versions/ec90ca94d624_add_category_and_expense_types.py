@@ -20,15 +20,23 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _recreate():
+    # SQLite can only change constraints by copying the table; elsewhere ALTER in place
+    return "always" if op.get_bind().dialect.name == "sqlite" else "auto"
+
+
 def upgrade():
     conn = op.get_bind()
 
+    sqlite = conn.dialect.name == "sqlite"
+
     # Disable FK enforcement for batch rebuild
-    conn.execute(text("PRAGMA foreign_keys=OFF"))
+    if sqlite:
+        conn.execute(text("PRAGMA foreign_keys=OFF"))
     conn.execute(text("DROP TABLE IF EXISTS _alembic_tmp_categories"))
     conn.execute(text("DROP TABLE IF EXISTS _alembic_tmp_expenses"))
     # ---------- CATEGORIES ----------
-    with op.batch_alter_table("categories", recreate="always") as batch:
+    with op.batch_alter_table("categories", recreate=_recreate()) as batch:
         batch.add_column(
             sa.Column(
                 "type",
@@ -54,7 +62,7 @@ def upgrade():
     op.execute("UPDATE categories SET type = 'expense' WHERE type IS NULL")
 
     # ---------- EXPENSES ----------
-    with op.batch_alter_table("expenses", recreate="always") as batch:
+    with op.batch_alter_table("expenses", recreate=_recreate()) as batch:
         batch.add_column(
             sa.Column(
                 "type",
@@ -69,7 +77,8 @@ def upgrade():
             "type IN ('spend','withdrawal')"
         )
 
-    conn.execute(text("PRAGMA foreign_keys=ON"))
+    if sqlite:
+        conn.execute(text("PRAGMA foreign_keys=ON"))
 
     # Backfill existing expenses explicitly
     op.execute("UPDATE expenses SET type = 'spend' WHERE type IS NULL")
@@ -77,12 +86,12 @@ def upgrade():
 
 def downgrade():
     # ---------- EXPENSES ----------
-    with op.batch_alter_table("expenses", recreate="always") as batch:
+    with op.batch_alter_table("expenses", recreate=_recreate()) as batch:
         batch.drop_constraint("ck_expenses_type", type_="check")
         batch.drop_column("type")
 
     # ---------- CATEGORIES ----------
-    with op.batch_alter_table("categories", recreate="always") as batch:
+    with op.batch_alter_table("categories", recreate=_recreate()) as batch:
         batch.drop_constraint("uq_user_category_name_type", type_="unique")
         batch.drop_constraint("ck_categories_type", type_="check")
         batch.drop_column("type")
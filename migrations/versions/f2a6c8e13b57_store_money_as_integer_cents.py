@@ -0,0 +1,72 @@
+"""store money columns as integer cents
+
+Revision ID: f2a6c8e13b57
+Revises: e5b1a0c47d92
+Create Date: 2026-10-18 19:12:40.530817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6c8e13b57'
+down_revision: Union[str, Sequence[str], None] = 'e5b1a0c47d92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> money columns (see data/db/types.py Money)
+MONEY_COLUMNS = {
+    "budgets": ("amount",),
+    "categories": ("limit_amount",),
+    "expenses": ("amount",),
+    "transfers": ("amount",),
+    "allocations": ("allocated_amount",),
+    "category_month_totals": ("spent", "withdrawn", "transfers_in", "transfers_out"),
+}
+
+
+def _foreign_keys(enabled: bool):
+    # The SQLite batch copy drops and renames referenced tables
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute(f"PRAGMA foreign_keys={'ON' if enabled else 'OFF'}")
+
+
+def upgrade():
+    _foreign_keys(False)
+    for table, columns in MONEY_COLUMNS.items():
+        # Scale while the columns are still Numeric, then narrow the type;
+        # batch mode copies the rows through CAST(... AS BIGINT) on SQLite
+        op.execute(
+            f"UPDATE {table} SET "
+            + ", ".join(f"{column} = ROUND({column} * 100)" for column in columns)
+        )
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.Numeric(),
+                    type_=sa.BigInteger(),
+                    postgresql_using=f"{column}::bigint",
+                )
+    _foreign_keys(True)
+
+
+def downgrade():
+    _foreign_keys(False)
+    for table, columns in MONEY_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.BigInteger(),
+                    type_=sa.Numeric(),
+                    postgresql_using=f"{column}::numeric",
+                )
+        op.execute(
+            f"UPDATE {table} SET "
+            + ", ".join(f"{column} = {column} / 100.0" for column in columns)
+        )
+    _foreign_keys(True)
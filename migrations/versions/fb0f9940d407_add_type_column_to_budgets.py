@@ -18,9 +18,14 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _recreate():
+    # SQLite can only change constraints by copying the table; elsewhere ALTER in place
+    return "always" if op.get_bind().dialect.name == "sqlite" else "auto"
+
+
 def upgrade():
     # SQLite requires batch mode for constraints
-    with op.batch_alter_table("budgets", recreate="always") as batch_op:
+    with op.batch_alter_table("budgets", recreate=_recreate()) as batch_op:
         batch_op.add_column(
             sa.Column(
                 "type",
@@ -40,6 +45,6 @@ def upgrade():
 
 
 def downgrade():
-    with op.batch_alter_table("budgets", recreate="always") as batch_op:
+    with op.batch_alter_table("budgets", recreate=_recreate()) as batch_op:
         batch_op.drop_constraint("ck_budgets_type", type_="check")
         batch_op.drop_column("type")
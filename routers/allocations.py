@@ -1,8 +1,10 @@
 
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, logger, status
+from fastapi import APIRouter, Depends, Query, Response, logger, status
 
+from core.etag import data_version_etag
+from core.responses import trusted_json
 from core.security import get_current_user
 from data.db.db import get_db
 from schema.allocation import AllocationCreate, AllocationOut
@@ -15,23 +17,33 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 router = APIRouter(
-    prefix="/api/budgets/{budget_id}/allocations", tags=["allocations"])
+    prefix="/api/budgets/{budget_id}/allocations", tags=["allocations"],
+    dependencies=[Depends(data_version_etag)])
 # get
 
 
 @router.get("/overview", status_code=status.HTTP_200_OK)
 def get_budget_overview(
     budget_id: int,
-    month: Optional[str] = None,
+    response: Response,
+    month: Optional[str] = Query(
+        None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Format: YYYY-MM"),
+    months: Optional[int] = Query(
+        None, ge=1, le=60, description="Include a month x category matrix for this many trailing months"),
+    forecast: bool = Query(
+        False, description="Project each allocation's spend to the end of the month"),
     db: Session = Depends(get_db),
     current_user: UserOut = Depends(get_current_user),
 ):
-    return AllocationService.get_budget_overview(
+    overview = AllocationService.get_budget_overview(
         db=db,
         user_id=current_user.id,
         budget_id=budget_id,
-        month=month
+        month=month,
+        months=months,
+        forecast=forecast
     )
+    return trusted_json(overview, response)
 
 
 @router.post("/", response_model=AllocationOut, status_code=status.HTTP_201_CREATED)
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.orm import Session
+
+from core.etag import data_version_etag
+from core.responses import trusted_json
+from core.security import get_current_user
+from data.db.db import get_db
+from schema.user import UserOut
+from services.analytics_service import AnalyticsService
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"],
+                   dependencies=[Depends(data_version_etag)])
+
+
+@router.get("/{budget_id}", status_code=status.HTTP_200_OK)
+def get_budget_analytics(
+    budget_id: int,
+    response: Response,
+    month: Optional[str] = Query(
+        None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Last month shown. Format: YYYY-MM"),
+    months: int = Query(12, ge=1, le=60, description="Number of months in each series"),
+    db: Session = Depends(get_db),
+    current_user: UserOut = Depends(get_current_user),
+):
+    """
+    Monthly spend per allocated category with month-over-month deltas,
+    rolling 3/6/12-month averages, category share and utilization, one
+    value per month in `months`.
+    """
+    analytics = AnalyticsService.get_budget_analytics(
+        db=db,
+        user_id=current_user.id,
+        budget_id=budget_id,
+        month=month,
+        months=months
+    )
+    return trusted_json(analytics, response)
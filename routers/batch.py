@@ -0,0 +1,33 @@
+# routers/batch.py
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from core.security import get_current_user
+from data.db.db import get_db
+from schema.batch import BatchRequest, BatchResponse
+from schema.user import UserOut
+from services.batch_service import BatchService
+
+router = APIRouter(prefix="/api/batch", tags=["batch"])
+
+
+@router.post("/", response_model=BatchResponse, status_code=status.HTTP_200_OK)
+def run_batch(
+    batch: BatchRequest,
+    db: Session = Depends(get_db),
+    current_user: UserOut = Depends(get_current_user)
+):
+    """
+    Apply expense, withdrawal, transfer and allocation changes in order, in
+    one transaction. If any operation fails nothing is saved, and the
+    response carries the failing operation's status code with the
+    results up to and including it.
+    """
+    committed, results = BatchService.run(db, batch.operations, current_user)
+    if not committed:
+        return JSONResponse(
+            status_code=results[-1]["status"],
+            content=BatchResponse(committed=False, results=results).model_dump(mode="json")
+        )
+    return {"committed": True, "results": results}
@@ -1,42 +1,49 @@
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.etag import async_data_version_etag
+from core.responses import trusted_json
 from core.security import get_current_user
-from data.db.db import get_db
+from data.db.db import get_async_db
 from schema.category import CategoryAllocationCreate, CategoryBase, CategoryOut, CategoryStats
 from schema.user import UserOut
 
 from services.category_service import CategoryService
 
-router = APIRouter(prefix="/api/categories", tags=["categories"])
+router = APIRouter(prefix="/api/categories", tags=["categories"],
+                   dependencies=[Depends(async_data_version_etag)])
 
 
 @router.get("/", response_model=list[CategoryOut])
 async def get_all_categories(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserOut = Depends(get_current_user),
 ):
-    return CategoryService.get_all_categories(db, current_user.id)
+    return await db.run_sync(CategoryService.get_all_categories, current_user.id)
 
 
 @router.get("/with-stats/{budget_id}", response_model=list[CategoryStats], status_code=status.HTTP_200_OK)
 async def get_categories_with_stats(
     budget_id: int,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserOut = Depends(get_current_user),
 ):
-    return CategoryService.get_categories_with_stats(db=db, user_id=current_user.id, budget_id=budget_id)
+    # The service builds every CategoryStats field itself, so the payload
+    # goes straight to orjson instead of being re-validated row by row
+    stats = await db.run_sync(
+        CategoryService.get_categories_with_stats, user_id=current_user.id, budget_id=budget_id)
+    return trusted_json(stats, response)
 
 
 @router.get("/{category_id}", response_model=CategoryOut)
 async def get_category_by_id(
     category_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserOut = Depends(get_current_user),
 ):
-    category = CategoryService.get_category_by_id(
-        db, current_user.id, category_id)
+    category = await db.run_sync(CategoryService.get_category_by_id, current_user.id, category_id)
 
     if not category:
         raise HTTPException(
@@ -48,11 +55,11 @@ async def get_category_by_id(
 @router.get("/category_type/{category_type}", response_model=list[CategoryOut], status_code=status.HTTP_200_OK)
 async def fetch_categories_by_type(
     category_type: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserOut = Depends(get_current_user),
 ):
-    budget_categories = CategoryService.get_categories_by_type(
-        db=db, user_id=current_user.id, category_type=category_type)
+    budget_categories = await db.run_sync(
+        CategoryService.get_categories_by_type, user_id=current_user.id, category_type=category_type)
     if not budget_categories:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Categories not found")
@@ -62,11 +69,10 @@ async def fetch_categories_by_type(
 @router.post("/", response_model=CategoryOut, status_code=status.HTTP_201_CREATED)
 async def create_category(
     category: CategoryBase,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserOut = Depends(get_current_user),
 ):
-    existing = CategoryService.get_existing_category(
-        db, current_user.id, category)
+    existing = await db.run_sync(CategoryService.get_existing_category, current_user.id, category)
 
     if existing:
         raise HTTPException(
@@ -74,8 +80,7 @@ async def create_category(
             detail="Category already exists"
         )
 
-    new_category = CategoryService.save_new_category(
-        db, current_user.id, category)
+    new_category = await db.run_sync(CategoryService.save_new_category, current_user.id, category)
 
     return new_category
 
@@ -83,11 +88,10 @@ async def create_category(
 @router.post("/category_allocation", response_model=CategoryOut, status_code=status.HTTP_201_CREATED)
 async def create_category_and_allocation(
     category: CategoryAllocationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserOut = Depends(get_current_user),
 ):
-    existing = CategoryService.get_existing_category(
-        db, current_user.id, category)
+    existing = await db.run_sync(CategoryService.get_existing_category, current_user.id, category)
 
     if existing:
         raise HTTPException(
@@ -95,8 +99,8 @@ async def create_category_and_allocation(
             detail="Category already exists"
         )
 
-    new_category = CategoryService.save_new_category_with_allocation(
-        db, current_user.id, category)
+    new_category = await db.run_sync(
+        CategoryService.save_new_category_with_allocation, current_user.id, category)
 
     return new_category
 
@@ -105,32 +109,31 @@ async def create_category_and_allocation(
 async def update_category(
     category_id: int,
     category: CategoryBase,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserOut = Depends(get_current_user),
 ):
-    existing_category = CategoryService.get_category_by_id(
-        db, current_user.id, category_id)
+    existing_category = await db.run_sync(
+        CategoryService.get_category_by_id, current_user.id, category_id)
 
     if not existing_category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
 
-    updated = CategoryService.update_category(db, existing_category, category)
+    updated = await db.run_sync(CategoryService.update_category, existing_category, category)
     return updated
 
 
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_category(
     category_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserOut = Depends(get_current_user),
 ):
-    category = CategoryService.get_category_by_id(
-        db, current_user.id, category_id)
+    category = await db.run_sync(CategoryService.get_category_by_id, current_user.id, category_id)
 
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
 
-    CategoryService.delete_category(db, category)
+    await db.run_sync(CategoryService.delete_category, category)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
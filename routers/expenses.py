@@ -1,16 +1,26 @@
 """Expenses router"""
 import logging
 from datetime import datetime
+from decimal import Decimal
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
+from fastapi import (
+    APIRouter, Depends, File, Form, HTTPException, Path, Query, Response, UploadFile, status
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from core.etag import async_data_version_etag
 from core.security import get_current_user
-from data.db.db import get_db
-from schema.expense import ExpenseCreate, ExpenseOut, WithdrawalCreate
+from data.db.db import get_async_db, get_db
+from schema.expense import (
+    ExpenseCreate, ExpenseImportResult, ExpenseOut, ExpensePage, WithdrawalCreate
+)
 from schema.user import UserOut
 
 from services.expense_service import ExpenseService
+from services.import_service import ImportService
+from services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 logger = logging.getLogger("app.expenses")
 logging.basicConfig(level=logging.INFO)
@@ -19,24 +29,45 @@ logging.basicConfig(level=logging.INFO)
 router = APIRouter(
     prefix="/api/expenses",
     tags=["expenses"],
-    dependencies=[Depends(get_current_user)]
+    dependencies=[Depends(get_current_user), Depends(async_data_version_etag)]
 )
 
 
-@router.get("/", response_model=list[ExpenseOut])
+@router.get("/", response_model=ExpensePage)
 async def get_all_expenses(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    month_from: Optional[str] = Query(
+        None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Format: YYYY-MM"),
+    month_to: Optional[str] = Query(
+        None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Format: YYYY-MM"),
+    category_id: Optional[int] = Query(None),
+    expense_type: Literal["spend", "withdrawal", "all"] = Query("spend", alias="type"),
+    min_amount: Optional[Decimal] = Query(None, ge=0),
+    max_amount: Optional[Decimal] = Query(None, ge=0),
     current_user: UserOut = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return ExpenseService.get_all_expenses(db=db, current_user=current_user)
+    return await db.run_sync(
+        ExpenseService.get_all_expenses,
+        current_user=current_user,
+        limit=limit,
+        cursor=cursor,
+        month_from=month_from,
+        month_to=month_to,
+        category_id=category_id,
+        expense_type=None if expense_type == "all" else expense_type,
+        min_amount=min_amount,
+        max_amount=max_amount
+    )
 
 
 @router.get("/month", response_model=list[ExpenseOut])
 async def get_current_month_expense(
     current_user: UserOut = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return ExpenseService.get_current_month_expense(db=db, current_user=current_user)
+    return await db.run_sync(ExpenseService.get_current_month_expense, current_user=current_user)
 
 
 @router.get("/by-month", response_model=list[ExpenseOut])
@@ -44,10 +75,10 @@ async def get_expenses_by_month(
     month: str = Query(...,
                        regex=r"^\d{4}-(0[1-9]|1[0-2])$", description="Format: YYYY-MM"),
     current_user: UserOut = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return ExpenseService.get_expenses_by_month(
-        db=db,
+    return await db.run_sync(
+        ExpenseService.get_expenses_by_month,
         month=month,
         current_user=current_user
     )
@@ -57,10 +88,10 @@ async def get_expenses_by_month(
 async def get_expense_by_category(
     category_id: int = Path(..., description="Category ID"),
     current_user: UserOut = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return ExpenseService.get_expenses_by_category(
-        db=db,
+    return await db.run_sync(
+        ExpenseService.get_expenses_by_category,
         category_id=category_id,
         current_user=current_user
     )
@@ -72,10 +103,10 @@ async def get_expenses_by_category_and_month(
     month: str = Query(...,
                        regex=r"^\d{4}-(0[1-9]|1[0-2])$", description="Format: YYYY-MM"),
     current_user: UserOut = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return ExpenseService.get_expenses_by_category_and_month(
-        db=db,
+    return await db.run_sync(
+        ExpenseService.get_expenses_by_category_and_month,
         category_id=category_id,
         month=month,
         current_user=current_user
@@ -86,10 +117,10 @@ async def get_expenses_by_category_and_month(
 async def create_expense(
     expense: ExpenseCreate,
     current_user: UserOut = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return ExpenseService.create_expense(
-        db=db,
+    return await db.run_sync(
+        ExpenseService.create_expense,
         expense=expense,
         current_user=current_user
     )
@@ -99,16 +130,39 @@ async def create_expense(
 async def add_withdrawal(
     withdrawal: ExpenseCreate,
     current_user: UserOut = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # add expense in the db and reduce budget by specific amount
-    return ExpenseService.create_withdrawal(
-        db=db,
+    return await db.run_sync(
+        ExpenseService.create_withdrawal,
         withdrawal=withdrawal,
         current_user=current_user
     )
 
 
+@router.post("/import", response_model=ExpenseImportResult)
+def import_expenses(
+    file: UploadFile = File(..., description="CSV or OFX/QFX statement"),
+    format: Optional[Literal["csv", "ofx"]] = Form(
+        None, description="Defaults to the file extension"),
+    default_category_id: Optional[int] = Form(
+        None, description="Category for rows without one (always the case for OFX)"),
+    current_user: UserOut = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    if format is None:
+        suffix = (file.filename or "").rsplit(".", 1)[-1].lower()
+        format = "ofx" if suffix in ("ofx", "qfx") else "csv"
+
+    return ImportService.import_expenses(
+        db=db,
+        stream=file.file,
+        file_format=format,
+        current_user=current_user,
+        default_category_id=default_category_id
+    )
+
+
 @router.put("/{expense_id}", response_model=ExpenseOut)
 def update_expense(
     expense_id: int,
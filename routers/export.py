@@ -0,0 +1,112 @@
+# routers/export.py
+import csv
+import io
+import json
+import logging
+import zlib
+from datetime import date
+from typing import Iterator, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from core.security import get_current_user
+from data.db.db import get_db
+from schema.user import UserOut
+from services.export_service import EXPORT_COLUMNS, ExportService
+
+logger = logging.getLogger("app.export")
+router = APIRouter(prefix="/api/export", tags=["export"])
+
+# Buffered output is flushed to the client once it reaches this size
+CHUNK_SIZE = 64 * 1024
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def _csv_chunks(rows: Iterator[dict]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    # Header goes out straight away so the download starts before the first query returns
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(rows: Iterator[dict]) -> Iterator[str]:
+    lines = []
+    size = 0
+    for row in rows:
+        line = json.dumps(row, separators=(",", ":")) + "\n"
+        lines.append(line)
+        size += len(line)
+        if size >= CHUNK_SIZE:
+            yield "".join(lines)
+            lines, size = [], 0
+    yield "".join(lines)
+
+
+def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+@router.get("/{dataset}")
+def export_dataset(
+    dataset: Literal["ledger", "expenses", "transfers"],
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    gzip: bool = Query(False, description="Compress the file on the fly"),
+    month_from: Optional[str] = Query(
+        None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Format: YYYY-MM"),
+    month_to: Optional[str] = Query(
+        None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Format: YYYY-MM"),
+    db: Session = Depends(get_db),
+    current_user: UserOut = Depends(get_current_user)
+):
+    """
+    Download every expense and/or transfer as CSV or NDJSON. The body is
+    generated while it is sent, so memory use does not grow with the ledger.
+    """
+    # The request session is closed before the body is sent; the stream
+    # opens its own on the same engine.
+    bind = db.get_bind()
+    user_id = current_user.id
+
+    def body() -> Iterator[bytes]:
+        with Session(bind=bind) as stream_db:
+            rows = ExportService.iter_dataset(
+                stream_db, dataset, user_id, month_from, month_to)
+            chunks = _csv_chunks(rows) if format == "csv" else _ndjson_chunks(rows)
+            for chunk in chunks:
+                if chunk:
+                    yield chunk.encode("utf-8")
+        logger.info("Export finished: user_id=%s dataset=%s format=%s",
+                    user_id, dataset, format)
+
+    filename = f"bajeti-{dataset}-{date.today().isoformat()}.{format}"
+    headers = {}
+    media_type = MEDIA_TYPES[format]
+    content = body()
+    if gzip:
+        content = _gzip_chunks(content)
+        filename += ".gz"
+        media_type = "application/gzip"
+        # Already compressed: keeps GZipMiddleware from compressing it again
+        headers["Content-Encoding"] = "identity"
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    return StreamingResponse(content, media_type=media_type, headers=headers)
@@ -0,0 +1,41 @@
+# routers/health.py
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.config import settings
+from app.services import http_client
+from app.utils.templates import fragment_cache
+from core.passwords import password_hasher
+from core.security import get_current_user
+from core.user_cache import user_cache
+from schema.user import UserOut
+from services.analytics_service import analytics_cache
+from services.forecast_service import curve_cache
+from services.report_service import report_jobs
+from services.token_service import TokenService
+
+router = APIRouter(prefix="/api/health", tags=["health"])
+
+
+@router.get("/", status_code=status.HTTP_200_OK)
+async def health():
+    """Public liveness check; reveals nothing about the runtime"""
+    return {"status": "ok"}
+
+
+@router.get("/stats", status_code=status.HTTP_200_OK)
+async def health_stats(current_user: UserOut = Depends(get_current_user)):
+    """Runtime stats of the shared pools, caches and queues (signed-in users only)"""
+    if not settings.HEALTH_STATS_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return {
+        "status": "ok",
+        "http_pool": http_client.pool_stats(),
+        "user_cache": user_cache.stats(),
+        "token_cache": TokenService.cache_stats(),
+        "password_hasher": password_hasher.stats(),
+        "fragment_cache": fragment_cache.stats(),
+        "analytics_cache": analytics_cache.stats(),
+        "forecast_curve_cache": curve_cache.stats(),
+        "report_jobs": report_jobs.stats(),
+    }
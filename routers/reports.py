@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from core.data_version import get_data_version
+from core.security import get_current_user
+from data.db.db import get_db
+from schema.report import ReportCreate, ReportJobOut
+from schema.user import UserOut
+from services.budget_service import BudgetService
+from services.report_service import MEDIA_TYPES, report_jobs
+
+router = APIRouter(prefix="/api/reports", tags=["reports"])
+
+
+def job_out(job: dict) -> ReportJobOut:
+    download_url = f"/api/reports/{job['id']}/download" if job["status"] == "done" else None
+    return ReportJobOut(**job, download_url=download_url)
+
+
+def get_job(job_id: str, current_user: UserOut) -> dict:
+    job = report_jobs.get(job_id, current_user.id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
+    return job
+
+
+@router.post("/", response_model=ReportJobOut, status_code=status.HTTP_202_ACCEPTED)
+def create_report(
+    payload: ReportCreate,
+    db: Session = Depends(get_db),
+    current_user: UserOut = Depends(get_current_user),
+):
+    """Queue a monthly (period=YYYY-MM) or annual (period=YYYY) report; poll the job for its file."""
+    budget = BudgetService.get_budget_by_id(
+        db=db, user_id=current_user.id, budget_id=payload.budget_id)
+    if not budget:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Budget not found")
+
+    job = report_jobs.submit(
+        bind=db.get_bind(),
+        user_id=current_user.id,
+        budget=budget,
+        request=payload,
+        data_version=get_data_version(db, current_user.id),
+    )
+    return job_out(job)
+
+
+@router.get("/{job_id}", response_model=ReportJobOut)
+def get_report(
+    job_id: str,
+    current_user: UserOut = Depends(get_current_user),
+):
+    return job_out(get_job(job_id, current_user))
+
+
+@router.get("/{job_id}/download", response_class=FileResponse)
+def download_report(
+    job_id: str,
+    current_user: UserOut = Depends(get_current_user),
+):
+    job = get_job(job_id, current_user)
+    if job["status"] != "done":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Report is not ready")
+
+    path = report_jobs.artifact_path(job)
+    if not path:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Report file has expired; request it again")
+
+    return FileResponse(path, media_type=MEDIA_TYPES[job["format"]], filename=job["filename"])
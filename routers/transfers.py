@@ -1,40 +1,67 @@
 # routers/transfers.py
 import logging
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from decimal import Decimal
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 
-from data.db.db import get_db
+from data.db.db import get_async_db
 from data.db.models.models import Transfer
-from schema.transfer import TransferCreate, TransferOut
+from schema.transfer import TransferCreate, TransferOut, TransferPage
 from schema.user import UserOut
+from core.etag import async_data_version_etag
 from core.security import get_current_user
+from services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from services.transfer_service import TransferService
 
 logger = logging.getLogger("app.transfers")
-router = APIRouter(prefix="/api/transfers", tags=["transfers"])
+router = APIRouter(prefix="/api/transfers", tags=["transfers"],
+                   dependencies=[Depends(async_data_version_etag)])
 
 
-@router.get("/", response_model=list[TransferOut])
-async def get_all_transfers(db: Session = Depends(get_db), current_user: UserOut = Depends(get_current_user)):
-    return TransferService.get_all_transfers(db, current_user)
+@router.get("/", response_model=TransferPage)
+async def get_all_transfers(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    month_from: Optional[str] = Query(
+        None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Format: YYYY-MM"),
+    month_to: Optional[str] = Query(
+        None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="Format: YYYY-MM"),
+    category_id: Optional[int] = Query(None, description="Matches either side of the transfer"),
+    min_amount: Optional[Decimal] = Query(None, ge=0),
+    max_amount: Optional[Decimal] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserOut = Depends(get_current_user)
+):
+    return await db.run_sync(
+        TransferService.get_all_transfers,
+        current_user,
+        limit=limit,
+        cursor=cursor,
+        month_from=month_from,
+        month_to=month_to,
+        category_id=category_id,
+        min_amount=min_amount,
+        max_amount=max_amount
+    )
 
 
 @router.get("/by-month", response_model=list[TransferOut])
-async def get_transfers_by_month(month: str, db: Session = Depends(get_db), current_user: UserOut = Depends(get_current_user)):
-    return TransferService.get_transfers_by_month(db, month, current_user)
+async def get_transfers_by_month(month: str, db: AsyncSession = Depends(get_async_db), current_user: UserOut = Depends(get_current_user)):
+    return await db.run_sync(TransferService.get_transfers_by_month, month, current_user)
 
 
 @router.post("/", response_model=TransferOut, status_code=status.HTTP_201_CREATED)
-async def create_transfer(payload: TransferCreate, db: Session = Depends(get_db), current_user: UserOut = Depends(get_current_user)):
+async def create_transfer(payload: TransferCreate, db: AsyncSession = Depends(get_async_db), current_user: UserOut = Depends(get_current_user)):
     # minimal validation: amount > 0
     if payload.amount <= 0:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail="Transfer amount must be > 0")
-    return TransferService.create_transfer(db, payload, current_user)
+    return await db.run_sync(TransferService.create_transfer, payload, current_user)
 
 
 @router.delete("/{transfer_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_transfer(transfer_id: int, db: Session = Depends(get_db), current_user: UserOut = Depends(get_current_user)):
-    TransferService.delete_transfer(db, transfer_id, current_user)
+async def delete_transfer(transfer_id: int, db: AsyncSession = Depends(get_async_db), current_user: UserOut = Depends(get_current_user)):
+    await db.run_sync(TransferService.delete_transfer, transfer_id, current_user)
     return {}
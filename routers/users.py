@@ -17,7 +17,7 @@ logger = logging.getLogger("app.users")
 
 
 @router.put("/me", response_model=UserOut, status_code=status.HTTP_200_OK)
-async def update_user(
+def update_user(
     updates: UserUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -26,7 +26,7 @@ async def update_user(
 
 
 @router.post("/password/reset")
-async def reset_password(
+def reset_password(
     request: PasswordResetRequest,
     db: Session = Depends(get_db)
 ):
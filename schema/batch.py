@@ -0,0 +1,37 @@
+# Schema for batch mutations
+from typing import Any, Literal, Optional
+from pydantic import BaseModel, Field
+
+MAX_BATCH_OPERATIONS = 200
+
+
+class BatchOperation(BaseModel):
+    """describes one create, update or delete in a batch"""
+    op: Literal["create", "update", "delete"]
+    resource: Literal["expense", "withdrawal", "transfer", "allocation"]
+    # Row to update or delete (expenses, withdrawals, transfers, allocations)
+    id: Optional[int] = None
+    # Budget owning the allocation
+    budget_id: Optional[int] = None
+    # Body of the matching single-row endpoint, e.g. ExpenseCreate
+    data: Optional[dict] = None
+
+
+class BatchRequest(BaseModel):
+    """describes an ordered list of operations applied all-or-nothing"""
+    operations: list[BatchOperation] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+
+class BatchResult(BaseModel):
+    """describes the outcome of one operation"""
+    index: int
+    status: int
+    data: Optional[Any] = None
+    detail: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    """describes the outcome of a batch"""
+    committed: bool
+    results: list[BatchResult]
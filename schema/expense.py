@@ -37,6 +37,25 @@ class ExpenseOut(ExpenseBase):
         orm_mode = True
 
 
+class ExpensePage(BaseModel):
+    """describes one keyset page of expenses"""
+    items: list[ExpenseOut]
+    next_cursor: Optional[str] = None
+
+
 class WithdrawalCreate(ExpenseCreate):
     """describes the structure for Withdrawal operations"""
     budget_id: int
+
+
+class ImportRowErrorOut(BaseModel):
+    """describes a source row that could not be imported"""
+    row: int
+    error: str
+
+
+class ExpenseImportResult(BaseModel):
+    """describes the outcome of a bulk expense import"""
+    imported: int
+    failed: int
+    errors: list[ImportRowErrorOut]
@@ -0,0 +1,25 @@
+# Schema for generated reports
+from datetime import datetime
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class ReportCreate(BaseModel):
+    """describes a report request: a month (YYYY-MM) or a year (YYYY) of one budget"""
+    budget_id: int
+    period: str = Field(..., pattern=r"^\d{4}(-(0[1-9]|1[0-2]))?$")
+    format: Literal["csv", "pdf"] = "pdf"
+
+
+class ReportJobOut(BaseModel):
+    """describes a report job and, once done, where to download it"""
+    id: str
+    status: Literal["queued", "running", "done", "failed"]
+    budget_id: int
+    period: str
+    kind: Literal["monthly", "annual"]
+    format: Literal["csv", "pdf"]
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    download_url: Optional[str] = None
@@ -25,6 +25,11 @@ class TransferOut(TransferBase):
         orm_mode = True
 
 
+class TransferPage(BaseModel):
+    items: list[TransferOut]
+    next_cursor: Optional[str] = None
+
+
 class TransferStats(TransferBase):
     id: int
     user_id: int
@@ -1,14 +1,27 @@
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 from fastapi import HTTPException, status
-from sqlalchemy import func
+from sqlalchemy import type_coerce
 from sqlalchemy.orm import Session
 
-from data.db.models.models import Allocation, Budget, Category, Expense
+from data.db.models.models import Allocation, Budget, Category, CategoryMonthTotal
+from data.db.types import ZERO, Money
 from schema.allocation import AllocationCreate
 from services.budget_service import BudgetService
 from services.category_service import CategoryService
+from services.forecast_service import ForecastService
+
+
+def trailing_months(end_month: str, count: int) -> list[str]:
+    """Return `count` YYYY-MM strings ending at `end_month`, oldest first"""
+    year, month = (int(part) for part in end_month.split("-"))
+    result = []
+    for _ in range(count):
+        result.append(f"{year:04d}-{month:02d}")
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    return result[::-1]
 
 
 class AllocationService:
@@ -65,11 +78,22 @@ class AllocationService:
         db: Session,
         user_id: int,
         budget_id: int,
-        month: Optional[str] = None
+        month: Optional[str] = None,
+        months: Optional[int] = None,
+        forecast: bool = False
     ):
+        """
+        Allocation usage for a month. When `months` is given, also return a
+        month x category matrix for the trailing `months` months ending at
+        `month`, computed by the same grouped query. With `forecast`, every
+        allocation also gets its burn rate and projected end-of-month spend
+        (see ForecastService).
+        """
         if not month:
             month = datetime.utcnow().strftime("%Y-%m")
 
+        month_range = trailing_months(month, months or 1)
+
         # 1. Budget
         budget = db.query(Budget).filter(
             Budget.id == budget_id,
@@ -94,33 +118,43 @@ class AllocationService:
             .all()
         )
 
+        # 3. Spend (spend + withdrawal) per category and month from the rollup
+        spent_rows = (
+            db.query(
+                CategoryMonthTotal.category_id,
+                CategoryMonthTotal.month,
+                # Summed in SQL on integer cents; coerced back so it reads as Money
+                type_coerce(CategoryMonthTotal.spent + CategoryMonthTotal.withdrawn, Money)
+            )
+            .filter(
+                CategoryMonthTotal.user_id == user_id,
+                CategoryMonthTotal.category_id.in_(
+                    [category.id for _, category in allocations]),
+                CategoryMonthTotal.month.in_(month_range),
+            )
+            .all()
+        ) if allocations else []
+
+        spent_map = {
+            (category_id, expense_month): total
+            for category_id, expense_month, total in spent_rows
+        }
+
         allocation_rows = []
-        total_allocated = Decimal("0")
-        total_spent = Decimal("0")
+        total_allocated = ZERO
+        total_spent = ZERO
 
         for allocation, category in allocations:
-            allocated_amount = Decimal(str(allocation.allocated_amount))
+            allocated_amount = allocation.allocated_amount
             total_allocated += allocated_amount
 
-            # 3. Expenses per category (month + spend)
-            spent = (
-                db.query(func.coalesce(func.sum(Expense.amount), 0))
-                .filter(
-                    Expense.user_id == user_id,
-                    Expense.category_id == category.id,
-                    Expense.month == month,
-                    # Expense.type == "spend"
-                )
-                .scalar()
-            )
-
-            spent = Decimal(str(spent))
+            spent = spent_map.get((category.id, month), ZERO)
             total_spent += spent
 
             remaining = allocated_amount - spent
             percent_used = (
                 (spent / allocated_amount) * 100
-                if allocated_amount > 0 else Decimal("0")
+                if allocated_amount > 0 else ZERO
             )
 
             allocation_rows.append({
@@ -133,13 +167,13 @@ class AllocationService:
                 "percent_used": float(percent_used),
             })
 
-        unallocated = Decimal(str(budget.amount)) - total_allocated
+        unallocated = budget.amount - total_allocated
         utilization_percent = (
-            (total_spent / Decimal(str(budget.amount))) * 100
-            if budget.amount > 0 else Decimal("0")
+            (total_spent / budget.amount) * 100
+            if budget.amount > 0 else ZERO
         )
 
-        return {
+        overview = {
             "budget": {
                 "id": budget.id,
                 "name": budget.name,
@@ -155,6 +189,39 @@ class AllocationService:
             "allocations": allocation_rows
         }
 
+        if forecast:
+            projection = ForecastService.project(
+                db=db,
+                user_id=user_id,
+                month=month,
+                category_ids=[row["category_id"] for row in allocation_rows],
+                allocated=[row["allocated_amount"] for row in allocation_rows],
+                spent=[row["used_amount"] for row in allocation_rows],
+            )
+            overview["forecast"] = projection["summary"]
+            for row, row_forecast in zip(allocation_rows, projection["allocations"]):
+                row["forecast"] = row_forecast
+
+        if months:
+            category_ids = [category.id for _, category in allocations]
+            # matrix[i][j] is the spend of category_ids[j] in month_range[i]
+            matrix = [
+                [
+                    float(spent_map.get((category_id, row_month), 0))
+                    for category_id in category_ids
+                ]
+                for row_month in month_range
+            ]
+            overview["history"] = {
+                "months": month_range,
+                "category_ids": category_ids,
+                "category_names": [category.name for _, category in allocations],
+                "matrix": matrix,
+                "totals": [sum(row) for row in matrix],
+            }
+
+        return overview
+
     @staticmethod
     def edit_allocation(db: Session,
                         budget_id: int, allocation: AllocationCreate):
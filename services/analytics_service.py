@@ -0,0 +1,207 @@
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from core.cache import ExpiringLRUCache
+from core.data_version import get_data_version
+from data.db.models.models import Allocation, Budget, Category, CategoryMonthTotal
+from services.allocation_service import trailing_months
+
+logger = logging.getLogger("app.analytics")
+
+ROLLING_WINDOWS = (3, 6, 12)
+# Months fetched ahead of the window so every rolling average is complete
+LEAD_MONTHS = max(ROLLING_WINDOWS) - 1
+
+# Keyed by data version, so a write simply makes the old entries unreachable
+analytics_cache = ExpiringLRUCache(max_size=settings.ANALYTICS_CACHE_MAX_SIZE)
+
+
+def _series(values: np.ndarray) -> list:
+    """Rounded floats for one series, with NaN (undefined) as None."""
+    rounded = np.round(values, 2).astype(object)
+    rounded[np.isnan(values)] = None
+    return rounded.tolist()
+
+
+def _columns(values: np.ndarray) -> List[list]:
+    """One series per column of a months x categories array."""
+    return [_series(column) for column in values.T]
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator, NaN wherever the denominator is not positive."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def rolling_means(cents: np.ndarray, window: int, first_active: int) -> np.ndarray:
+    """
+    Trailing `window`-month mean for every row from LEAD_MONTHS on, taken from
+    one cumulative sum. Months before `first_active` (before the user had any
+    data) are left out of the average instead of counting as zero spend.
+    """
+    cumulative = np.vstack([
+        np.zeros((1, cents.shape[1])),
+        np.cumsum(cents, axis=0, dtype=np.float64),
+    ])
+    end = np.arange(LEAD_MONTHS, cents.shape[0]) + 1
+    start = np.maximum(end - window, first_active)
+    counts = (end - start)[:, None].astype(np.float64)
+    sums = cumulative[end] - cumulative[start]
+    return _safe_divide(sums, np.broadcast_to(counts, sums.shape))
+
+
+class AnalyticsService:
+    """
+    Chart-ready spending trends for one budget, computed from the monthly
+    rollup as whole-array operations over a months x categories matrix.
+    """
+
+    @staticmethod
+    def get_budget_analytics(
+        db: Session,
+        user_id: int,
+        budget_id: int,
+        month: Optional[str] = None,
+        months: int = 12
+    ) -> Dict:
+        month = month or datetime.utcnow().strftime("%Y-%m")
+        key = (user_id, budget_id, month, months, get_data_version(db, user_id))
+
+        cached = analytics_cache.get(key)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        result = AnalyticsService._compute(db, user_id, budget_id, month, months)
+        analytics_cache.set(key, result, time.time() + settings.ANALYTICS_CACHE_TTL_SECONDS)
+        logger.debug("Analytics computed: user_id=%s budget_id=%s months=%s in %.1fms",
+                     user_id, budget_id, months, (time.perf_counter() - started) * 1000)
+        return result
+
+    @staticmethod
+    def _compute(db: Session, user_id: int, budget_id: int, month: str, months: int) -> Dict:
+        budget = db.query(Budget).filter(
+            Budget.id == budget_id,
+            Budget.user_id == user_id
+        ).first()
+
+        if not budget:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Budget not found"
+            )
+
+        allocations = (
+            db.query(Category.id, Category.name, Allocation.allocated_amount)
+            .join(Allocation, Allocation.category_id == Category.id)
+            .filter(
+                Allocation.budget_id == budget_id,
+                Category.user_id == user_id,
+            )
+            .order_by(Category.id)
+            .all()
+        )
+
+        # Both sorted, so rows map to matrix cells with searchsorted
+        month_range = trailing_months(month, months + LEAD_MONTHS)
+        category_ids = [category_id for category_id, _, _ in allocations]
+
+        # The whole history in one grouped read of the rollup, in integer cents
+        rows = (
+            db.query(
+                CategoryMonthTotal.category_id,
+                CategoryMonthTotal.month,
+                (CategoryMonthTotal.spent + CategoryMonthTotal.withdrawn).label("cents"),
+            )
+            .filter(
+                CategoryMonthTotal.user_id == user_id,
+                CategoryMonthTotal.category_id.in_(category_ids),
+                CategoryMonthTotal.month.in_(month_range),
+            )
+            .all()
+        ) if category_ids else []
+
+        cents = np.zeros((len(month_range), len(category_ids)), dtype=np.int64)
+        if rows:
+            row_categories, row_months, row_cents = zip(*rows)
+            cents[
+                np.searchsorted(month_range, row_months),
+                np.searchsorted(category_ids, row_categories),
+            ] = row_cents
+
+        allocated = np.array(
+            [float(amount) for _, _, amount in allocations], dtype=np.float64)
+        spent = cents / 100.0
+        totals = spent.sum(axis=1)
+
+        active = np.flatnonzero(cents.any(axis=1))
+        first_active = int(active[0]) if active.size else len(month_range)
+
+        shown = slice(LEAD_MONTHS, None)
+        previous = slice(LEAD_MONTHS - 1, -1)
+
+        category_delta = spent[shown] - spent[previous]
+        total_delta = totals[shown] - totals[previous]
+        rolling = {window: rolling_means(spent, window, first_active) for window in ROLLING_WINDOWS}
+        total_rolling = {
+            window: rolling_means(totals[:, None], window, first_active)[:, 0]
+            for window in ROLLING_WINDOWS
+        }
+
+        category_series = {
+            "spent": _columns(spent[shown]),
+            "mom_delta": _columns(category_delta),
+            "mom_change_percent": _columns(_safe_divide(category_delta, spent[previous]) * 100),
+            "share_percent": _columns(
+                _safe_divide(spent[shown], np.broadcast_to(totals[shown, None], spent[shown].shape)) * 100),
+            "utilization_percent": _columns(
+                _safe_divide(spent[shown], np.broadcast_to(allocated, spent[shown].shape)) * 100),
+            "rolling_average": {
+                str(window): _columns(values) for window, values in rolling.items()},
+        }
+
+        total_allocated = allocated.sum()
+        return {
+            "budget": {
+                "id": budget.id,
+                "name": budget.name,
+                "type": budget.type,
+                "amount": float(budget.amount),
+            },
+            "months": month_range[LEAD_MONTHS:],
+            "categories": [
+                {
+                    "id": category_id,
+                    "name": name,
+                    "allocated_amount": float(amount),
+                    "spent": category_series["spent"][i],
+                    "mom_delta": category_series["mom_delta"][i],
+                    "mom_change_percent": category_series["mom_change_percent"][i],
+                    "share_percent": category_series["share_percent"][i],
+                    "utilization_percent": category_series["utilization_percent"][i],
+                    "rolling_average": {
+                        window: series[i]
+                        for window, series in category_series["rolling_average"].items()
+                    },
+                }
+                for i, (category_id, name, amount) in enumerate(allocations)
+            ],
+            "total": {
+                "allocated_amount": float(total_allocated),
+                "spent": _series(totals[shown]),
+                "mom_delta": _series(total_delta),
+                "mom_change_percent": _series(_safe_divide(total_delta, totals[previous]) * 100),
+                "utilization_percent": _series(
+                    _safe_divide(totals[shown], np.full(months, total_allocated)) * 100),
+                "rolling_average": {
+                    str(window): _series(values) for window, values in total_rolling.items()},
+            },
+        }
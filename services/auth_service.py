@@ -4,7 +4,6 @@ from datetime import timedelta
 from typing import Optional
 
 from fastapi import HTTPException, status
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from services.user_service import UserService
@@ -12,20 +11,20 @@ from services.token_service import TokenService
 from schema.user import UserCreate
 
 from app.config import settings
+from core.passwords import password_hasher
+from core.user_cache import user_cache
 
 logger = logging.getLogger("app.auth_service")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class AuthService:
     @staticmethod
     def hash_password(password: str) -> str:
-        return pwd_context.hash(password)
+        return password_hasher.hash(password)
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+        return password_hasher.verify(plain_password, hashed_password)
 
     # ---------- Authentication ----------
     @staticmethod
@@ -33,12 +32,20 @@ class AuthService:
         """
         Return user if credentials are valid, otherwise None.
         (Preserves original logging and behavior.)
+        A valid password stored at a different bcrypt cost is rehashed in place.
         """
         user = UserService.get_user_by_email(db, email)
         if not user:
             return None
-        if not AuthService.verify_password(plain_password, user.hashed_password):
+        valid, new_hash = password_hasher.verify_and_update(
+            plain_password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            user.hashed_password = new_hash
+            db.commit()
+            user_cache.invalidate_user(user.id)
+            logger.info("Rehashed password at current bcrypt cost: user_id=%s", user.id)
         return user
 
     # ---------- Registration ----------
@@ -0,0 +1,156 @@
+import logging
+from typing import Callable, Dict, List, Tuple
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from schema.allocation import AllocationCreate, AllocationOut
+from schema.batch import BatchOperation
+from schema.expense import ExpenseCreate, ExpenseOut
+from schema.transfer import TransferCreate, TransferOut
+from schema.user import UserOut
+from services.allocation_service import AllocationService
+from services.budget_service import BudgetService
+from services.expense_service import ExpenseService
+from services.transfer_service import TransferService
+
+logger = logging.getLogger("app.batch")
+
+
+def _require(value, message: str):
+    if value is None:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=message)
+    return value
+
+
+def _owned_budget_id(db: Session, op: BatchOperation, current_user: UserOut) -> int:
+    budget_id = _require(op.budget_id, "budget_id is required for allocations")
+    if not BudgetService.get_budget_by_id(db=db, user_id=current_user.id, budget_id=budget_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget not Found")
+    return budget_id
+
+
+def _expense(db, op, user):
+    if op.op == "create":
+        return ExpenseService.create_expense(db, ExpenseCreate(**(op.data or {})), user)
+    if op.op == "update":
+        return ExpenseService.update_expense(
+            db, _require(op.id, "id is required"), ExpenseCreate(**(op.data or {})), user)
+    return ExpenseService.delete_expense(db, _require(op.id, "id is required"), user)
+
+
+def _withdrawal(db, op, user):
+    if op.op == "create":
+        return ExpenseService.create_withdrawal(db, ExpenseCreate(**(op.data or {})), user)
+    if op.op == "update":
+        return ExpenseService.update_withdrawal(
+            db, _require(op.id, "id is required"), ExpenseCreate(**(op.data or {})), user)
+    return ExpenseService.delete_withdrawal(db, _require(op.id, "id is required"), user)
+
+
+def _transfer(db, op, user):
+    if op.op == "create":
+        payload = TransferCreate(**(op.data or {}))
+        if payload.amount <= 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail="Transfer amount must be > 0")
+        return TransferService.create_transfer(db, payload, user)
+    if op.op == "delete":
+        return TransferService.delete_transfer(db, _require(op.id, "id is required"), user)
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Transfers cannot be updated; delete and recreate instead")
+
+
+def _allocation(db, op, user):
+    budget_id = _owned_budget_id(db, op, user)
+    if op.op == "create":
+        return AllocationService.add_allocation(
+            db=db, user_id=user.id, budget_id=budget_id, data=AllocationCreate(**(op.data or {})))
+    if op.op == "update":
+        return AllocationService.edit_allocation(
+            db=db, budget_id=budget_id, allocation=AllocationCreate(**(op.data or {})))
+    return AllocationService.delete_allocation(
+        db=db, budget_id=budget_id, allocation_id=_require(op.id, "id is required"))
+
+
+# resource -> (handler, response model for created/updated rows)
+HANDLERS: Dict[str, Tuple[Callable, type]] = {
+    "expense": (_expense, ExpenseOut),
+    "withdrawal": (_withdrawal, ExpenseOut),
+    "transfer": (_transfer, TransferOut),
+    "allocation": (_allocation, AllocationOut),
+}
+
+SUCCESS_STATUS = {
+    "create": status.HTTP_201_CREATED,
+    "update": status.HTTP_200_OK,
+    "delete": status.HTTP_204_NO_CONTENT,
+}
+
+
+class BatchService:
+    """
+    Applies an ordered list of operations through the single-row services,
+    all inside one database transaction.
+
+    The session joins an outer transaction in "create_savepoint" mode, so
+    the commit each service performs only releases a savepoint; nothing is
+    visible to other connections until every operation has succeeded.
+    """
+
+    @staticmethod
+    def run(db: Session, operations: List[BatchOperation], current_user: UserOut):
+        """(committed, results); stops at the first failing operation."""
+        results = []
+        committed = False
+
+        with db.get_bind().connect() as connection:
+            transaction = connection.begin()
+            if connection.dialect.name == "sqlite":
+                # pysqlite defers BEGIN until the first write, which would make
+                # the first savepoint the outer transaction and its release a commit
+                connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+            with Session(bind=connection, autoflush=False,
+                         join_transaction_mode="create_savepoint") as batch_db:
+                for index, op in enumerate(operations):
+                    handler, out_model = HANDLERS[op.resource]
+                    try:
+                        row = handler(batch_db, op, current_user)
+                    except HTTPException as exc:
+                        results.append({"index": index, "status": exc.status_code,
+                                        "detail": exc.detail})
+                        break
+                    except ValidationError as exc:
+                        results.append({
+                            "index": index,
+                            "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            "detail": exc.errors(include_url=False, include_context=False),
+                        })
+                        break
+                    except SQLAlchemyError:
+                        logger.exception("Batch operation %s failed", index)
+                        results.append({"index": index,
+                                        "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                                        "detail": "Database error"})
+                        break
+
+                    data = None
+                    if op.op != "delete":
+                        data = out_model.model_validate(row, from_attributes=True).model_dump(
+                            mode="json")
+                    results.append({"index": index, "status": SUCCESS_STATUS[op.op],
+                                    "data": data})
+                else:
+                    committed = True
+
+            if committed:
+                transaction.commit()
+            else:
+                transaction.rollback()
+
+        logger.info("Batch applied: user_id=%s operations=%s committed=%s",
+                    current_user.id, len(operations), committed)
+        return committed, results
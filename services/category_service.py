@@ -1,12 +1,14 @@
 import logging
+from collections import defaultdict
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 from fastapi import HTTPException, status
+from sqlalchemy import or_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from data.db.models.models import Allocation, Budget, Category, Expense, Transfer
+from data.db.models.models import Allocation, Budget, Category, CategoryMonthTotal, Expense, Transfer
+from data.db.types import ZERO
 from schema.category import CategoryAllocationCreate, CategoryBase
 from services.budget_service import BudgetService
 
@@ -75,7 +77,6 @@ class CategoryService:
             return []
 
         category_type = budget.type  # expense OR savings
-        # expense_type = "spend" if category_type == "expense" else "withdrawal"
         is_expense_budget = category_type == "expense"
 
         # Get allocations for this budget ONCE
@@ -100,62 +101,108 @@ class CategoryService:
             Category.id.in_(allocated_category_ids)
         ).all()
 
-        result = []
+        if not categories:
+            return []
 
-        def get_cat_name(category_id):
-            if not category_id:
-                return None
-            cat = db.query(Category).filter(
-                Category.id == category_id
-            ).first()
-            return cat.name if cat else None
+        category_ids = [category.id for category in categories]
 
-        for category in categories:
+        # Expenses (spend OR withdrawal depending on budget type)
+        # For savings budgets, withdrawals are already reflected
+        expense_type = "spend" if is_expense_budget else "withdrawal"
+        expense_filters = (
+            Expense.user_id == user_id,
+            Expense.category_id.in_(category_ids),
+            Expense.month == current_month,
+            Expense.type == expense_type
+        )
 
-            # Expenses (spend OR withdrawal depending on budget type)
-            if is_expense_budget:
-                expenses = db.query(Expense).filter(
-                    Expense.user_id == user_id,
-                    Expense.category_id == category.id,
-                    Expense.month == current_month,
-                    Expense.type == "spend"
-                ).all()
-
-                total_used = sum(Decimal(str(e.amount)) for e in expenses)
-
-            else:
-                # For savings budgets, withdrawals are already reflected
-                expenses = db.query(Expense).filter(
-                    Expense.user_id == user_id,
-                    Expense.category_id == category.id,
-                    Expense.month == current_month,
-                    Expense.type == "withdrawal"
-                ).all()
-                total_used = Decimal("0")
-
-            # Transfers
-            incoming = db.query(Transfer).filter(
-                Transfer.user_id == user_id,
-                Transfer.to_category_id == category.id,
-                Transfer.month == current_month
-            ).all()
+        # Totals come from the monthly rollup: one row per category
+        totals_map = {
+            totals.category_id: totals
+            for totals in db.query(CategoryMonthTotal).filter(
+                CategoryMonthTotal.user_id == user_id,
+                CategoryMonthTotal.month == current_month,
+                CategoryMonthTotal.category_id.in_(category_ids)
+            )
+        }
 
-            outgoing = db.query(Transfer).filter(
-                Transfer.user_id == user_id,
-                Transfer.from_category_id == category.id,
-                Transfer.month == current_month
-            ).all()
+        # Sorted here rather than with ORDER BY id, which would steer SQLite
+        # away from the (user_id, month, type, category_id) index
+        expenses_map = defaultdict(list)
+        for expense in sorted(
+            db.query(Expense).filter(*expense_filters).all(),
+            key=lambda e: e.id
+        ):
+            expenses_map[expense.category_id].append(expense)
+
+        transfer_filters = (
+            Transfer.user_id == user_id,
+            Transfer.month == current_month
+        )
+
+        transfers = sorted(
+            db.query(Transfer)
+            .filter(
+                *transfer_filters,
+                or_(
+                    Transfer.to_category_id.in_(category_ids),
+                    Transfer.from_category_id.in_(category_ids)
+                )
+            )
+            .all(),
+            key=lambda t: t.id
+        )
+
+        incoming_map = defaultdict(list)
+        outgoing_map = defaultdict(list)
+        for t in transfers:
+            if t.to_category_id in allocation_map:
+                incoming_map[t.to_category_id].append(t)
+            if t.from_category_id in allocation_map:
+                outgoing_map[t.from_category_id].append(t)
+
+        # Single name lookup for every category a transfer touches
+        referenced_ids = {
+            cid
+            for t in transfers
+            for cid in (t.from_category_id, t.to_category_id)
+            if cid
+        }
+        category_names = dict(
+            db.query(Category.id, Category.name)
+            .filter(Category.id.in_(referenced_ids))
+            .all()
+        ) if referenced_ids else {}
+
+        def transfer_stats(t):
+            return {
+                "id": t.id,
+                "user_id": t.user_id,
+                "created_at": t.created_at,
+                "updated_at": t.updated_at,
+                "amount": float(t.amount),
+                "description": t.description,
+                "month": t.month,
+                "from_category_id": t.from_category_id,
+                "to_category_id": t.to_category_id,
+                "from_category_name": category_names.get(t.from_category_id),
+                "to_category_name": category_names.get(t.to_category_id),
+            }
 
-            total_incoming = sum(Decimal(str(t.amount)) for t in incoming)
-            total_outgoing = sum(Decimal(str(t.amount)) for t in outgoing)
+        result = []
+
+        for category in categories:
+            expenses = expenses_map.get(category.id, [])
+            totals = totals_map.get(category.id)
+
+            total_used = totals.spent if is_expense_budget and totals else ZERO
+            total_incoming = totals.transfers_in if totals else ZERO
+            total_outgoing = totals.transfers_out if totals else ZERO
             net_transfers = total_incoming - total_outgoing
 
             # Allocation lookup (NO extra query)
             allocation = allocation_map.get(category.id)
-            allocated_amount = (
-                Decimal(str(allocation.allocated_amount))
-                if allocation else Decimal("0")
-            )
+            allocated_amount = allocation.allocated_amount if allocation else ZERO
 
             balance = (allocated_amount + net_transfers) - total_used
 
@@ -185,36 +232,10 @@ class CategoryService:
                 ],
                 "used": float(total_used),
                 "transfers_in": [
-                    {
-                        "id": t.id,
-                        "user_id": t.user_id,
-                        "created_at": t.created_at,
-                        "updated_at": t.updated_at,
-                        "amount": float(t.amount),
-                        "description": t.description,
-                        "month": t.month,
-                        "from_category_id": t.from_category_id,
-                        "to_category_id": t.to_category_id,
-                        "from_category_name": get_cat_name(t.from_category_id),
-                        "to_category_name": get_cat_name(t.to_category_id),
-                    }
-                    for t in incoming
+                    transfer_stats(t) for t in incoming_map.get(category.id, [])
                 ],
                 "transfers_out": [
-                    {
-                        "id": t.id,
-                        "user_id": t.user_id,
-                        "created_at": t.created_at,
-                        "updated_at": t.updated_at,
-                        "amount": float(t.amount),
-                        "description": t.description,
-                        "month": t.month,
-                        "from_category_id": t.from_category_id,
-                        "to_category_id": t.to_category_id,
-                        "from_category_name": get_cat_name(t.from_category_id),
-                        "to_category_name": get_cat_name(t.to_category_id),
-                    }
-                    for t in outgoing
+                    transfer_stats(t) for t in outgoing_map.get(category.id, [])
                 ],
                 "total_transfers_in": float(total_incoming),
                 "total_transfers_out": float(total_outgoing),
@@ -249,32 +270,26 @@ class CategoryService:
             Category.type == "savings"
         ).all()
 
+        totals_map = {
+            totals.category_id: totals
+            for totals in db.query(CategoryMonthTotal).filter(
+                CategoryMonthTotal.user_id == user_id,
+                CategoryMonthTotal.month == current_year_month
+            )
+        }
+
         result = []
 
         for category in categories:
-            incoming = db.query(Transfer).filter(
-                Transfer.user_id == user_id,
-                Transfer.to_category_id == category.id,
-                Transfer.month == current_year_month
-            ).all()
-
-            outgoing = db.query(Transfer).filter(
-                Transfer.user_id == user_id,
-                Transfer.from_category_id == category.id,
-                Transfer.month == current_year_month
-            ).all()
-
-            total_incoming = sum(Decimal(str(t.amount)) for t in incoming)
-            total_outgoing = sum(Decimal(str(t.amount)) for t in outgoing)
+            totals = totals_map.get(category.id)
+            total_incoming = totals.transfers_in if totals else ZERO
+            total_outgoing = totals.transfers_out if totals else ZERO
 
             allocation = db.query(Allocation).filter(
                 Allocation.category_id == category.id
             ).first()
 
-            allocated_amount = (
-                Decimal(str(allocation.allocated_amount))
-                if allocation else Decimal("0")
-            )
+            allocated_amount = allocation.allocated_amount if allocation else ZERO
 
             balance = allocated_amount + total_incoming - total_outgoing
 
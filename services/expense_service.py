@@ -1,6 +1,7 @@
 from decimal import Decimal
 import logging
 from datetime import datetime
+from typing import Optional
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
@@ -8,6 +9,8 @@ from sqlalchemy import and_
 from data.db.models.models import Allocation, Budget, Expense
 from schema.expense import ExpenseCreate
 from schema.user import UserOut
+from services.pagination import DEFAULT_PAGE_SIZE, keyset_page
+from services.rollup_service import RollupService
 from fastapi import HTTPException, status
 
 
@@ -16,19 +19,46 @@ logger = logging.getLogger("app.expenses")
 
 class ExpenseService:
     @staticmethod
-    def get_all_expenses(db: Session, current_user: UserOut):
-        expenses = db.query(Expense).filter(
-            Expense.user_id == current_user.id,
-            Expense.type == "spend"
-        ).all()
-
-        if not expenses:
+    def get_all_expenses(
+        db: Session,
+        current_user: UserOut,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        month_from: Optional[str] = None,
+        month_to: Optional[str] = None,
+        category_id: Optional[int] = None,
+        expense_type: Optional[str] = "spend",
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+    ):
+        """
+        One page of the user's expenses, newest first. expense_type=None
+        lists spends and withdrawals together.
+        """
+        query = db.query(Expense).filter(Expense.user_id == current_user.id)
+
+        if expense_type:
+            query = query.filter(Expense.type == expense_type)
+        if month_from:
+            query = query.filter(Expense.month >= month_from)
+        if month_to:
+            query = query.filter(Expense.month <= month_to)
+        if category_id is not None:
+            query = query.filter(Expense.category_id == category_id)
+        if min_amount is not None:
+            query = query.filter(Expense.amount >= min_amount)
+        if max_amount is not None:
+            query = query.filter(Expense.amount <= max_amount)
+
+        page = keyset_page(query, Expense, limit=limit, cursor=cursor)
+
+        if not page["items"] and not cursor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No expenses found for this user"
             )
 
-        return expenses
+        return page
 
     @staticmethod
     def get_current_month_expense(db: Session, current_user: UserOut):
@@ -126,6 +156,7 @@ class ExpenseService:
         )
 
         db.add(new_expense)
+        RollupService.record_expense(db, new_expense)
         db.commit()
         db.refresh(new_expense)
 
@@ -183,6 +214,7 @@ class ExpenseService:
             )
 
             db.add(db_withdrawal)
+            RollupService.record_expense(db, db_withdrawal)
 
             # Reduce Budget + Allocation
             budget.amount = Decimal(budget.amount) - amount
@@ -214,12 +246,14 @@ class ExpenseService:
                 detail="Expense not found or not yours"
             )
 
+        RollupService.record_expense(db, db_expense, -1)
         db_expense.category_id = expense.category_id
         db_expense.amount = expense.amount
         db_expense.description = expense.description
         db_expense.month = expense.month
         db_expense.type = expense.type
         db_expense.updated_at = datetime.utcnow()
+        RollupService.record_expense(db, db_expense)
 
         db.commit()
         db.refresh(db_expense)
@@ -273,10 +307,12 @@ class ExpenseService:
             )
 
             # Update withdrawal
+            RollupService.record_expense(db, db_withdrawal, -1)
             db_withdrawal.amount = new_amount
             db_withdrawal.description = withdrawal.description
             db_withdrawal.month = withdrawal.month
             db_withdrawal.updated_at = datetime.utcnow()
+            RollupService.record_expense(db, db_withdrawal)
 
             db.commit()
             db.refresh(db_withdrawal)
@@ -302,6 +338,7 @@ class ExpenseService:
                 detail="Expense not found or not yours"
             )
 
+        RollupService.record_expense(db, db_expense, -1)
         db.delete(db_expense)
         db.commit()
 
@@ -340,6 +377,7 @@ class ExpenseService:
                 Decimal(allocation.allocated_amount) + amount
             )
 
+            RollupService.record_expense(db, db_withdrawal, -1)
             db.delete(db_withdrawal)
             db.commit()
 
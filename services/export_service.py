@@ -0,0 +1,106 @@
+import logging
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, aliased
+
+from data.db.models.models import Category, Expense, Transfer
+
+logger = logging.getLogger("app.export")
+
+# Rows fetched per round trip; the export never holds more than this in memory
+EXPORT_BATCH_SIZE = 500
+
+# One column layout for every dataset so a ledger export is a single table
+EXPORT_COLUMNS = (
+    "kind", "id", "created_at", "month", "amount",
+    "category", "from_category", "to_category", "description",
+)
+
+
+def _amount(value) -> Optional[str]:
+    """Plain decimal string, e.g. 12.5 rather than 12.50 or 1.25E+1"""
+    if value is None:
+        return None
+    return format(value.normalize(), "f")
+
+
+class ExportService:
+    """
+    Streams a user's ledger as plain dicts in EXPORT_COLUMNS order.
+    Queries select only the exported columns and are read with yield_per,
+    so rows are fetched in batches instead of loading the whole ledger.
+    """
+
+    @staticmethod
+    def iter_expenses(db: Session, user_id: int, month_from: Optional[str] = None,
+                      month_to: Optional[str] = None) -> Iterator[Dict]:
+        stmt = (
+            select(
+                Expense.id, Expense.type, Expense.created_at, Expense.month,
+                Expense.amount, Expense.description, Category.name,
+            )
+            .outerjoin(Category, Category.id == Expense.category_id)
+            .where(Expense.user_id == user_id)
+        )
+        if month_from:
+            stmt = stmt.where(Expense.month >= month_from)
+        if month_to:
+            stmt = stmt.where(Expense.month <= month_to)
+        stmt = stmt.order_by(Expense.created_at, Expense.id)
+
+        for row in db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)):
+            yield {
+                "kind": row.type,
+                "id": row.id,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "month": row.month,
+                "amount": _amount(row.amount),
+                "category": row.name,
+                "from_category": None,
+                "to_category": None,
+                "description": row.description,
+            }
+
+    @staticmethod
+    def iter_transfers(db: Session, user_id: int, month_from: Optional[str] = None,
+                       month_to: Optional[str] = None) -> Iterator[Dict]:
+        source = aliased(Category)
+        target = aliased(Category)
+        stmt = (
+            select(
+                Transfer.id, Transfer.created_at, Transfer.month, Transfer.amount,
+                Transfer.description,
+                source.name.label("from_name"), target.name.label("to_name"),
+            )
+            .outerjoin(source, source.id == Transfer.from_category_id)
+            .outerjoin(target, target.id == Transfer.to_category_id)
+            .where(Transfer.user_id == user_id)
+        )
+        if month_from:
+            stmt = stmt.where(Transfer.month >= month_from)
+        if month_to:
+            stmt = stmt.where(Transfer.month <= month_to)
+        stmt = stmt.order_by(Transfer.created_at, Transfer.id)
+
+        for row in db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)):
+            yield {
+                "kind": "transfer",
+                "id": row.id,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "month": row.month,
+                "amount": _amount(row.amount),
+                "category": None,
+                "from_category": row.from_name,
+                "to_category": row.to_name,
+                "description": row.description,
+            }
+
+    @staticmethod
+    def iter_dataset(db: Session, dataset: str, user_id: int, month_from: Optional[str] = None,
+                     month_to: Optional[str] = None) -> Iterator[Dict]:
+        """`ledger` is every expense followed by every transfer."""
+        if dataset in ("ledger", "expenses"):
+            yield from ExportService.iter_expenses(db, user_id, month_from, month_to)
+        if dataset in ("ledger", "transfers"):
+            yield from ExportService.iter_transfers(db, user_id, month_from, month_to)
@@ -0,0 +1,214 @@
+import calendar
+import logging
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import Integer, func, type_coerce
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from core.cache import ExpiringLRUCache
+from data.db.models.models import Expense
+
+logger = logging.getLogger("app.forecast")
+
+MAX_DAYS = 31
+# Until the history says this share of a month's spend is usually in,
+# the curve is too flat to extrapolate from and the run rate is used instead
+MIN_CURVE_FRACTION = 0.1
+
+# Curves only read completed months, so writes to the current month don't
+# stale them; edits to past months show up once the entry expires
+curve_cache = ExpiringLRUCache(max_size=settings.FORECAST_CACHE_MAX_SIZE)
+
+
+def months_before(month: str, count: int) -> List[str]:
+    """The `count` YYYY-MM strings before `month`, oldest first"""
+    year, month_number = (int(part) for part in month.split("-"))
+    index = year * 12 + month_number - 1
+    return [
+        f"{(index - offset) // 12:04d}-{(index - offset) % 12 + 1:02d}"
+        for offset in range(count, 0, -1)
+    ]
+
+
+def elapsed_days(month: str, today: date) -> int:
+    """Days of `month` that are over as of `today`: 0 for a future month, all for a past one"""
+    year, month_number = (int(part) for part in month.split("-"))
+    days_in_month = calendar.monthrange(year, month_number)[1]
+    if (today.year, today.month) < (year, month_number):
+        return 0
+    if (today.year, today.month) > (year, month_number):
+        return days_in_month
+    return today.day
+
+
+class ForecastService:
+    """
+    End-of-month spend projections for a set of categories, extrapolated
+    along each category's usual day-of-month spend curve.
+    """
+
+    @staticmethod
+    def get_spend_curves(db: Session, user_id: int, month: str) -> Dict:
+        """
+        Cumulative share of a month's spend that is usually in by the end of
+        each day, per category, averaged over the completed months before
+        `month`. Returns {"category_ids": [...], "curves": categories x 31}.
+        """
+        key = (user_id, month)
+        cached = curve_cache.get(key)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        curves = ForecastService._compute_curves(db, user_id, month)
+        curve_cache.set(key, curves, time.time() + settings.FORECAST_CURVE_TTL_SECONDS)
+        logger.debug("Spend curves computed: user_id=%s month=%s categories=%s in %.1fms",
+                     user_id, month, len(curves["category_ids"]),
+                     (time.perf_counter() - started) * 1000)
+        return curves
+
+    @staticmethod
+    def _compute_curves(db: Session, user_id: int, month: str) -> Dict:
+        history = months_before(month, settings.FORECAST_HISTORY_MONTHS)
+
+        # Spend per (category, month, day of created_at), in integer cents
+        rows = (
+            db.query(
+                Expense.category_id,
+                Expense.month,
+                func.extract("year", Expense.created_at),
+                func.extract("month", Expense.created_at),
+                func.extract("day", Expense.created_at),
+                func.sum(type_coerce(Expense.amount, Integer)),
+            )
+            .filter(
+                Expense.user_id == user_id,
+                Expense.category_id.isnot(None),
+                Expense.month.in_(history),
+            )
+            .group_by(
+                Expense.category_id,
+                Expense.month,
+                func.extract("year", Expense.created_at),
+                func.extract("month", Expense.created_at),
+                func.extract("day", Expense.created_at),
+            )
+            .all()
+        )
+        if not rows:
+            return {"category_ids": [], "curves": np.zeros((0, MAX_DAYS))}
+
+        category, expense_month, year, created_month, day, cents = (
+            np.array(column) for column in zip(*rows))
+        expense_month = expense_month.astype(str)
+        # Backdated or imported expenses carry no day-of-month signal
+        recorded = np.char.add(
+            np.char.zfill(year.astype(int).astype(str), 4),
+            np.char.add("-", np.char.zfill(created_month.astype(int).astype(str), 2)),
+        )
+        keep = recorded == expense_month
+
+        category_ids, category_index = np.unique(category[keep], return_inverse=True)
+        daily = np.zeros((len(category_ids), len(history), MAX_DAYS), dtype=np.int64)
+        np.add.at(daily, (
+            category_index,
+            np.searchsorted(history, expense_month[keep]),
+            day[keep].astype(int) - 1,
+        ), cents[keep].astype(np.int64))
+
+        cumulative = np.cumsum(daily, axis=2)
+        totals = cumulative[:, :, -1:]
+        observed = totals[:, :, 0] > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shares = np.where(totals > 0, cumulative / totals, 0.0)
+        # Mean over the months each category actually had spend in
+        counts = observed.sum(axis=1)
+        curves = shares.sum(axis=1) / np.maximum(counts, 1)[:, None]
+
+        return {
+            "category_ids": category_ids[counts > 0].tolist(),
+            "curves": curves[counts > 0],
+        }
+
+    @staticmethod
+    def project(
+        db: Session,
+        user_id: int,
+        month: str,
+        category_ids: Sequence[int],
+        allocated: Sequence[float],
+        spent: Sequence[float],
+        today: Optional[date] = None
+    ) -> Dict:
+        """
+        Project `spent` (so far this month) to the end of `month` for every
+        category at once. Returns {"summary": {...}, "allocations": [...]},
+        the latter in `category_ids` order.
+        """
+        today = today or datetime.utcnow().date()
+        year, month_number = (int(part) for part in month.split("-"))
+        days_in_month = calendar.monthrange(year, month_number)[1]
+        elapsed = elapsed_days(month, today)
+
+        allocated = np.asarray(allocated, dtype=np.float64)
+        spent = np.asarray(spent, dtype=np.float64)
+
+        # Share of the month's spend in by each day: the run rate by default,
+        # the category's own history where there is enough of it
+        days = np.arange(1, days_in_month + 1)
+        curves = np.tile(days / days_in_month, (len(category_ids), 1))
+        method = np.full(len(category_ids), "run_rate", dtype=object)
+
+        history = ForecastService.get_spend_curves(db, user_id, month)
+        if history["category_ids"] and elapsed:
+            positions = {category_id: i for i, category_id in enumerate(history["category_ids"])}
+            rows = np.array([positions.get(category_id, -1) for category_id in category_ids], dtype=int)
+            known = rows >= 0
+            usable = known.copy()
+            usable[known] = history["curves"][rows[known], elapsed - 1] >= MIN_CURVE_FRACTION
+            known_curves = history["curves"][rows[usable]]
+            curves[usable] = known_curves[:, :days_in_month]
+            # Spend usually in on days this month doesn't have lands on its last day
+            curves[usable, -1] = known_curves[:, -1]
+            method[usable] = "history"
+
+        # Projected cumulative spend for each remaining day of the month
+        if elapsed:
+            path = spent[:, None] * curves[:, elapsed - 1:] / curves[:, elapsed - 1:elapsed]
+            first_day = elapsed
+        else:
+            path = np.repeat(spent[:, None], days_in_month, axis=1)
+            first_day = 1
+        projected = path[:, -1]
+
+        over = path > allocated[:, None] + 0.005
+        overrun = np.where(over.any(axis=1), over.argmax(axis=1) + first_day, 0)
+
+        burn_rate = spent / elapsed if elapsed else np.full(len(spent), np.nan)
+
+        rows = [
+            {
+                "burn_rate": None if np.isnan(burn_rate[i]) else round(float(burn_rate[i]), 2),
+                "projected_amount": round(float(projected[i]), 2),
+                "projected_remaining": round(float(allocated[i] - projected[i]), 2),
+                "overrun_date": (
+                    date(year, month_number, int(overrun[i])).isoformat() if overrun[i] else None),
+                "method": method[i],
+            }
+            for i in range(len(category_ids))
+        ]
+
+        return {
+            "summary": {
+                "as_of": today.isoformat(),
+                "days_elapsed": elapsed,
+                "days_in_month": days_in_month,
+                "projected_total": round(float(projected.sum()), 2),
+                "history_months": settings.FORECAST_HISTORY_MONTHS,
+            },
+            "allocations": rows,
+        }
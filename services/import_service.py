@@ -0,0 +1,255 @@
+import codecs
+import csv
+import logging
+import re
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from core.data_version import bump_data_version
+from data.db.models.models import Category, Expense
+from data.db.types import round_money
+from schema.expense import ExpenseCreate
+from schema.user import UserOut
+from services.rollup_service import RollupService
+
+logger = logging.getLogger("app.imports")
+
+# Rows validated and inserted per executemany round trip
+IMPORT_BATCH_SIZE = 500
+# Only the first errors are listed back; the rest are counted
+MAX_REPORTED_ERRORS = 100
+
+_OFX_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+
+
+class ImportRowError(Exception):
+    """A single source row that cannot become an expense."""
+
+
+def _parse_amount(raw: Optional[str]) -> Decimal:
+    # Rounded to cents up front so the rollup deltas summed below match the stored rows
+    try:
+        return round_money((raw or "").replace(",", "").strip())
+    except InvalidOperation:
+        raise ImportRowError(f"Invalid amount: {raw!r}")
+
+
+# (pattern, strptime format, characters parsed); time parts are ignored
+_DATE_FORMATS = (
+    (re.compile(r"^\d{4}-\d{2}$"), "%Y-%m", 7),
+    (re.compile(r"^\d{4}-\d{2}-\d{2}"), "%Y-%m-%d", 10),
+    (re.compile(r"^\d{2}/\d{2}/\d{4}$"), "%d/%m/%Y", 10),
+    (re.compile(r"^\d{8}"), "%Y%m%d", 8),  # OFX DTPOSTED
+)
+
+
+def _parse_month(raw: Optional[str]) -> str:
+    """YYYY-MM from a month, an ISO or DD/MM/YYYY date, or an OFX timestamp."""
+    value = (raw or "").strip()
+    for pattern, fmt, length in _DATE_FORMATS:
+        if pattern.match(value):
+            try:
+                return datetime.strptime(value[:length], fmt).strftime("%Y-%m")
+            except ValueError:
+                break
+    raise ImportRowError(f"Invalid date or month: {raw!r}")
+
+
+class ImportService:
+    """
+    Bulk expense import from CSV or OFX statements. The upload is parsed
+    as a stream, rows are validated and inserted in batches of
+    IMPORT_BATCH_SIZE, and everything that validates is committed in one
+    transaction. Rows that fail are reported back instead of aborting
+    the import.
+    """
+
+    @staticmethod
+    def iter_csv(stream: BinaryIO) -> Iterator[Tuple[int, Dict]]:
+        """
+        (line number, row) pairs. Expected columns: amount, month or date,
+        category or category_id, and optionally description.
+        """
+        reader = csv.DictReader(codecs.getreader("utf-8-sig")(stream))
+        if not reader.fieldnames:
+            return
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        for row in reader:
+            yield reader.line_num, row
+
+    @staticmethod
+    def iter_ofx(stream: BinaryIO) -> Iterator[Tuple[int, Dict]]:
+        """
+        (transaction number, row) pairs from the STMTTRN blocks of an
+        OFX/QFX statement. Debits become expenses; credits are rejected.
+        """
+        number = 0
+        transaction = None
+        for line in codecs.getreader("utf-8-sig")(stream, errors="replace"):
+            for closing, tag, value in _OFX_TAG.findall(line):
+                tag = tag.upper()
+                if tag == "STMTTRN":
+                    if not closing:
+                        number += 1
+                        transaction = {}
+                    elif transaction is not None:
+                        yield number, ImportService._ofx_row(transaction)
+                        transaction = None
+                elif transaction is not None and not closing:
+                    transaction[tag] = value.strip()
+
+    @staticmethod
+    def _ofx_row(transaction: Dict) -> Dict:
+        amount = transaction.get("TRNAMT", "").strip()
+        return {
+            "kind": "spend" if amount.startswith("-") else "credit",
+            "amount": amount.lstrip("-"),
+            "date": transaction.get("DTPOSTED"),
+            "description": transaction.get("NAME") or transaction.get("MEMO"),
+        }
+
+    @staticmethod
+    def category_lookup(db: Session, current_user: UserOut) -> Tuple[Dict[str, int], set]:
+        """Lower-cased name -> id for the user's categories, plus the set of ids."""
+        rows = db.query(Category.id, Category.name).filter(
+            Category.user_id == current_user.id).all()
+        return {name.strip().lower(): category_id for category_id, name in rows}, \
+            {category_id for category_id, _ in rows}
+
+    @staticmethod
+    def _to_expense(row: Dict, names: Dict[str, int], ids: set,
+                    default_category_id: Optional[int]) -> ExpenseCreate:
+        # Ledger exports and OFX rows carry a kind; only spends are imported
+        kind = (row.get("kind") or "spend").strip().lower()
+        if kind != "spend":
+            raise ImportRowError(f"{kind.capitalize()} rows are not imported")
+
+        amount = _parse_amount(row.get("amount"))
+        if amount <= 0:
+            raise ImportRowError("Amount must be > 0")
+
+        month = _parse_month(row.get("month") or row.get("date"))
+
+        category_id = None
+        if (row.get("category_id") or "").strip():
+            try:
+                category_id = int(row["category_id"])
+            except ValueError:
+                raise ImportRowError(f"Invalid category_id: {row['category_id']!r}")
+        elif (row.get("category") or "").strip():
+            category_id = names.get(row["category"].strip().lower())
+            if category_id is None:
+                raise ImportRowError(f"Unknown category: {row['category']!r}")
+        else:
+            category_id = default_category_id
+
+        if category_id is None:
+            raise ImportRowError("No category given and no default_category_id")
+        if category_id not in ids:
+            raise ImportRowError(f"Category {category_id} not found or not yours")
+
+        try:
+            return ExpenseCreate(
+                amount=amount,
+                month=month,
+                description=(row.get("description") or "").strip() or None,
+                category_id=category_id,
+            )
+        except ValidationError as exc:
+            raise ImportRowError(exc.errors()[0]["msg"])
+
+    @staticmethod
+    def import_expenses(
+        db: Session,
+        stream: BinaryIO,
+        file_format: str,
+        current_user: UserOut,
+        default_category_id: Optional[int] = None,
+    ):
+        names, ids = ImportService.category_lookup(db, current_user)
+        if default_category_id is not None and default_category_id not in ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Default category not found or not yours"
+            )
+
+        rows = ImportService.iter_ofx(stream) if file_format == "ofx" \
+            else ImportService.iter_csv(stream)
+
+        now = datetime.utcnow()
+        imported = 0
+        failed = 0
+        errors: List[Dict] = []
+        batch: List[Dict] = []
+        # (category_id, month) -> [amount, count], applied to the rollup once at the end
+        totals = defaultdict(lambda: [Decimal(0), 0])
+
+        def flush():
+            if batch:
+                db.execute(insert(Expense), batch)
+                batch.clear()
+
+        try:
+            for number, row in rows:
+                try:
+                    expense = ImportService._to_expense(
+                        row, names, ids, default_category_id)
+                except ImportRowError as exc:
+                    failed += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append({"row": number, "error": str(exc)})
+                    continue
+
+                batch.append({
+                    "user_id": current_user.id,
+                    "category_id": expense.category_id,
+                    "amount": expense.amount,
+                    "description": expense.description,
+                    "month": expense.month,
+                    "type": "spend",
+                    "created_at": now,
+                    "updated_at": now,
+                })
+                total = totals[(expense.category_id, expense.month)]
+                total[0] += expense.amount
+                total[1] += 1
+                imported += 1
+
+                if len(batch) >= IMPORT_BATCH_SIZE:
+                    flush()
+            flush()
+
+            for (category_id, month), (amount, count) in totals.items():
+                RollupService.apply(db, current_user.id, category_id, month,
+                                    spent=amount, spend_count=count)
+            # Core inserts bypass the flush hook that normally bumps the version
+            if imported:
+                bump_data_version(db, current_user.id)
+            db.commit()
+        except UnicodeDecodeError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File must be UTF-8 encoded"
+            )
+        except csv.Error as exc:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Malformed CSV: {exc}"
+            )
+        except SQLAlchemyError:
+            db.rollback()
+            raise
+
+        logger.info("Imported expenses: user_id=%s format=%s imported=%s failed=%s",
+                    current_user.id, file_format, imported, failed)
+        return {"imported": imported, "failed": failed, "errors": errors}
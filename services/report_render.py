@@ -0,0 +1,153 @@
+"""
+Report rendering, kept free of app, database and settings imports so it
+runs cheaply in the report process pool (see services/report_service.py).
+Every function takes the plain report dict built by ReportService.build_report.
+"""
+import csv
+import io
+from decimal import Decimal
+from typing import List
+
+# A4 in points; Courier keeps the text tables aligned without measuring glyphs
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+MARGIN = 48
+FONT_SIZE = 9
+LEADING = 12
+LINES_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // LEADING
+
+
+def _money(value) -> str:
+    return f"{Decimal(value):,.2f}"
+
+
+def category_rows(report: dict) -> List[list]:
+    """Category table: allocation, spend per month, transfers and what remains."""
+    months = len(report["months"])
+    rows = []
+    for category in report["categories"]:
+        total = sum(category["spent"], Decimal(0))
+        remaining = (category["allocated"] * months + category["transfers_in"]
+                     - category["transfers_out"] - total)
+        rows.append([
+            category["name"], category["allocated"], *category["spent"], total,
+            category["transfers_in"], category["transfers_out"], remaining,
+        ])
+    return rows
+
+
+def category_header(report: dict) -> List[str]:
+    spent = ["Spent"] if report["kind"] == "monthly" else report["months"]
+    return ["Category", "Allocated", *spent, "Total spent",
+            "Transfers in", "Transfers out", "Remaining"]
+
+
+def render_csv(report: dict) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["Budget", report["budget"]["name"]])
+    writer.writerow(["Period", report["period"]])
+    writer.writerow(["Generated", report["generated_at"]])
+    writer.writerow([])
+    writer.writerow(category_header(report))
+    writer.writerows(category_rows(report))
+    if report["expenses"]:
+        writer.writerow([])
+        writer.writerow(["Date", "Category", "Description", "Amount"])
+        writer.writerows(
+            [e["date"], e["category"], e["description"] or "", e["amount"]]
+            for e in report["expenses"]
+        )
+    # utf-8-sig so spreadsheet apps detect the encoding
+    return buffer.getvalue().encode("utf-8-sig")
+
+
+def _text_table(header: List[str], rows: List[list]) -> List[str]:
+    cells = [header] + [
+        [value if isinstance(value, str) else _money(value) for value in row]
+        for row in rows
+    ]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(header))]
+    lines = []
+    for row in cells:
+        lines.append("  ".join(
+            value.ljust(width) if i == 0 else value.rjust(width)
+            for i, (value, width) in enumerate(zip(row, widths))
+        ).rstrip())
+    lines.insert(1, "-" * len(lines[0]))
+    return lines
+
+
+def report_lines(report: dict) -> List[str]:
+    lines = [
+        report["title"],
+        f"Generated {report['generated_at']}",
+        "",
+        *_text_table(category_header(report), category_rows(report)),
+    ]
+    if report["expenses"]:
+        lines += ["", "Expenses", ""]
+        lines += _text_table(
+            ["Date", "Category", "Description", "Amount"],
+            [[e["date"], e["category"], (e["description"] or "")[:40], e["amount"]]
+             for e in report["expenses"]],
+        )
+    return lines
+
+
+def _pdf_text(line: str) -> str:
+    text = line.encode("latin-1", "replace").decode("latin-1")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def render_pdf(report: dict) -> bytes:
+    """
+    Text-only PDF 1.4: one Courier content stream per page. Wide annual
+    tables are set in a smaller size so twelve month columns fit.
+    """
+    lines = report_lines(report)
+    widest = max(len(line) for line in lines)
+    # Courier glyphs are 0.6em wide
+    font_size = min(FONT_SIZE, (PAGE_WIDTH - 2 * MARGIN) / (0.6 * widest))
+    leading = min(LEADING, font_size * 1.35)
+    per_page = int((PAGE_HEIGHT - 2 * MARGIN) // leading)
+    pages = [lines[i:i + per_page] for i in range(0, len(lines), per_page)] or [[]]
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>",
+    ]
+    page_refs = []
+    for page in pages:
+        stream = "BT /F1 {:.2f} Tf {:.2f} TL {} {} Td\n".format(
+            font_size, leading, MARGIN, PAGE_HEIGHT - MARGIN)
+        stream += "".join(f"({_pdf_text(line)}) Tj T*\n" for line in page) + "ET"
+        content = stream.encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (PAGE_WIDTH, PAGE_HEIGHT, len(objects)))
+        page_refs.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(page_refs), len(pages))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    out.writelines(b"%010d 00000 n \n" % offset for offset in offsets)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+              % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+RENDERERS = {"csv": render_csv, "pdf": render_pdf}
+
+
+def render_report(report: dict, file_format: str) -> bytes:
+    """Entry point submitted to the process pool."""
+    return RENDERERS[file_format](report)
@@ -0,0 +1,297 @@
+import logging
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import type_coerce
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from core.artifact_cache import ArtifactCache
+from core.data_version import get_data_version
+from data.db.models.models import Allocation, Budget, Category, CategoryMonthTotal, Expense
+from data.db.types import ZERO, Money
+from schema.report import ReportCreate
+from services.report_render import render_report
+
+logger = logging.getLogger("app.reports")
+
+MEDIA_TYPES = {"csv": "text/csv", "pdf": "application/pdf"}
+
+
+def period_months(period: str) -> List[str]:
+    """YYYY-MM -> that month; YYYY -> its twelve months."""
+    if len(period) == 7:
+        return [period]
+    return [f"{period}-{month:02d}" for month in range(1, 13)]
+
+
+class ReportService:
+    @staticmethod
+    def build_report(db: Session, user_id: int, budget_id: int, period: str) -> Dict:
+        """
+        Everything a report shows, as plain values the renderers (and the
+        process pool) can take: per-category spend per month from the
+        rollup, plus the month's expenses for monthly reports.
+        """
+        budget = db.query(Budget).filter(
+            Budget.id == budget_id,
+            Budget.user_id == user_id
+        ).first()
+
+        if not budget:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Budget not found"
+            )
+
+        months = period_months(period)
+        kind = "monthly" if len(months) == 1 else "annual"
+
+        allocations = (
+            db.query(Category.id, Category.name, Allocation.allocated_amount)
+            .join(Allocation, Allocation.category_id == Category.id)
+            .filter(
+                Allocation.budget_id == budget_id,
+                Category.user_id == user_id,
+            )
+            .order_by(Category.name)
+            .all()
+        )
+        category_ids = [category_id for category_id, _, _ in allocations]
+
+        totals = {
+            (row.category_id, row.month): row
+            for row in db.query(
+                CategoryMonthTotal.category_id,
+                CategoryMonthTotal.month,
+                type_coerce(
+                    CategoryMonthTotal.spent + CategoryMonthTotal.withdrawn, Money
+                ).label("spent"),
+                CategoryMonthTotal.transfers_in,
+                CategoryMonthTotal.transfers_out,
+            ).filter(
+                CategoryMonthTotal.user_id == user_id,
+                CategoryMonthTotal.category_id.in_(category_ids),
+                CategoryMonthTotal.month.in_(months),
+            )
+        } if category_ids else {}
+
+        categories = []
+        for category_id, name, allocated in allocations:
+            rows = [totals.get((category_id, month)) for month in months]
+            categories.append({
+                "name": name,
+                "allocated": allocated,
+                "spent": [row.spent if row else ZERO for row in rows],
+                "transfers_in": sum((row.transfers_in for row in rows if row), ZERO),
+                "transfers_out": sum((row.transfers_out for row in rows if row), ZERO),
+            })
+
+        expenses = []
+        if kind == "monthly" and category_ids:
+            expenses = [
+                {
+                    "date": created_at.strftime("%Y-%m-%d") if created_at else "",
+                    "category": category,
+                    "description": description,
+                    "amount": amount,
+                }
+                for created_at, category, description, amount in (
+                    db.query(Expense.created_at, Category.name,
+                             Expense.description, Expense.amount)
+                    .join(Category, Category.id == Expense.category_id)
+                    .filter(
+                        Expense.user_id == user_id,
+                        Expense.category_id.in_(category_ids),
+                        Expense.month == period,
+                    )
+                    .order_by(Expense.created_at, Expense.id)
+                )
+            ]
+
+        return {
+            "title": f"{kind.capitalize()} report: {budget.name}, {period}",
+            "budget": {"id": budget.id, "name": budget.name, "type": budget.type},
+            "period": period,
+            "kind": kind,
+            "months": months,
+            "generated_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC"),
+            "categories": categories,
+            "expenses": expenses,
+        }
+
+
+class ReportJobQueue:
+    """
+    In-process queue of report jobs. A small thread pool runs the jobs (the
+    database reads) off the request path, and rendering goes to a process
+    pool so building a large PDF never holds the GIL the API threads need.
+    Finished files land in the artifact cache under (user, budget, period,
+    data version), so repeat requests for unchanged data skip both.
+
+    Like the password hasher, submissions beyond workers + max_queue are
+    turned away with a 503 rather than left queueing.
+    """
+
+    def __init__(self, cache: ArtifactCache, thread_workers: int, process_workers: int,
+                 max_queue: int, max_jobs: int):
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(
+            max_workers=thread_workers, thread_name_prefix="reports")
+        self._process_workers = process_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._limit = thread_workers + max_queue
+        self._max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, dict]" = OrderedDict()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    @staticmethod
+    def artifact_name(user_id: int, budget_id: int, period: str, file_format: str,
+                      data_version: int) -> str:
+        return f"report-u{user_id}-b{budget_id}-{period}-v{data_version}.{file_format}"
+
+    def submit(self, bind: Engine, user_id: int, budget: Budget, request: ReportCreate,
+               data_version: int) -> dict:
+        slug = re.sub(r"[^a-z0-9]+", "-", budget.name.lower()).strip("-") or "budget"
+        job = {
+            "id": uuid.uuid4().hex,
+            "user_id": user_id,
+            "status": "queued",
+            "budget_id": request.budget_id,
+            "period": request.period,
+            "kind": "monthly" if len(request.period) == 7 else "annual",
+            "format": request.format,
+            "filename": f"bajeti-{slug}-{request.period}.{request.format}",
+            "created_at": datetime.utcnow(),
+            "finished_at": None,
+            "error": None,
+            "artifact": None,
+        }
+
+        name = self.artifact_name(
+            user_id, request.budget_id, request.period, request.format, data_version)
+        if self.cache.get(name):
+            job.update(status="done", artifact=name, finished_at=job["created_at"])
+            self._remember(job)
+            return job
+
+        with self._lock:
+            if self._pending >= self._limit:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many reports are being generated. Please try again shortly.",
+                    headers={"Retry-After": "5"},
+                )
+            self._pending += 1
+        self._remember(job)
+        self._executor.submit(self._run, bind, job)
+        return job
+
+    def _remember(self, job: dict) -> None:
+        with self._lock:
+            self._jobs[job["id"]] = job
+            # Forget the oldest finished jobs; their files stay cached
+            for job_id in [k for k, v in self._jobs.items() if v["finished_at"]]:
+                if len(self._jobs) <= self._max_jobs:
+                    break
+                del self._jobs[job_id]
+
+    def _run(self, bind: Engine, job: dict) -> None:
+        job["status"] = "running"
+        try:
+            # Version and data are read in one transaction, so the file is
+            # cached under the version it actually reflects
+            with Session(bind=bind) as db:
+                data_version = get_data_version(db, job["user_id"])
+                name = self.artifact_name(job["user_id"], job["budget_id"], job["period"],
+                                          job["format"], data_version)
+                if self.cache.get(name) is None:
+                    report = ReportService.build_report(
+                        db, job["user_id"], job["budget_id"], job["period"])
+                    self.cache.put(name, self._render(report, job["format"]))
+            job.update(status="done", artifact=name)
+            with self._lock:
+                self.completed += 1
+        except Exception as exc:
+            logger.exception("Report job %s failed", job["id"])
+            job.update(status="failed", error=getattr(exc, "detail", None) or "Report generation failed")
+            with self._lock:
+                self.failed += 1
+        finally:
+            job["finished_at"] = datetime.utcnow()
+            with self._lock:
+                self._pending -= 1
+
+    def _render(self, report: dict, file_format: str) -> bytes:
+        if self._process_workers <= 0:
+            return render_report(report, file_format)
+        with self._lock:
+            if self._pool is None:
+                # spawn: children start clean instead of inheriting the
+                # parent's threads and open database connections
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._process_workers,
+                    mp_context=multiprocessing.get_context("spawn"))
+            pool = self._pool
+        try:
+            return pool.submit(render_report, report, file_format).result()
+        except BrokenProcessPool:
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = None
+            raise
+
+    def get(self, job_id: str, user_id: int) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job if job and job["user_id"] == user_id else None
+
+    def artifact_path(self, job: dict) -> Optional[str]:
+        return self.cache.get(job["artifact"]) if job["artifact"] else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "jobs": len(self._jobs),
+                "pending": self._pending,
+                "limit": self._limit,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "process_workers": self._process_workers,
+                "artifacts": self.cache.stats(),
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+
+report_jobs = ReportJobQueue(
+    cache=ArtifactCache(
+        directory=settings.REPORT_CACHE_DIR
+        or os.path.join(tempfile.gettempdir(), "bajeti-reports"),
+        max_bytes=settings.REPORT_CACHE_MAX_BYTES,
+    ),
+    thread_workers=settings.REPORT_THREAD_WORKERS,
+    process_workers=settings.REPORT_PROCESS_WORKERS,
+    max_queue=settings.REPORT_MAX_QUEUE,
+    max_jobs=settings.REPORT_MAX_JOBS,
+)
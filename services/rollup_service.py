@@ -0,0 +1,118 @@
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from core.data_version import bump_data_version
+from data.db.models.models import CategoryMonthTotal, Expense, Transfer
+
+logger = logging.getLogger("app.rollups")
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+_UPSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+TOTAL_COLUMNS = (
+    "spent", "withdrawn", "transfers_in", "transfers_out",
+    "spend_count", "withdrawal_count",
+)
+
+# Recomputes every total from the source rows in one grouped pass
+REBUILD_SQL = """
+    INSERT INTO category_month_totals (
+        user_id, category_id, month, spent, withdrawn,
+        transfers_in, transfers_out, spend_count, withdrawal_count
+    )
+    SELECT user_id, category_id, month,
+           SUM(spent), SUM(withdrawn), SUM(transfers_in), SUM(transfers_out),
+           SUM(spend_count), SUM(withdrawal_count)
+    FROM (
+        SELECT user_id, category_id, month,
+               CASE WHEN type = 'withdrawal' THEN 0 ELSE amount END AS spent,
+               CASE WHEN type = 'withdrawal' THEN amount ELSE 0 END AS withdrawn,
+               0 AS transfers_in, 0 AS transfers_out,
+               CASE WHEN type = 'withdrawal' THEN 0 ELSE 1 END AS spend_count,
+               CASE WHEN type = 'withdrawal' THEN 1 ELSE 0 END AS withdrawal_count
+        FROM expenses
+        WHERE user_id IS NOT NULL AND category_id IS NOT NULL AND month IS NOT NULL {user_filter}
+        UNION ALL
+        SELECT user_id, to_category_id, month, 0, 0, amount, 0, 0, 0
+        FROM transfers
+        WHERE user_id IS NOT NULL AND to_category_id IS NOT NULL AND month IS NOT NULL {user_filter}
+        UNION ALL
+        SELECT user_id, from_category_id, month, 0, 0, 0, amount, 0, 0
+        FROM transfers
+        WHERE user_id IS NOT NULL AND from_category_id IS NOT NULL AND month IS NOT NULL {user_filter}
+    ) AS source_rows
+    GROUP BY user_id, category_id, month
+"""
+
+
+class RollupService:
+    """
+    Maintains category_month_totals alongside expense and transfer writes.
+    Every call executes inside the caller's transaction, so the totals
+    commit (or roll back) together with the row that changed them.
+    """
+
+    @staticmethod
+    def apply(db: Session, user_id: int, category_id: Optional[int], month: Optional[str], **deltas):
+        """Add `deltas` to one (user, category, month) row, creating it if needed."""
+        if user_id is None or category_id is None or month is None:
+            return
+
+        table = CategoryMonthTotal.__table__
+        insert = _UPSERTS[db.get_bind().dialect.name]
+        stmt = insert(table).values(
+            user_id=user_id,
+            category_id=category_id,
+            month=month,
+            **{column: deltas.get(column, 0) for column in TOTAL_COLUMNS}
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "category_id", "month"],
+            set_={column: table.c[column] + stmt.excluded[column] for column in deltas}
+        )
+        db.execute(stmt)
+
+    @staticmethod
+    def record_expense(db: Session, expense: Expense, sign: int = 1):
+        """Add (sign=1) or remove (sign=-1) one expense's contribution."""
+        amount = expense.amount * sign
+        if expense.type == "withdrawal":
+            deltas = {"withdrawn": amount, "withdrawal_count": sign}
+        else:
+            deltas = {"spent": amount, "spend_count": sign}
+        RollupService.apply(db, expense.user_id, expense.category_id, expense.month, **deltas)
+
+    @staticmethod
+    def record_transfer(db: Session, transfer: Transfer, sign: int = 1):
+        """Add (sign=1) or remove (sign=-1) one transfer's contribution."""
+        amount = transfer.amount * sign
+        RollupService.apply(
+            db, transfer.user_id, transfer.to_category_id, transfer.month, transfers_in=amount)
+        RollupService.apply(
+            db, transfer.user_id, transfer.from_category_id, transfer.month, transfers_out=amount)
+
+    @staticmethod
+    def rebuild(db: Session, user_id: Optional[int] = None) -> int:
+        """
+        Recompute the rollup from expenses and transfers, for one user or
+        everyone. Returns the number of rows written.
+        """
+        stale = db.query(CategoryMonthTotal)
+        params = {}
+        user_filter = ""
+        if user_id is not None:
+            stale = stale.filter(CategoryMonthTotal.user_id == user_id)
+            params["user_id"] = user_id
+            user_filter = "AND user_id = :user_id"
+
+        stale.delete(synchronize_session=False)
+        result = db.execute(text(REBUILD_SQL.format(user_filter=user_filter)), params)
+        bump_data_version(db, user_id)
+        db.commit()
+
+        logger.info("Rebuilt category_month_totals: user_id=%s rows=%s", user_id, result.rowcount)
+        return result.rowcount
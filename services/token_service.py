@@ -1,4 +1,5 @@
 # services/token_service.py
+import hashlib
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, Dict
@@ -6,9 +7,13 @@ from typing import Optional, Dict
 from jose import jwt, JWTError
 
 from app.config import settings
+from core.cache import ExpiringLRUCache
 
 logger = logging.getLogger("app.token_service")
 
+# sha256(token) -> verified payload, kept until the token's own exp
+_verified_tokens = ExpiringLRUCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
+
 
 class TokenService:
     @staticmethod
@@ -25,13 +30,35 @@ class TokenService:
 
     @staticmethod
     def decode_token(token: str) -> Optional[Dict]:
-        """Decode a JWT token and return its payload, or None if invalid."""
+        """
+        Decode a JWT token and return its payload, or None if invalid.
+        Verified tokens are cached by digest until they expire, so the
+        several checks made while serving one page verify the HMAC once.
+        """
+        if not token:
+            return None
+
+        digest = hashlib.sha256(token.encode()).digest()
+        cached = _verified_tokens.get(digest)
+        if cached is not None:
+            return dict(cached)
+
         try:
             payload = jwt.decode(token, settings.SECRET_KEY,
                                  algorithms=[settings.ALGORITHM])
             logger.debug(
                 "TokenService.decode_token: payload keys=%s", list(payload.keys()))
-            return payload
         except JWTError as e:
             logger.debug("TokenService.decode_token failed: %s", str(e))
             return None
+
+        # Tokens without exp are never cached; they would never expire here
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            _verified_tokens.set(digest, dict(payload), expires_at=exp)
+        return payload
+
+    @staticmethod
+    def cache_stats() -> Dict:
+        """Hit/miss counters of the verified-token cache"""
+        return _verified_tokens.stats()
@@ -1,11 +1,15 @@
 import logging
 from datetime import datetime
+from decimal import Decimal
+from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, or_
 
 from data.db.models.models import Transfer
 from schema.transfer import TransferCreate
 from schema.user import UserOut
+from services.pagination import DEFAULT_PAGE_SIZE, keyset_page
+from services.rollup_service import RollupService
 from fastapi import HTTPException, status
 
 
@@ -14,18 +18,46 @@ logger = logging.getLogger("app.transfers")
 
 class TransferService:
     @staticmethod
-    def get_all_transfers(db: Session, current_user: UserOut):
-        transfers = db.query(Transfer).filter(
-            Transfer.user_id == current_user.id
-        ).all()
-
-        if not transfers:
+    def get_all_transfers(
+        db: Session,
+        current_user: UserOut,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        month_from: Optional[str] = None,
+        month_to: Optional[str] = None,
+        category_id: Optional[int] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+    ):
+        """
+        One page of the user's transfers, newest first. category_id matches
+        either side of the transfer.
+        """
+        query = db.query(Transfer).filter(Transfer.user_id == current_user.id)
+
+        if month_from:
+            query = query.filter(Transfer.month >= month_from)
+        if month_to:
+            query = query.filter(Transfer.month <= month_to)
+        if category_id is not None:
+            query = query.filter(or_(
+                Transfer.from_category_id == category_id,
+                Transfer.to_category_id == category_id
+            ))
+        if min_amount is not None:
+            query = query.filter(Transfer.amount >= min_amount)
+        if max_amount is not None:
+            query = query.filter(Transfer.amount <= max_amount)
+
+        page = keyset_page(query, Transfer, limit=limit, cursor=cursor)
+
+        if not page["items"] and not cursor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No transfers found for this user"
             )
 
-        return transfers
+        return page
 
     @staticmethod
     def get_transfers_by_month(db: Session, month: str, current_user: UserOut):
@@ -60,6 +92,7 @@ class TransferService:
         )
 
         db.add(new_transfer)
+        RollupService.record_transfer(db, new_transfer)
         db.commit()
         db.refresh(new_transfer)
 
@@ -80,6 +113,7 @@ class TransferService:
                 detail="Transfer not found or not yours"
             )
 
+        RollupService.record_transfer(db, db_transfer, -1)
         db.delete(db_transfer)
         db.commit()
 
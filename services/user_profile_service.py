@@ -3,6 +3,7 @@ from datetime import datetime
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from core.user_cache import user_cache
 from services.user_service import UserService
 from services.auth_service import AuthService
 from schema.user import UserUpdate, PasswordResetRequest
@@ -51,6 +52,7 @@ class UserProfileService:
         db.add(user)
         db.commit()
         db.refresh(user)
+        user_cache.invalidate_user(user.id)
         return user
 
     # ----------------- Reset Password -----------------
@@ -83,4 +85,5 @@ class UserProfileService:
         user.updated_at = datetime.utcnow()
 
         db.commit()
+        user_cache.invalidate_user(user.id)
         return {"message": "Password reset successful"}
@@ -2,9 +2,11 @@
 # ruff: noqa: I001
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from data.db.db import Base, get_db
+from sqlalchemy.pool import NullPool
+from data.db.db import Base, get_async_db, get_db
 from main import app
 
 # database url
@@ -32,7 +34,26 @@ def override_get_db():
         db.close()
 
 
+# TestClient runs each request on a fresh event loop, so don't pool async connections
+async_engine = create_async_engine(
+    "sqlite+aiosqlite:///./test.db",
+    connect_args={"check_same_thread": False},
+    poolclass=NullPool,
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
 
 # configure the test databases
 
@@ -49,3 +70,30 @@ def setup_database():
 @pytest.fixture()
 def client():
     return TestClient(app)
+
+
+@pytest.fixture()
+def db_engine():
+    """Engine behind the overridden get_db (import it from here, not the module)."""
+    return engine
+
+
+@pytest.fixture()
+def async_db_engine():
+    """Async engine behind the overridden get_async_db."""
+    return async_engine
+
+
+@pytest.fixture()
+def sql_statements():
+    """Record every SQL statement issued against the test database."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    for bind in (engine, async_engine.sync_engine):
+        event.listen(bind, "before_cursor_execute", record)
+    yield statements
+    for bind in (engine, async_engine.sync_engine):
+        event.remove(bind, "before_cursor_execute", record)
@@ -0,0 +1,97 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def test_budget_overview_sums_current_month(auth_headers, allocated_budget):
+    """Test overview reports spend per allocation for the requested month"""
+    budget_id, category_id = allocated_budget
+    for amount, month in ((40, "2031-03"), (15, "2031-03"), (99, "2031-02")):
+        client.post("/api/expenses/", json={
+            "category_id": category_id, "amount": amount, "month": month
+        }, headers=auth_headers)
+
+    response = client.get(
+        f"/api/budgets/{budget_id}/allocations/overview?month=2031-03",
+        headers=auth_headers)
+    assert response.status_code == 200
+
+    data = response.json()
+    allocation = data["allocations"][0]
+    assert allocation["used_amount"] == 55
+    assert allocation["remaining_amount"] == 145
+    assert data["summary"]["total_spent"] == 55
+    assert "history" not in data
+
+
+def test_budget_overview_month_matrix(auth_headers, allocated_budget):
+    """Test multi-month mode returns a month x category matrix"""
+    budget_id, category_id = allocated_budget
+    for amount, month in ((10, "2031-12"), (20, "2032-01"), (5, "2032-01")):
+        client.post("/api/expenses/", json={
+            "category_id": category_id, "amount": amount, "month": month
+        }, headers=auth_headers)
+
+    response = client.get(
+        f"/api/budgets/{budget_id}/allocations/overview?month=2032-01&months=3",
+        headers=auth_headers)
+    assert response.status_code == 200
+
+    history = response.json()["history"]
+    assert history["months"] == ["2031-11", "2031-12", "2032-01"]
+    assert history["category_ids"] == [category_id]
+    assert history["matrix"] == [[0], [10], [25]]
+    assert history["totals"] == [0, 10, 25]
+
+
+def test_budget_overview_invalid_month(auth_headers, allocated_budget):
+    """Test overview rejects malformed months"""
+    budget_id, _ = allocated_budget
+    response = client.get(
+        f"/api/budgets/{budget_id}/allocations/overview?month=2031-13",
+        headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_budget_overview_not_found(auth_headers):
+    """Test overview of a missing budget"""
+    response = client.get(
+        "/api/budgets/999/allocations/overview", headers=auth_headers)
+    assert response.status_code == 404
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    client.post("/api/auth/", json={
+        "first_name": "Allocation",
+        "last_name": "Test",
+        "email": "allocation_test@example.com",
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": "allocation_test@example.com",
+        "password": "testpass123"
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def allocated_budget(auth_headers):
+    """Create a budget with a single allocated category"""
+    budget = client.post("/api/budgets/", json={
+        "name": f"Overview {uuid.uuid4().hex[:8]}", "amount": 500
+    }, headers=auth_headers).json()
+    category = client.post("/api/categories/category_allocation", json={
+        "name": f"Overview Category {uuid.uuid4().hex[:8]}",
+        "budget_id": budget["id"],
+        "amount": 200
+    }, headers=auth_headers).json()
+    return budget["id"], category["id"]
@@ -0,0 +1,123 @@
+import uuid
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from services.analytics_service import LEAD_MONTHS, analytics_cache, rolling_means
+
+client = TestClient(app)
+
+
+def spend(headers, category_id, amount, month):
+    client.post("/api/expenses/", json={
+        "category_id": category_id, "amount": amount, "month": month}, headers=headers)
+
+
+def test_analytics_series(auth_headers, budget):
+    """Test spend, deltas, rolling averages, share and utilization per month"""
+    budget_id, (food, rent) = budget
+    spend(auth_headers, food, 100, "2032-01")
+    spend(auth_headers, food, 50, "2032-02")
+    spend(auth_headers, food, 150, "2032-03")
+    spend(auth_headers, rent, 50, "2032-03")
+
+    response = client.get(f"/api/analytics/{budget_id}?month=2032-03&months=3",
+                          headers=auth_headers)
+    assert response.status_code == 200
+    assert "etag" in response.headers
+    data = response.json()
+
+    assert data["months"] == ["2032-01", "2032-02", "2032-03"]
+    food_series, rent_series = data["categories"]
+    assert food_series["spent"] == [100, 50, 150]
+    assert food_series["mom_delta"] == [100, -50, 100]
+    # No change percentage from an empty month
+    assert food_series["mom_change_percent"] == [None, -50, 200]
+    # Averages only cover months since the first recorded spend
+    assert food_series["rolling_average"]["3"] == [100, 75, 100]
+    assert food_series["rolling_average"]["12"] == [100, 75, 100]
+    assert food_series["share_percent"] == [100, 100, 75]
+    assert rent_series["share_percent"] == [0, 0, 25]
+    assert food_series["utilization_percent"] == [100, 50, 150]
+
+    assert data["total"]["spent"] == [100, 50, 200]
+    assert data["total"]["allocated_amount"] == 200
+    assert data["total"]["utilization_percent"] == [50, 25, 100]
+
+
+def test_analytics_cached_per_data_version(auth_headers, budget):
+    """Test repeat reads hit the cache and a write recomputes"""
+    budget_id, (food, _) = budget
+    spend(auth_headers, food, 10, "2032-05")
+    url = f"/api/analytics/{budget_id}?month=2032-05&months=1"
+
+    first = client.get(url, headers=auth_headers).json()
+    hits = analytics_cache.stats()["hits"]
+    assert client.get(url, headers=auth_headers).json() == first
+    assert analytics_cache.stats()["hits"] == hits + 1
+
+    spend(auth_headers, food, 5, "2032-05")
+    assert client.get(url, headers=auth_headers).json()["total"]["spent"] == [15]
+
+
+def test_analytics_unknown_budget(auth_headers):
+    """Test another user's or a missing budget is a 404"""
+    response = client.get("/api/analytics/999999", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_rolling_means_skip_months_before_history():
+    """Test the cumulative-sum window matches a direct mean"""
+    cents = np.zeros((LEAD_MONTHS + 4, 1))
+    cents[LEAD_MONTHS - 2:, 0] = [4, 8, 6, 2, 10, 12]
+    means = rolling_means(cents, 3, first_active=LEAD_MONTHS - 2)[:, 0]
+    assert means.tolist() == [6, 16 / 3, 6, 8]
+
+
+def test_analytics_page_renders(auth_headers, budget):
+    """Test the analytics page renders the chart data for the chosen budget"""
+    budget_id, _ = budget
+    token = auth_headers["Authorization"].split()[1]
+    response = client.get(f"/analytics?budget_id={budget_id}&months=6",
+                          cookies={"access_token": token})
+    assert response.status_code == 200
+    assert "Analytics Food" in response.text
+    assert 'id="analyticsData"' in response.text
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    email = f"analytics_{uuid.uuid4().hex[:8]}@example.com"
+    client.post("/api/auth/", json={
+        "first_name": "Ana",
+        "last_name": "Lytics",
+        "email": email,
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": email,
+        "password": "testpass123"
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def budget(auth_headers):
+    """A budget with two categories allocated 100 each; returns (budget_id, category_ids)"""
+    budget = client.post("/api/budgets/", json={
+        "name": "Analytics", "amount": 1000
+    }, headers=auth_headers).json()
+    category_ids = tuple(
+        client.post("/api/categories/category_allocation", json={
+            "name": f"Analytics {name}",
+            "budget_id": budget["id"],
+            "amount": 100
+        }, headers=auth_headers).json()["id"]
+        for name in ("Food", "Rent")
+    )
+    return budget["id"], category_ids
@@ -1,7 +1,13 @@
+import threading
+
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 import pytest
+from sqlalchemy import text
 from unittest.mock import Mock
 
+from core import passwords
+from core.passwords import PasswordHasher, calibrate_rounds, configure_rounds, pwd_context, startup_rounds
 from main import app
 
 client = TestClient(app)
@@ -176,3 +182,159 @@ def test_create_user_missing_fields():
 
     response = client.post("/api/auth/", json=incomplete_payload)
     assert response.status_code == 422  # Validation error
+
+
+def test_decode_token_cached():
+    """Test a verified token is served from the cache on repeat checks"""
+    from datetime import timedelta
+    from services.token_service import TokenService
+
+    token = TokenService.create_access_token(
+        {"sub": "cache@example.com", "user_id": 1}, timedelta(minutes=5))
+    before = TokenService.cache_stats()
+
+    first = TokenService.decode_token(token)
+    second = TokenService.decode_token(token)
+
+    after = TokenService.cache_stats()
+    assert first == second
+    assert first["sub"] == "cache@example.com"
+    assert after["misses"] == before["misses"] + 1
+    assert after["hits"] == before["hits"] + 1
+
+
+def test_decode_token_cache_honours_exp(monkeypatch):
+    """Test an expired token is rejected even after being cached"""
+    import time
+    from datetime import datetime, timedelta
+    from types import SimpleNamespace
+
+    import jose.jwt
+
+    from core import cache
+    from services.token_service import TokenService
+
+    token = TokenService.create_access_token(
+        {"sub": "expiring@example.com", "user_id": 1}, timedelta(seconds=1))
+    assert TokenService.decode_token(token) is not None
+
+    # Move both clocks past exp: the cache's and the one jose validates with
+    class Later(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(seconds=10)
+
+    later = time.time() + 10
+    monkeypatch.setattr(cache, "time", SimpleNamespace(time=lambda: later))
+    monkeypatch.setattr(jose.jwt, "datetime", Later)
+    assert TokenService.decode_token(token) is None
+
+
+def test_decode_token_tampered():
+    """Test a modified token does not hit the cache of the original"""
+    from datetime import timedelta
+    from services.token_service import TokenService
+
+    token = TokenService.create_access_token(
+        {"sub": "tamper@example.com", "user_id": 1}, timedelta(minutes=5))
+    assert TokenService.decode_token(token) is not None
+    assert TokenService.decode_token(token[:-2] + "xx") is None
+
+
+@pytest.fixture
+def bcrypt_policy():
+    """Restore the bcrypt cost policy after a test changes it"""
+    snapshot = pwd_context.to_dict()
+    yield
+    pwd_context.load(snapshot)
+
+
+def stored_hash(db_engine, email):
+    with db_engine.connect() as connection:
+        return connection.execute(
+            text("SELECT hashed_password FROM users WHERE email = :email"),
+            {"email": email}).scalar()
+
+
+def test_login_rehashes_password_at_new_cost(bcrypt_policy, db_engine):
+    """Test login transparently upgrades a hash stored at another bcrypt cost"""
+    configure_rounds(4)
+    client.post("/api/auth/", json={
+        "first_name": "Re",
+        "last_name": "Hash",
+        "email": "rehash@example.com",
+        "password": "rehashpass123",
+        "security_answer": "Answer"
+    })
+    assert stored_hash(db_engine, "rehash@example.com").startswith("$2b$04$")
+
+    configure_rounds(5)
+    response = client.post("/api/auth/token", data={
+        "username": "rehash@example.com",
+        "password": "rehashpass123"
+    })
+    assert response.status_code == 200
+    assert stored_hash(db_engine, "rehash@example.com").startswith("$2b$05$")
+
+    # The upgraded hash still logs in
+    response = client.post("/api/auth/token", data={
+        "username": "rehash@example.com",
+        "password": "rehashpass123"
+    })
+    assert response.status_code == 200
+
+
+def test_login_never_downgrades_hash_cost(bcrypt_policy, db_engine):
+    """Test a lower configured cost leaves stronger stored hashes alone"""
+    configure_rounds(5)
+    client.post("/api/auth/", json={
+        "first_name": "Strong",
+        "last_name": "Hash",
+        "email": "stronghash@example.com",
+        "password": "strongpass123",
+        "security_answer": "Answer"
+    })
+
+    configure_rounds(4)
+    response = client.post("/api/auth/token", data={
+        "username": "stronghash@example.com",
+        "password": "strongpass123"
+    })
+    assert response.status_code == 200
+    assert stored_hash(db_engine, "stronghash@example.com").startswith("$2b$05$")
+
+
+def test_startup_rounds_fixed_in_production(monkeypatch):
+    """Test production falls back to a fixed cost instead of calibrating, and a pinned cost always wins"""
+    monkeypatch.setattr(passwords, "IS_PRODUCTION", True)
+    monkeypatch.setattr(passwords.settings, "BCRYPT_ROUNDS", None)
+    monkeypatch.setattr(passwords, "calibrate_rounds", lambda *args: pytest.fail("calibrated in production"))
+    assert startup_rounds() == 12
+
+    monkeypatch.setattr(passwords.settings, "BCRYPT_ROUNDS", 11)
+    assert startup_rounds() == 11
+
+
+def test_calibrate_rounds_stays_within_bounds():
+    """Test calibration never leaves the configured cost range"""
+    assert calibrate_rounds(target_ms=0, min_rounds=4, max_rounds=6) == 4
+    assert calibrate_rounds(target_ms=10_000_000, min_rounds=4, max_rounds=6) == 6
+
+
+def test_password_hasher_rejects_beyond_queue_limit():
+    """Test callers past workers + max_queue get a 503 instead of waiting"""
+    hasher = PasswordHasher(workers=1, max_queue=0)
+    release = threading.Event()
+    busy = threading.Thread(target=hasher._run, args=(release.wait,))
+    busy.start()
+    try:
+        while hasher.stats()["pending"] == 0:
+            release.wait(0.01)
+        with pytest.raises(HTTPException) as excinfo:
+            hasher.hash("password")
+        assert excinfo.value.status_code == 503
+        assert hasher.stats()["rejected"] == 1
+    finally:
+        release.set()
+        busy.join()
+        hasher.shutdown()
@@ -0,0 +1,115 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def test_batch_applies_operations_in_order(auth_headers, categories):
+    """Test a batch can create, update and delete across resources"""
+    budget_id, food, rent = categories
+    response = client.post("/api/batch/", headers=auth_headers, json={"operations": [
+        {"op": "create", "resource": "expense",
+         "data": {"category_id": food, "amount": 10, "month": "2034-01"}},
+        {"op": "create", "resource": "expense",
+         "data": {"category_id": rent, "amount": 99, "month": "2034-01"}},
+        {"op": "create", "resource": "transfer",
+         "data": {"from_category_id": food, "to_category_id": rent,
+                  "amount": 5, "month": "2034-01"}},
+        {"op": "update", "resource": "allocation", "budget_id": budget_id,
+         "data": {"category_id": food, "allocated_amount": 250}},
+    ]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["committed"] is True
+    assert [result["status"] for result in body["results"]] == [201, 201, 201, 200]
+    assert body["results"][3]["data"]["allocated_amount"] == 250
+
+    # Ids from earlier results can be used in a follow-up batch
+    second_id = body["results"][1]["data"]["id"]
+    response = client.post("/api/batch/", headers=auth_headers, json={"operations": [
+        {"op": "update", "resource": "expense", "id": second_id,
+         "data": {"category_id": rent, "amount": 9, "month": "2034-01"}},
+        {"op": "delete", "resource": "transfer", "id": body["results"][2]["data"]["id"]},
+    ]})
+    assert [result["status"] for result in response.json()["results"]] == [200, 204]
+
+    expenses = client.get("/api/expenses/", headers=auth_headers).json()["items"]
+    assert sorted(float(expense["amount"]) for expense in expenses) == [9, 10]
+    assert client.get("/api/transfers/", headers=auth_headers).status_code == 404
+
+
+def test_batch_is_all_or_nothing(auth_headers, categories):
+    """Test a failing operation rolls back the ones before it"""
+    _, food, _ = categories
+    response = client.post("/api/batch/", headers=auth_headers, json={"operations": [
+        {"op": "create", "resource": "expense",
+         "data": {"category_id": food, "amount": 10, "month": "2034-02"}},
+        {"op": "delete", "resource": "expense", "id": 999999},
+        {"op": "create", "resource": "expense",
+         "data": {"category_id": food, "amount": 20, "month": "2034-02"}},
+    ]})
+    assert response.status_code == 404
+    body = response.json()
+    assert body["committed"] is False
+    assert [result["status"] for result in body["results"]] == [201, 404]
+
+    assert client.get("/api/expenses/", headers=auth_headers).status_code == 404
+
+
+def test_batch_reports_invalid_operation_data(auth_headers, categories):
+    """Test operation bodies are validated like the single-row endpoints"""
+    _, food, _ = categories
+    response = client.post("/api/batch/", headers=auth_headers, json={"operations": [
+        {"op": "create", "resource": "expense",
+         "data": {"category_id": food, "amount": 10, "month": "2034-13"}},
+    ]})
+    assert response.status_code == 422
+    assert response.json()["results"][0]["detail"][0]["loc"] == ["month"]
+
+
+def test_batch_rejects_other_users_budget(auth_headers, categories):
+    """Test allocations can only be changed in the user's own budgets"""
+    response = client.post("/api/batch/", headers=auth_headers, json={"operations": [
+        {"op": "delete", "resource": "allocation", "budget_id": 999999, "id": 1},
+    ]})
+    assert response.status_code == 404
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    email = f"batch_{uuid.uuid4().hex[:8]}@example.com"
+    client.post("/api/auth/", json={
+        "first_name": "Bat",
+        "last_name": "Ch",
+        "email": email,
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": email,
+        "password": "testpass123"
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def categories(auth_headers):
+    """A budget with two allocated categories; returns (budget_id, food_id, rent_id)"""
+    budget = client.post("/api/budgets/", json={
+        "name": "Batch", "amount": 1000
+    }, headers=auth_headers).json()
+    food, rent = (
+        client.post("/api/categories/category_allocation", json={
+            "name": f"Batch {name}",
+            "budget_id": budget["id"],
+            "amount": 100
+        }, headers=auth_headers).json()["id"]
+        for name in ("Food", "Rent")
+    )
+    return budget["id"], food, rent
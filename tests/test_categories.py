@@ -117,6 +117,62 @@ class TestCategories:
             assert "expenses" in category
             assert "used" in category
 
+    def test_get_categories_with_stats_totals(self, auth_headers, stats_budget):
+        """Test stats sum expenses and transfers per category"""
+        budget_id, category_ids = stats_budget(2)
+        first, second = category_ids
+        client.post("/api/expenses/", json={
+            "category_id": first, "amount": 30, "month": "2030-01"}, headers=auth_headers)
+        client.post("/api/expenses/", json={
+            "category_id": first, "amount": 20, "month": "2030-01"}, headers=auth_headers)
+        client.post("/api/transfers/", json={
+            "from_category_id": first, "to_category_id": second,
+            "amount": 10, "month": "2030-01"}, headers=auth_headers)
+
+        response = client.get(
+            f"/api/categories/with-stats/{budget_id}", headers=auth_headers)
+        assert response.status_code == 200
+        data = {c["id"]: c for c in response.json()}
+
+        assert data[first]["used"] == 50
+        assert data[first]["expense_count"] == 2
+        assert data[first]["total_transfers_out"] == 10
+        assert data[first]["balance"] == 100 - 10 - 50
+        assert data[second]["total_transfers_in"] == 10
+        assert data[second]["balance"] == 110
+        assert data[second]["transfers_in"][0]["from_category_name"] == data[first]["name"]
+
+    def test_get_categories_with_stats_fast_path_headers(self, auth_headers, stats_budget):
+        """Test the direct orjson response keeps the ETag dependency's headers"""
+        budget_id, _ = stats_budget(1)
+        response = client.get(
+            f"/api/categories/with-stats/{budget_id}", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["etag"].startswith('W/"')
+        assert "x-data-version" in response.headers
+
+        repeat = client.get(f"/api/categories/with-stats/{budget_id}",
+                            headers={**auth_headers, "If-None-Match": response.headers["etag"]})
+        assert repeat.status_code == 304
+
+    def test_get_categories_with_stats_constant_queries(self, auth_headers, stats_budget, sql_statements):
+        """Test query count does not grow with the number of categories"""
+        def count_queries(budget_id):
+            sql_statements.clear()
+            client.get(
+                f"/api/categories/with-stats/{budget_id}", headers=auth_headers)
+            return len(sql_statements)
+
+        small_budget, small_ids = stats_budget(1)
+        large_budget, large_ids = stats_budget(6)
+        for category_id in small_ids + large_ids:
+            client.post("/api/transfers/", json={
+                "from_category_id": category_id, "to_category_id": small_ids[0],
+                "amount": 1, "month": "2030-01"}, headers=auth_headers)
+
+        assert count_queries(small_budget) == count_queries(large_budget)
+
     def test_get_categories_with_stats_unauthorized(self):
         """Test getting stats without authentication"""
         response = client.get("/api/categories/with-stats")
@@ -154,6 +210,36 @@ def create_user_and_login():
     return {"Authorization": f"Bearer {token}"}
 
 
+@pytest.fixture
+def stats_budget(auth_headers, monkeypatch):
+    """Create a budget with n allocated categories, pinned to month 2030-01"""
+    import uuid
+    from services import category_service
+
+    class FixedDatetime(category_service.datetime):
+        @classmethod
+        def utcnow(cls):
+            return cls(2030, 1, 15)
+
+    monkeypatch.setattr(category_service, "datetime", FixedDatetime)
+
+    def build(n):
+        budget = client.post("/api/budgets/", json={
+            "name": f"Stats {uuid.uuid4().hex[:8]}", "amount": 1000
+        }, headers=auth_headers).json()
+        category_ids = []
+        for _ in range(n):
+            category = client.post("/api/categories/category_allocation", json={
+                "name": f"Stats Category {uuid.uuid4().hex[:8]}",
+                "budget_id": budget["id"],
+                "amount": 100
+            }, headers=auth_headers).json()
+            category_ids.append(category["id"])
+        return budget["id"], category_ids
+
+    return build
+
+
 @pytest.fixture
 def create_category(auth_headers):
     """Create a test category"""
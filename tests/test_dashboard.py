@@ -0,0 +1,98 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.utils.fragment_cache import FragmentCache
+from app.utils.templates import fragment_cache
+from core.user_cache import user_cache
+from main import app
+
+client = TestClient(app)
+
+
+def test_dashboard_renders_active_budget(auth_cookie):
+    """Test dashboard loads user, budgets and stats for the default budget"""
+    response = client.get("/dashboard", cookies=auth_cookie)
+    assert response.status_code == 200
+    assert "Monthly" in response.text
+    assert "active_budget_id" in response.headers.get("set-cookie", "")
+
+
+def test_dashboard_ignores_unknown_budget(auth_cookie):
+    """Test an invalid budget id falls back to the first budget"""
+    response = client.get("/dashboard?budget_id=999", cookies=auth_cookie)
+    assert response.status_code == 200
+    assert "Monthly" in response.text
+
+
+def test_dashboard_resolves_user_once(auth_cookie, sql_statements):
+    """Test the in-process API calls of one render share one user lookup"""
+    user_cache.clear()
+    response = client.get("/dashboard", cookies=auth_cookie)
+    assert response.status_code == 200
+    # Each API call also reads the user's data version for its ETag; only
+    # the lookup by email resolves the user
+    assert len([s for s in sql_statements if "FROM users" in s and "users.email" in s]) == 1
+
+
+def test_dashboard_reuses_fragments_until_data_changes(auth_cookie):
+    """Test repeat views reuse cached fragments and a write re-renders them"""
+    headers = {"Authorization": f"Bearer {auth_cookie['access_token']}"}
+    budget = client.get("/api/budgets/", headers=headers).json()[0]
+    category = client.post("/api/categories/category_allocation", json={
+        "name": "Fragments", "budget_id": budget["id"], "amount": 100
+    }, headers=headers).json()
+    fragment_cache.clear()
+
+    first = client.get("/dashboard", cookies=auth_cookie).text
+    hits = fragment_cache.stats()["hits"]
+    assert client.get("/dashboard", cookies=auth_cookie).text == first
+    assert fragment_cache.stats()["hits"] > hits
+
+    client.post("/api/expenses/", json={
+        "category_id": category["id"], "amount": 7,
+        "description": "Fragment cache buster", "month": datetime.now().strftime("%Y-%m")
+    }, headers=headers)
+    assert "Fragment cache buster" in client.get("/dashboard", cookies=auth_cookie).text
+
+
+def test_fragment_cache_caps_memory():
+    """Test the fragment cache evicts least recently used entries past its byte cap"""
+    cache = FragmentCache(max_entries=10, max_bytes=10)
+    cache.set("a", 1, "aaaa")
+    cache.set("b", 1, "bbbb")
+    cache.get("a", 1)
+    cache.set("c", 1, "cccc")
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == "aaaa"
+    assert cache.get("a", 2) is None
+
+    # A newer version replaces the old entry instead of sitting beside it
+    cache.set("a", 2, "AA")
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["bytes"] == 6
+
+
+def test_dashboard_requires_login():
+    """Test dashboard redirects when there is no session cookie"""
+    response = client.get("/dashboard", follow_redirects=False)
+    assert response.status_code == 302
+    assert response.headers["location"] == "/login"
+
+
+@pytest.fixture
+def auth_cookie():
+    """Create a user and login to get the session cookie"""
+    client.post("/api/auth/", json={
+        "first_name": "Dashboard",
+        "last_name": "Test",
+        "email": "dashboard_test@example.com",
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": "dashboard_test@example.com",
+        "password": "testpass123"
+    })
+    return {"access_token": login_response.json()["access_token"]}
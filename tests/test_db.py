@@ -0,0 +1,76 @@
+import asyncio
+from decimal import Decimal
+
+from sqlalchemy import create_engine, text
+
+from app.config import settings
+from data.db.db import async_database_url, engine_options, get_db, run_sqlite_maintenance, session_bind
+from data.db.types import from_minor_units, round_money, to_minor_units
+from main import app
+
+
+def test_sqlite_connections_use_tuned_profile(db_engine):
+    with db_engine.connect() as connection:
+        assert connection.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # NORMAL == 1, MEMORY == 2
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert connection.execute(text("PRAGMA temp_store")).scalar() == 2
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+
+def test_async_sqlite_connections_use_tuned_profile(async_db_engine):
+    async def pragmas():
+        async with async_db_engine.connect() as connection:
+            foreign_keys = (await connection.execute(text("PRAGMA foreign_keys"))).scalar()
+            journal_mode = (await connection.execute(text("PRAGMA journal_mode"))).scalar()
+            return foreign_keys, journal_mode
+
+    assert asyncio.run(pragmas()) == (1, "wal")
+
+
+def test_async_database_url_swaps_driver():
+    assert async_database_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+    assert async_database_url("postgresql+psycopg2://bajeti:secret@db/bajeti") == \
+        "postgresql+asyncpg://bajeti:secret@db/bajeti"
+
+
+def test_money_converts_to_cents_at_the_edges():
+    assert to_minor_units(Decimal("12.50")) == 1250
+    assert to_minor_units(0.1) == 10
+    assert to_minor_units("2.345") == 235
+    assert to_minor_units(-2.345) == -235
+    assert from_minor_units(1250) == Decimal("12.50")
+    assert str(round_money(7)) == "7.00"
+
+
+def test_sqlite_maintenance_runs(tmp_path):
+    # Its own file: PRAGMA optimize writes planner stats that would sway
+    # the plans test_query_plans asserts on the shared test database
+    engine = create_engine(f"sqlite:///{tmp_path / 'maintenance.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+    run_sqlite_maintenance(engine)
+    engine.dispose()
+
+
+def test_maintenance_bind_follows_get_db_override(db_engine):
+    """Test the lifespan maintains the database get_db serves, not the default one"""
+    assert session_bind(app.dependency_overrides[get_db]).url == db_engine.url
+
+
+def test_sqlite_engine_options_skip_pooling():
+    assert engine_options("sqlite:///./test.db") == {
+        "connect_args": {"check_same_thread": False}
+    }
+
+
+def test_postgres_engine_options_use_pool_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 2500)
+    options = engine_options("postgresql://bajeti:secret@db/bajeti")
+
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+    assert options["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert options["pool_pre_ping"] is settings.DB_POOL_PRE_PING
+    assert options["pool_recycle"] == settings.DB_POOL_RECYCLE
+    assert options["connect_args"] == {"options": "-c statement_timeout=2500"}
@@ -0,0 +1,116 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from main import app
+
+client = TestClient(app)
+
+
+def test_unchanged_reads_return_304(auth_headers, budget):
+    """Test a repeat GET with the current ETag is answered with 304"""
+    first = client.get("/api/budgets/", headers=auth_headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    repeat = client.get("/api/budgets/", headers={**auth_headers, "If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == etag
+
+    overview = client.get(f"/api/budgets/{budget['id']}/allocations/overview",
+                          headers={**auth_headers, "If-None-Match": etag})
+    assert overview.status_code == 304
+
+
+def test_writes_change_the_etag(auth_headers, budget):
+    """Test a committed write bumps the version and refreshes the body"""
+    etag = client.get("/api/budgets/", headers=auth_headers).headers["etag"]
+
+    client.post("/api/categories/category_allocation", json={
+        "name": "Etag Food", "budget_id": budget["id"], "amount": 50
+    }, headers=auth_headers)
+
+    response = client.get("/api/budgets/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert int(response.headers["x-data-version"]) > int(etag.split("-")[1])
+
+
+def test_failed_batch_keeps_the_etag(auth_headers, budget):
+    """Test a rolled-back transaction does not bump the version"""
+    etag = client.get("/api/budgets/", headers=auth_headers).headers["etag"]
+
+    response = client.post("/api/batch/", headers=auth_headers, json={"operations": [
+        {"op": "create", "resource": "transfer",
+         "data": {"amount": 5, "month": "2035-01"}},
+        {"op": "delete", "resource": "expense", "id": 999999},
+    ]})
+    assert response.status_code == 404
+
+    repeat = client.get("/api/budgets/", headers={**auth_headers, "If-None-Match": etag})
+    assert repeat.status_code == 304
+
+
+def test_other_users_writes_keep_the_etag(auth_headers, budget):
+    """Test versions are per user"""
+    etag = client.get("/api/budgets/", headers=auth_headers).headers["etag"]
+
+    other_headers = login(f"etag_other_{uuid.uuid4().hex[:8]}@example.com")
+    client.post("/api/budgets/", json={"name": "Other", "amount": 10}, headers=other_headers)
+
+    repeat = client.get("/api/budgets/", headers={**auth_headers, "If-None-Match": etag})
+    assert repeat.status_code == 304
+
+
+def test_async_routers_read_the_version_on_their_own_session(
+        auth_headers, budget, db_engine, async_db_engine, sql_statements):
+    """Test async routers read data_version once, async only, and only for GET"""
+    sync_statements = []
+
+    def record(conn, cursor, statement, *args):
+        sync_statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    try:
+        client.get("/api/budgets/", headers=auth_headers)
+        versions = [s for s in sql_statements if "users.data_version" in s]
+        assert len(versions) == 1
+        assert not [s for s in sync_statements if "users.data_version" in s]
+
+        sql_statements.clear()
+        client.put(f"/api/budgets/{budget['id']}", json={
+            "name": "Renamed", "amount": 900}, headers=auth_headers)
+        assert not [s for s in sql_statements if "SELECT users.data_version" in s]
+    finally:
+        event.remove(db_engine, "before_cursor_execute", record)
+
+
+def login(email):
+    client.post("/api/auth/", json={
+        "first_name": "E",
+        "last_name": "Tag",
+        "email": email,
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": email,
+        "password": "testpass123"
+    })
+    return {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    return login(f"etag_{uuid.uuid4().hex[:8]}@example.com")
+
+
+@pytest.fixture
+def budget(auth_headers):
+    return client.post("/api/budgets/", json={
+        "name": "Etag", "amount": 1000
+    }, headers=auth_headers).json()
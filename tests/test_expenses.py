@@ -10,7 +10,64 @@ def test_get_all_expenses_success(auth_headers, create_expense):
     response = client.get("/api/expenses/", headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
-    assert isinstance(data, list)
+    assert isinstance(data["items"], list)
+    assert data["next_cursor"] is None
+
+
+def test_get_all_expenses_keyset_pages(auth_headers, create_category):
+    """Test walking every page with next_cursor returns each expense once, newest first"""
+    created = [
+        client.post("/api/expenses/", json={
+            "category_id": create_category["id"], "amount": amount, "month": "2024-02"
+        }, headers=auth_headers).json()["id"]
+        for amount in range(1, 8)
+    ]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/expenses/", params=params, headers=auth_headers).json()
+        assert len(page["items"]) <= 3
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == sorted(created, reverse=True)
+
+
+def test_get_all_expenses_filters(auth_headers, create_category):
+    """Test month range, type and amount filters narrow the listing"""
+    category_id = create_category["id"]
+    for amount, month in ((5, "2024-01"), (50, "2024-02"), (500, "2024-03")):
+        client.post("/api/expenses/", json={
+            "category_id": category_id, "amount": amount, "month": month
+        }, headers=auth_headers)
+
+    response = client.get("/api/expenses/", params={
+        "month_from": "2024-02", "month_to": "2024-03", "min_amount": 10, "max_amount": 100,
+        "category_id": category_id,
+    }, headers=auth_headers)
+    assert response.status_code == 200
+    assert [float(item["amount"]) for item in response.json()["items"]] == [50]
+
+    response = client.get("/api/expenses/", params={"type": "withdrawal"}, headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_get_all_expenses_invalid_cursor(auth_headers, create_expense):
+    """Test a malformed cursor is rejected"""
+    response = client.get(
+        "/api/expenses/", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_get_all_expenses_limit_capped(auth_headers):
+    """Test page size is capped"""
+    response = client.get("/api/expenses/", params={"limit": 10_000}, headers=auth_headers)
+    assert response.status_code == 422
 
 
 def test_get_all_expenses_empty(auth_headers):
@@ -0,0 +1,98 @@
+import csv
+import gzip
+import io
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def test_export_ledger_csv(auth_headers, ledger):
+    """Test the ledger CSV holds every expense and transfer"""
+    response = client.get("/api/export/ledger", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["kind"] for row in rows] == ["spend", "spend", "withdrawal", "transfer"]
+    assert rows[0]["amount"] == "12.5"
+    assert rows[0]["category"] == "Export Food"
+    assert rows[-1]["from_category"] == "Export Food"
+    assert rows[-1]["to_category"] == "Export Rent"
+
+
+def test_export_ndjson_month_filter(auth_headers, ledger):
+    """Test NDJSON export and month filtering"""
+    response = client.get("/api/export/expenses", params={
+        "format": "ndjson", "month_from": "2032-02"}, headers=auth_headers)
+    assert response.status_code == 200
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(row["kind"], row["month"]) for row in rows] == [
+        ("spend", "2032-02"), ("withdrawal", "2032-02")]
+
+
+def test_export_gzip(auth_headers, ledger):
+    """Test gzip exports decompress to the same CSV"""
+    plain = client.get("/api/export/transfers", headers=auth_headers)
+    compressed = client.get("/api/export/transfers", params={"gzip": True},
+                            headers=auth_headers)
+    assert compressed.status_code == 200
+    assert compressed.headers["content-type"] == "application/gzip"
+    assert compressed.headers["content-disposition"].endswith('.csv.gz"')
+    assert gzip.decompress(compressed.content) == plain.content
+
+
+def test_export_requires_auth():
+    """Test export is not available anonymously"""
+    assert client.get("/api/export/ledger").status_code == 401
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    email = f"export_{uuid.uuid4().hex[:8]}@example.com"
+    client.post("/api/auth/", json={
+        "first_name": "Ex",
+        "last_name": "Port",
+        "email": email,
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": email,
+        "password": "testpass123"
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def ledger(auth_headers):
+    """Two categories with a few expenses, a withdrawal and a transfer"""
+    budget = client.post("/api/budgets/", json={
+        "name": "Export", "amount": 1000
+    }, headers=auth_headers).json()
+    food, rent = (
+        client.post("/api/categories/category_allocation", json={
+            "name": f"Export {name}",
+            "budget_id": budget["id"],
+            "amount": 100
+        }, headers=auth_headers).json()["id"]
+        for name in ("Food", "Rent")
+    )
+    client.post("/api/expenses/", json={
+        "category_id": food, "amount": 12.5, "month": "2032-01"}, headers=auth_headers)
+    client.post("/api/expenses/", json={
+        "category_id": rent, "amount": 40, "month": "2032-02"}, headers=auth_headers)
+    client.post("/api/expenses/withdrawal", json={
+        "category_id": food, "amount": 5, "month": "2032-02"}, headers=auth_headers)
+    client.post("/api/transfers/", json={
+        "from_category_id": food, "to_category_id": rent,
+        "amount": 7, "month": "2032-02"}, headers=auth_headers)
@@ -0,0 +1,163 @@
+import uuid
+from datetime import date, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from data.db.models.models import Expense
+from main import app
+from services.forecast_service import ForecastService, curve_cache, months_before
+
+client = TestClient(app)
+
+
+def add_expenses(db_engine, user_id, category_id, *entries):
+    """Insert (amount, month, created_at) rows directly, so created_at can be in the past"""
+    with Session(db_engine) as db:
+        db.add_all([
+            Expense(user_id=user_id, category_id=category_id, amount=amount,
+                    month=month, created_at=created_at)
+            for amount, month, created_at in entries
+        ])
+        db.commit()
+
+
+def test_months_before():
+    """Test the history window stops short of the forecast month and crosses years"""
+    assert months_before("2033-02", 3) == ["2032-11", "2032-12", "2033-01"]
+
+
+def test_forecast_follows_history_curve(user_id, budget, db_engine):
+    """Test categories with history extrapolate along their curve, the rest at the run rate"""
+    _, (food, rent) = budget
+    for month in months_before("2033-07", 6):
+        year, number = (int(part) for part in month.split("-"))
+        # Half the month's spend on the 1st, the rest on the 20th
+        add_expenses(db_engine, user_id, food,
+                     (100, month, datetime(year, number, 1, 9)),
+                     (100, month, datetime(year, number, 20, 9)))
+    # Recorded long after its month, so it says nothing about the day
+    add_expenses(db_engine, user_id, rent, (500, "2033-03", datetime(2033, 6, 2)))
+
+    with Session(db_engine) as db:
+        result = ForecastService.project(
+            db, user_id, "2033-07", [food, rent],
+            allocated=[150, 100], spent=[80, 30], today=date(2033, 7, 10))
+
+    assert result["summary"]["days_elapsed"] == 10
+    assert result["summary"]["days_in_month"] == 31
+    food_forecast, rent_forecast = result["allocations"]
+
+    assert food_forecast["method"] == "history"
+    assert food_forecast["burn_rate"] == 8
+    assert food_forecast["projected_amount"] == 160
+    assert food_forecast["overrun_date"] == "2033-07-20"
+
+    assert rent_forecast["method"] == "run_rate"
+    assert rent_forecast["projected_amount"] == 93
+    assert rent_forecast["overrun_date"] is None
+    assert result["summary"]["projected_total"] == 253
+
+
+def test_forecast_folds_late_days_into_short_months(user_id, budget, db_engine):
+    """Test spend usually made after the 28th still counts in February"""
+    _, (food, _) = budget
+    for month in months_before("2035-02", 6):
+        year, number = (int(part) for part in month.split("-"))
+        add_expenses(db_engine, user_id, food,
+                     (100, month, datetime(year, number, 1, 9)),
+                     (100, month, datetime(year, number, 30 if number != 2 else 28, 9)))
+
+    with Session(db_engine) as db:
+        result = ForecastService.project(
+            db, user_id, "2035-02", [food], allocated=[150], spent=[100],
+            today=date(2035, 2, 10))
+
+    food_forecast, = result["allocations"]
+    assert food_forecast["method"] == "history"
+    assert food_forecast["projected_amount"] == 200
+    assert food_forecast["overrun_date"] == "2035-02-28"
+
+
+def test_forecast_curves_cached(user_id, budget, db_engine, sql_statements):
+    """Test a repeat forecast reuses the curves instead of scanning expenses"""
+    _, (food, _) = budget
+    add_expenses(db_engine, user_id, food, (40, "2034-01", datetime(2034, 1, 5)))
+
+    with Session(db_engine) as db:
+        ForecastService.project(db, user_id, "2034-02", [food], [100], [10],
+                                today=date(2034, 2, 3))
+        sql_statements.clear()
+        hits = curve_cache.stats()["hits"]
+        ForecastService.project(db, user_id, "2034-02", [food], [100], [10],
+                                today=date(2034, 2, 3))
+
+    assert curve_cache.stats()["hits"] == hits + 1
+    assert not [s for s in sql_statements if "FROM expenses" in s]
+
+
+def test_overview_forecast(auth_headers, budget):
+    """Test ?forecast=true adds projections; past months project to what was spent"""
+    budget_id, (food, _) = budget
+    client.post("/api/expenses/", json={
+        "category_id": food, "amount": 120, "month": "2020-05"}, headers=auth_headers)
+
+    url = f"/api/budgets/{budget_id}/allocations/overview?month=2020-05"
+    assert "forecast" not in client.get(url, headers=auth_headers).json()
+
+    data = client.get(url + "&forecast=true", headers=auth_headers).json()
+    assert data["forecast"]["days_elapsed"] == 31
+    rows = {row["category_id"]: row["forecast"] for row in data["allocations"]}
+    assert rows[food]["projected_amount"] == 120
+    assert rows[food]["projected_remaining"] == -20
+    # Already over budget at the end of the month
+    assert rows[food]["overrun_date"] == "2020-05-31"
+
+    # A month that hasn't started has nothing to extrapolate
+    future = client.get(
+        f"/api/budgets/{budget_id}/allocations/overview?month=2099-01&forecast=true",
+        headers=auth_headers).json()
+    assert future["forecast"]["days_elapsed"] == 0
+    assert all(row["forecast"]["burn_rate"] is None for row in future["allocations"])
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    email = f"forecast_{uuid.uuid4().hex[:8]}@example.com"
+    client.post("/api/auth/", json={
+        "first_name": "Fore",
+        "last_name": "Cast",
+        "email": email,
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": email,
+        "password": "testpass123"
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def user_id(auth_headers):
+    return client.get("/api/auth/users/me", headers=auth_headers).json()["id"]
+
+
+@pytest.fixture
+def budget(auth_headers):
+    """A budget with two allocated categories; returns (budget_id, category_ids)"""
+    budget = client.post("/api/budgets/", json={
+        "name": "Forecast", "amount": 1000
+    }, headers=auth_headers).json()
+    category_ids = tuple(
+        client.post("/api/categories/category_allocation", json={
+            "name": f"Forecast {name}",
+            "budget_id": budget["id"],
+            "amount": 100
+        }, headers=auth_headers).json()["id"]
+        for name in ("Food", "Rent")
+    )
+    return budget["id"], category_ids
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app import requests as legacy_pages
+from app.services import http_client
+from main import app
+
+client = TestClient(app)
+
+
+def test_get_is_served_in_process(auth_headers):
+    """API calls from the frontend layer are dispatched into the app directly"""
+    response = asyncio.run(http_client.get(
+        "/auth/users/me", headers=auth_headers))
+    assert response.status_code == 200
+    assert response.json()["email"] == "http_client_test@example.com"
+
+
+def test_post_is_served_in_process(auth_headers):
+    """Write calls go through the same in-process transport"""
+    response = asyncio.run(http_client.post(
+        "/categories/", json={"name": "In Process"}, headers=auth_headers))
+    assert response.status_code == 201
+    assert response.json()["name"] == "In Process"
+
+
+def test_unauthorized_in_process():
+    """Auth is still enforced by the API routers"""
+    response = asyncio.run(http_client.get("/auth/users/me"))
+    assert response.status_code == 401
+
+
+def test_calls_reuse_shared_client(auth_headers):
+    """Every call goes through the same pooled client"""
+    first = http_client.get_client()
+    asyncio.run(http_client.get("/auth/users/me", headers=auth_headers))
+    asyncio.run(http_client.get("/auth/users/me", headers=auth_headers))
+    assert http_client.get_client() is first
+
+
+def test_route_timeouts():
+    """Known routes get their own timeout, others the default"""
+    assert http_client.timeout_for("/auth/token") == 5.0
+    assert http_client.timeout_for("categories/with-stats/3") == 15.0
+    assert http_client.timeout_for("/transfers/") == 10.0
+
+
+def test_health_reports_pool_stats(auth_headers):
+    """Pool stats are exposed to signed-in users only; liveness stays bare"""
+    assert client.get("/api/health/").json() == {"status": "ok"}
+    assert client.get("/api/health/stats").status_code == 401
+
+    before = client.get("/api/health/stats", headers=auth_headers).json()["http_pool"]["requests"]
+    asyncio.run(http_client.get("/auth/users/me", headers=auth_headers))
+
+    response = client.get("/api/health/stats", headers=auth_headers)
+    assert response.status_code == 200
+    stats = response.json()["http_pool"]
+    assert stats["requests"] == before + 1
+    assert stats["in_flight"] == 0
+    assert stats["transport"] == "asgi"
+
+
+def test_legacy_page_calls_use_counted_helpers():
+    """Legacy page helpers go through http_client, so they get route timeouts and stats"""
+    request = Request({"type": "http", "method": "POST", "path": "/login", "headers": [],
+                       "app": app, "router": app.router})
+    before = http_client.pool_stats()["requests"]
+
+    response = asyncio.run(legacy_pages.handle_authenticated_login(
+        "nobody@example.com", "wrongpass", request))
+
+    assert response.status_code == 200
+    assert http_client.pool_stats()["requests"] == before + 1
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    client.post("/api/auth/", json={
+        "first_name": "Http",
+        "last_name": "Client",
+        "email": "http_client_test@example.com",
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": "http_client_test@example.com",
+        "password": "testpass123"
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,126 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from data.db.models.models import CategoryMonthTotal
+from main import app
+
+client = TestClient(app)
+
+OFX = """OFXHEADER:100
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20330115120000<TRNAMT>-23.40<NAME>Grocer
+</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20330116<TRNAMT>500.00<NAME>Salary
+</STMTTRN>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20330120<TRNAMT>-6.60<MEMO>Bakery
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+def spent_by_category(db_engine, month):
+    with Session(db_engine) as db:
+        return {
+            row.category_id: (float(row.spent), row.spend_count)
+            for row in db.query(CategoryMonthTotal).filter(CategoryMonthTotal.month == month)
+        }
+
+
+def test_import_csv_reports_row_errors(auth_headers, categories):
+    """Test valid CSV rows are imported and bad ones reported by line"""
+    _, food, _ = categories
+    body = (
+        "Date,Amount,Category,Description\n"
+        "2033-01-05,12.50,import food,Lunch\n"
+        "2033-01-06,abc,Import Food,Broken\n"
+        "2033-01-07,4,Import Rent,\"Key, copy\"\n"
+        "2033-13-01,4,Import Rent,Bad month\n"
+        "2033-01-08,3,Nowhere,Unknown\n"
+    )
+    response = client.post("/api/expenses/import", headers=auth_headers,
+                           files={"file": ("statement.csv", body, "text/csv")})
+    assert response.status_code == 200
+    result = response.json()
+    assert result["imported"] == 2
+    assert result["failed"] == 3
+    assert [error["row"] for error in result["errors"]] == [3, 5, 6]
+
+    expenses = client.get("/api/expenses/by-category-month", params={
+        "category_id": food, "month": "2033-01"}, headers=auth_headers).json()
+    assert [(e["description"], float(e["amount"])) for e in expenses] == [("Lunch", 12.5)]
+
+
+def test_import_ofx_uses_default_category(auth_headers, categories):
+    """Test OFX debits import into the default category and credits are skipped"""
+    _, food, _ = categories
+    response = client.post(
+        "/api/expenses/import", headers=auth_headers,
+        data={"default_category_id": food},
+        files={"file": ("statement.ofx", OFX, "application/x-ofx")})
+    assert response.status_code == 200
+    assert response.json() == {
+        "imported": 2, "failed": 1,
+        "errors": [{"row": 2, "error": "Credit rows are not imported"}],
+    }
+
+
+def test_import_batches_update_rollup(auth_headers, categories, db_engine):
+    """Test a multi-batch import lands in full and in the category totals"""
+    _, food, rent = categories
+    lines = ["month,amount,category_id"] + [
+        f"2033-02,1,{food if i % 2 else rent}" for i in range(1200)]
+    response = client.post("/api/expenses/import", headers=auth_headers,
+                           files={"file": ("bulk.csv", "\n".join(lines), "text/csv")})
+    assert response.json()["imported"] == 1200
+
+    totals = spent_by_category(db_engine, "2033-02")
+    assert totals[food] == (600, 600)
+    assert totals[rent] == (600, 600)
+
+
+def test_import_rejects_foreign_default_category(auth_headers):
+    """Test a default category must belong to the user"""
+    response = client.post(
+        "/api/expenses/import", headers=auth_headers,
+        data={"default_category_id": 999999},
+        files={"file": ("statement.ofx", OFX, "application/x-ofx")})
+    assert response.status_code == 404
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    email = f"import_{uuid.uuid4().hex[:8]}@example.com"
+    client.post("/api/auth/", json={
+        "first_name": "Im",
+        "last_name": "Port",
+        "email": email,
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": email,
+        "password": "testpass123"
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def categories(auth_headers):
+    """A budget with two allocated categories; returns (budget_id, food_id, rent_id)"""
+    budget = client.post("/api/budgets/", json={
+        "name": "Imports", "amount": 1000
+    }, headers=auth_headers).json()
+    food, rent = (
+        client.post("/api/categories/category_allocation", json={
+            "name": f"Import {name}",
+            "budget_id": budget["id"],
+            "amount": 100
+        }, headers=auth_headers).json()["id"]
+        for name in ("Food", "Rent")
+    )
+    return budget["id"], food, rent
@@ -0,0 +1,113 @@
+import re
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from main import app
+
+client = TestClient(app)
+
+HOT_TABLES = ("expenses", "transfers", "category_month_totals")
+
+
+def explain(engine, statement, parameters):
+    """Return the SQLite query plan lines for a recorded statement"""
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in cursor.fetchall()]
+    finally:
+        raw.close()
+
+
+def unscoped_reads(plan):
+    """
+    Plan lines that read a hot table other than through an index search on
+    user_id: full scans, and searches on an index that is not per-user
+    (such as month alone, which still walks every user's rows).
+    """
+    tables = "|".join(HOT_TABLES)
+    touches = re.compile(rf"^(SCAN|SEARCH) ({tables})\b")
+    scoped = re.compile(rf"^SEARCH ({tables}) USING .*INDEX \w+ \(user_id=\?")
+    return [line for line in plan if touches.match(line) and not scoped.match(line)]
+
+
+@pytest.mark.parametrize("path", [
+    "/api/categories/with-stats/{budget_id}",
+    "/api/budgets/{budget_id}/allocations/overview?month=2033-05&months=6",
+    "/api/expenses/by-category-month?category_id={category_id}&month=2033-05",
+    "/api/transfers/by-month?month=2033-05",
+    "/api/expenses/?limit=2",
+    "/api/transfers/?limit=2&month_from=2033-01",
+])
+def test_hot_queries_use_indexes(path, auth_headers, seeded_budget, db_engine, async_db_engine):
+    """Test hot expense and transfer queries search a per-user index, never a full scan"""
+    budget_id, category_id = seeded_budget
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and \
+                any(table in statement for table in HOT_TABLES):
+            recorded.append((statement, parameters))
+
+    binds = (db_engine, async_db_engine.sync_engine)
+    for bind in binds:
+        event.listen(bind, "before_cursor_execute", record)
+    try:
+        response = client.get(
+            path.format(budget_id=budget_id, category_id=category_id),
+            headers=auth_headers)
+    finally:
+        for bind in binds:
+            event.remove(bind, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert recorded
+    for statement, parameters in recorded:
+        plan = explain(db_engine, statement, parameters)
+        assert not unscoped_reads(plan), f"unindexed read in:\n{statement}\n{plan}"
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    client.post("/api/auth/", json={
+        "first_name": "Plan",
+        "last_name": "Test",
+        "email": "query_plan_test@example.com",
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": "query_plan_test@example.com",
+        "password": "testpass123"
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def seeded_budget(auth_headers):
+    """Budget with two allocated categories, an expense and a transfer"""
+    budget = client.post("/api/budgets/", json={
+        "name": f"Plan {uuid.uuid4().hex[:8]}", "amount": 500
+    }, headers=auth_headers).json()
+    category_ids = [
+        client.post("/api/categories/category_allocation", json={
+            "name": f"Plan Category {uuid.uuid4().hex[:8]}",
+            "budget_id": budget["id"],
+            "amount": 100
+        }, headers=auth_headers).json()["id"]
+        for _ in range(2)
+    ]
+    client.post("/api/expenses/", json={
+        "category_id": category_ids[0], "amount": 10, "month": "2033-05"
+    }, headers=auth_headers)
+    client.post("/api/transfers/", json={
+        "from_category_id": category_ids[0], "to_category_id": category_ids[1],
+        "amount": 5, "month": "2033-05"
+    }, headers=auth_headers)
+    return budget["id"], category_ids[0]
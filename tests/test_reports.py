@@ -0,0 +1,173 @@
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core.artifact_cache import ArtifactCache
+from main import app
+
+client = TestClient(app)
+
+
+def wait_for(job, headers):
+    """Poll a report job until it finishes"""
+    deadline = time.monotonic() + 30
+    while job["status"] not in ("done", "failed") and time.monotonic() < deadline:
+        time.sleep(0.05)
+        job = client.get(f"/api/reports/{job['id']}", headers=headers).json()
+    return job
+
+
+def request_report(headers, budget_id, period, file_format):
+    response = client.post("/api/reports/", json={
+        "budget_id": budget_id, "period": period, "format": file_format}, headers=headers)
+    assert response.status_code == 202
+    return wait_for(response.json(), headers)
+
+
+def test_monthly_csv_report(auth_headers, budget):
+    """Test a queued monthly report finishes and downloads as CSV"""
+    budget_id, (food, _) = budget
+    client.post("/api/expenses/", json={
+        "category_id": food, "amount": 12.5, "month": "2033-01",
+        "description": "Groceries"}, headers=auth_headers)
+
+    job = request_report(auth_headers, budget_id, "2033-01", "csv")
+    assert job["status"] == "done"
+    assert job["kind"] == "monthly"
+
+    download = client.get(job["download_url"], headers=auth_headers)
+    assert download.status_code == 200
+    assert download.headers["content-type"].startswith("text/csv")
+    assert 'filename="bajeti-reports-2033-01.csv"' in download.headers["content-disposition"]
+    text = download.content.decode("utf-8-sig")
+    assert "Report Food,100.00,12.50,12.50,0.00,0.00,87.50" in text.replace("\r", "")
+    assert "Groceries,12.50" in text
+
+
+def test_annual_pdf_report(auth_headers, budget):
+    """Test an annual report renders a PDF"""
+    budget_id, _ = budget
+    job = request_report(auth_headers, budget_id, "2033", "pdf")
+    assert job["status"] == "done"
+    assert job["kind"] == "annual"
+
+    download = client.get(job["download_url"], headers=auth_headers)
+    assert download.headers["content-type"] == "application/pdf"
+    assert download.content.startswith(b"%PDF-1.4")
+    assert download.content.rstrip().endswith(b"%%EOF")
+    assert b"2033-12" in download.content
+
+
+def test_report_artifacts_cached_per_data_version(auth_headers, budget):
+    """Test an unchanged report is served from disk and a write regenerates it"""
+    budget_id, (food, _) = budget
+    first = request_report(auth_headers, budget_id, "2033-02", "csv")
+
+    repeat = client.post("/api/reports/", json={
+        "budget_id": budget_id, "period": "2033-02", "format": "csv"}, headers=auth_headers).json()
+    assert repeat["status"] == "done"
+    assert repeat["id"] != first["id"]
+
+    client.post("/api/expenses/", json={
+        "category_id": food, "amount": 40, "month": "2033-02"}, headers=auth_headers)
+    updated = request_report(auth_headers, budget_id, "2033-02", "csv")
+    assert b"40.00" in client.get(updated["download_url"], headers=auth_headers).content
+
+
+def test_report_access_checks(auth_headers, budget, other_headers):
+    """Test unknown budgets and other users' jobs are 404s"""
+    budget_id, _ = budget
+    response = client.post("/api/reports/", json={
+        "budget_id": 999999, "period": "2033", "format": "csv"}, headers=auth_headers)
+    assert response.status_code == 404
+
+    job = request_report(auth_headers, budget_id, "2033-03", "csv")
+    assert client.get(f"/api/reports/{job['id']}", headers=other_headers).status_code == 404
+    assert client.get(job["download_url"], headers=other_headers).status_code == 404
+
+    response = client.post("/api/reports/", json={
+        "budget_id": budget_id, "period": "2033-13", "format": "csv"}, headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_reports_page_flow(auth_headers, budget):
+    """Test the page queues a report, shows its status and proxies the download"""
+    budget_id, _ = budget
+    cookies = {"access_token": auth_headers["Authorization"].split()[1]}
+    response = client.post("/reports", data={
+        "budget_id": budget_id, "period_type": "annual", "year": "2033",
+        "report_format": "csv"}, cookies=cookies, follow_redirects=False)
+    assert response.status_code == 303
+    job_id = response.headers["location"].split("job=")[1]
+
+    wait_for({"id": job_id, "status": "queued"}, auth_headers)
+    page = client.get(f"/reports?job={job_id}", cookies=cookies)
+    assert f"/reports/{job_id}/download" in page.text
+
+    download = client.get(f"/reports/{job_id}/download", cookies=cookies)
+    assert download.status_code == 200
+    assert "2033-12" in download.content.decode("utf-8-sig")
+
+
+def test_artifact_cache_evicts_least_recently_used(tmp_path):
+    """Test the disk cache stays under its size cap, dropping the oldest files"""
+    cache = ArtifactCache(str(tmp_path), max_bytes=250)
+    cache.put("a", b"x" * 100)
+    time.sleep(0.01)
+    cache.put("b", b"x" * 100)
+    time.sleep(0.01)
+    assert cache.get("a")  # now the most recently used
+    time.sleep(0.01)
+    cache.put("c", b"x" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") and cache.get("c")
+    assert cache.stats()["bytes"] == 200
+
+
+def register(prefix):
+    email = f"{prefix}_{uuid.uuid4().hex[:8]}@example.com"
+    client.post("/api/auth/", json={
+        "first_name": "Report",
+        "last_name": "Test",
+        "email": email,
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": email,
+        "password": "testpass123"
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    return register("reports")
+
+
+@pytest.fixture
+def other_headers():
+    """A second, unrelated user"""
+    return register("reports_other")
+
+
+@pytest.fixture
+def budget(auth_headers):
+    """A budget with two categories allocated 100 each; returns (budget_id, category_ids)"""
+    budget = client.post("/api/budgets/", json={
+        "name": "Reports", "amount": 1000
+    }, headers=auth_headers).json()
+    category_ids = tuple(
+        client.post("/api/categories/category_allocation", json={
+            "name": f"Report {name}",
+            "budget_id": budget["id"],
+            "amount": 100
+        }, headers=auth_headers).json()["id"]
+        for name in ("Food", "Rent")
+    )
+    return budget["id"], category_ids
@@ -0,0 +1,32 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+
+from core.responses import FastJSONResponse
+from schema.expense import ExpenseOut
+
+
+def test_fast_json_matches_jsonable_encoder():
+    """Test orjson output decodes to the same data the default encoder produces"""
+    expense = ExpenseOut(
+        id=1, amount=Decimal("12.50"), month="2031-01", description="Lunch",
+        category_id=2, user_id=3, type="spend",
+        created_at=datetime(2031, 1, 2, 3, 4, 5, 678), updated_at=datetime(2031, 1, 2))
+    content = {
+        "whole": Decimal("10"),
+        "fraction": Decimal("10.25"),
+        "day": date(2031, 1, 2),
+        "expense": expense,
+        "rows": [{"amount": Decimal("0.1"), "when": datetime(2031, 1, 2, 3, 4, 5)}],
+    }
+
+    body = FastJSONResponse(content).body
+    assert json.loads(body) == jsonable_encoder(content)
+
+
+def test_fast_json_passes_plain_payloads_through():
+    """Test plain service dicts render without a jsonable_encoder pass"""
+    body = FastJSONResponse({"used": 50.0, "items": [1, None, "a"]}).body
+    assert body == b'{"used":50.0,"items":[1,null,"a"]}'
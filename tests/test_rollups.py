@@ -0,0 +1,145 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from data.db.models.models import CategoryMonthTotal
+from main import app
+from services.rollup_service import RollupService
+
+client = TestClient(app)
+
+
+def rollup_rows(db_engine, user_id):
+    """{(category_id, month): (spent, withdrawn, in, out, spend_count, withdrawal_count)}"""
+    with Session(db_engine) as db:
+        return {
+            (row.category_id, row.month): (
+                float(row.spent), float(row.withdrawn),
+                float(row.transfers_in), float(row.transfers_out),
+                row.spend_count, row.withdrawal_count,
+            )
+            for row in db.query(CategoryMonthTotal).filter(
+                CategoryMonthTotal.user_id == user_id)
+        }
+
+
+def test_rollup_tracks_expense_and_transfer_writes(auth_headers, categories, db_engine):
+    """Test creates, updates and deletes keep the rollup in step"""
+    user_id, (food, rent) = categories
+
+    first = client.post("/api/expenses/", json={
+        "category_id": food, "amount": 30, "month": "2031-02"}, headers=auth_headers).json()
+    client.post("/api/expenses/", json={
+        "category_id": food, "amount": 20, "month": "2031-02"}, headers=auth_headers)
+    transfer = client.post("/api/transfers/", json={
+        "from_category_id": food, "to_category_id": rent,
+        "amount": 15, "month": "2031-02"}, headers=auth_headers).json()
+
+    assert rollup_rows(db_engine, user_id) == {
+        (food, "2031-02"): (50, 0, 0, 15, 2, 0),
+        (rent, "2031-02"): (0, 0, 15, 0, 0, 0),
+    }
+
+    # Moving an expense to another category and month moves its totals
+    client.put(f"/api/expenses/{first['id']}", json={
+        "category_id": rent, "amount": 35, "month": "2031-03"}, headers=auth_headers)
+    client.delete(f"/api/transfers/{transfer['id']}", headers=auth_headers)
+
+    assert rollup_rows(db_engine, user_id) == {
+        (food, "2031-02"): (20, 0, 0, 0, 1, 0),
+        (rent, "2031-02"): (0, 0, 0, 0, 0, 0),
+        (rent, "2031-03"): (35, 0, 0, 0, 1, 0),
+    }
+
+    client.delete(f"/api/expenses/{first['id']}", headers=auth_headers)
+    assert rollup_rows(db_engine, user_id)[(rent, "2031-03")] == (0, 0, 0, 0, 0, 0)
+
+
+def test_rollup_tracks_withdrawals(auth_headers, categories, db_engine):
+    """Test withdrawals land in the withdrawn column"""
+    user_id, (food, _) = categories
+
+    withdrawal = client.post("/api/expenses/withdrawal", json={
+        "category_id": food, "amount": 40, "month": "2031-04"}, headers=auth_headers)
+    assert withdrawal.status_code == 201
+    client.put(f"/api/expenses/withdrawal/{withdrawal.json()['id']}", json={
+        "category_id": food, "amount": 25, "month": "2031-04"}, headers=auth_headers)
+
+    assert rollup_rows(db_engine, user_id)[(food, "2031-04")] == (0, 25, 0, 0, 0, 1)
+
+
+def test_rollup_rebuild_matches_incremental(auth_headers, categories, db_engine):
+    """Test a rebuild from source rows reproduces the maintained totals"""
+    user_id, (food, rent) = categories
+    client.post("/api/expenses/", json={
+        "category_id": food, "amount": 12.5, "month": "2031-05"}, headers=auth_headers)
+    client.post("/api/transfers/", json={
+        "from_category_id": rent, "to_category_id": food,
+        "amount": 7, "month": "2031-05"}, headers=auth_headers)
+
+    # Rebuild drops the all-zero rows left behind by earlier deletes
+    maintained = {
+        key: totals for key, totals in rollup_rows(db_engine, user_id).items()
+        if any(totals)
+    }
+    with Session(db_engine) as db:
+        RollupService.rebuild(db, user_id=user_id)
+
+    assert rollup_rows(db_engine, user_id) == maintained
+
+
+def test_rollup_sums_cents_exactly(auth_headers, categories, db_engine):
+    """Test money is stored as integer cents, so repeated small amounts don't drift"""
+    user_id, (food, _) = categories
+    for _ in range(10):
+        client.post("/api/expenses/", json={
+            "category_id": food, "amount": 0.1, "month": "2031-06"}, headers=auth_headers)
+
+    with Session(db_engine) as db:
+        totals = db.get(CategoryMonthTotal, (user_id, food, "2031-06"))
+        assert totals.spent == Decimal("1.00")
+        stored = db.execute(text(
+            "SELECT SUM(amount), typeof(SUM(amount)) FROM expenses "
+            "WHERE user_id = :user_id AND month = '2031-06'"), {"user_id": user_id}).one()
+    assert tuple(stored) == (100, "integer")
+
+
+@pytest.fixture
+def auth_headers():
+    """Create a user and login to get auth token"""
+    email = f"rollup_{uuid.uuid4().hex[:8]}@example.com"
+    client.post("/api/auth/", json={
+        "first_name": "Roll",
+        "last_name": "Up",
+        "email": email,
+        "password": "testpass123",
+        "security_answer": "TestAnswer"
+    })
+    login_response = client.post("/api/auth/token", data={
+        "username": email,
+        "password": "testpass123"
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def categories(auth_headers):
+    """A budget with two allocated categories; returns (user_id, category_ids)"""
+    user_id = client.get("/api/auth/users/me", headers=auth_headers).json()["id"]
+    budget = client.post("/api/budgets/", json={
+        "name": "Rollups", "amount": 1000
+    }, headers=auth_headers).json()
+    category_ids = tuple(
+        client.post("/api/categories/category_allocation", json={
+            "name": f"Rollup {name}",
+            "budget_id": budget["id"],
+            "amount": 100
+        }, headers=auth_headers).json()["id"]
+        for name in ("Food", "Rent")
+    )
+    return user_id, category_ids
@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+from app.handlers.task_graph import TaskGraph
+
+
+def test_independent_tasks_run_concurrently():
+    """Test independent tasks overlap instead of running back to back"""
+    async def slow(value):
+        await asyncio.sleep(0.2)
+        return value
+
+    graph = TaskGraph()
+    graph.add("a", lambda: slow(1))
+    graph.add("b", lambda: slow(2))
+    graph.add("c", lambda: slow(3))
+
+    started = time.perf_counter()
+    results = asyncio.run(graph.run())
+    elapsed = time.perf_counter() - started
+
+    assert results == {"a": 1, "b": 2, "c": 3}
+    assert elapsed < 0.5
+
+
+def test_dependencies_receive_results():
+    """Test dependent tasks get upstream results in order"""
+    async def add(x, y):
+        return x + y
+
+    graph = TaskGraph()
+    graph.add("x", lambda: 2)
+    graph.add("y", lambda: asyncio.sleep(0, result=3))
+    graph.add("sum", add, after=["x", "y"])
+
+    assert asyncio.run(graph.run())["sum"] == 5
+
+
+def test_timeout_uses_fallback_and_skips_dependents():
+    """Test a timed out task falls back and its dependents are skipped"""
+    called = []
+
+    async def dependent(value):
+        called.append(value)
+        return "ran"
+
+    graph = TaskGraph()
+    graph.add("slow", lambda: asyncio.sleep(1), timeout=0.05, fallback="late")
+    graph.add("after_slow", dependent, after=["slow"], fallback="skipped")
+    graph.add("other", lambda: "ok")
+
+    results = asyncio.run(graph.run())
+    assert results == {"slow": "late", "after_slow": "skipped", "other": "ok"}
+    assert graph.failed == {"slow", "after_slow"}
+    assert called == []
+
+
+def test_exception_uses_fallback():
+    """Test a failing task does not fail the whole graph"""
+    async def boom():
+        raise RuntimeError("backend down")
+
+    graph = TaskGraph()
+    graph.add("broken", boom, fallback=[])
+    graph.add("fine", lambda: 1)
+
+    assert asyncio.run(graph.run()) == {"broken": [], "fine": 1}
+
+
+def test_unknown_dependency_rejected():
+    """Test dependencies must be added before the tasks that use them"""
+    graph = TaskGraph()
+    try:
+        graph.add("a", lambda x: x, after=["missing"])
+    except ValueError as e:
+        assert "missing" in str(e)
+    else:
+        raise AssertionError("expected ValueError")
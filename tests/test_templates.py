@@ -0,0 +1,36 @@
+from app import requests as legacy_pages
+from app.config import settings
+from app.utils import templates as page_templates
+
+
+def test_production_environment_reuses_bytecode(tmp_path, monkeypatch):
+    """Test production mode skips auto_reload and compiles each template once per cache dir"""
+    monkeypatch.setattr(settings, "TEMPLATE_BYTECODE_CACHE_DIR", str(tmp_path))
+
+    first = page_templates.build_environment(production=True)
+    assert first.auto_reload is False
+    first.get_template("dashboard.html")
+    assert any(tmp_path.iterdir())
+
+    # A fresh worker loads the cached bytecode instead of compiling the source
+    second = page_templates.build_environment(production=True)
+
+    def fail_compile(*args, **kwargs):
+        raise AssertionError("template was recompiled")
+
+    monkeypatch.setattr(second, "compile", fail_compile)
+    second.get_template("dashboard.html")
+
+
+def test_development_environment_reloads_templates():
+    """Test development mode picks up template edits without a bytecode cache"""
+    env = page_templates.build_environment(production=False)
+    assert env.auto_reload is True
+    assert env.bytecode_cache is None
+
+
+def test_precompile_loads_every_template():
+    """Test startup precompilation and the single shared environment"""
+    assert page_templates.precompile_templates() == len(
+        page_templates.templates.env.list_templates(extensions=["html"]))
+    assert legacy_pages.templates is page_templates.templates
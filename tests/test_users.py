@@ -121,6 +121,37 @@ def test_reset_password_no_security_answer(create_user):
     assert "Security answer not configured" in response.json()["detail"]
 
 
+def test_current_user_cached_between_requests(auth_headers, sql_statements):
+    """Test repeat API calls reuse the resolved user instead of querying it"""
+    client.get("/api/auth/users/me", headers=auth_headers)
+
+    sql_statements.clear()
+    response = client.get("/api/auth/users/me", headers=auth_headers)
+    assert response.status_code == 200
+    assert not [s for s in sql_statements if "FROM users" in s]
+
+
+def test_update_user_invalidates_cached_user(auth_headers):
+    """Test a profile update is visible on the next request"""
+    client.get("/api/auth/users/me", headers=auth_headers)
+    client.put("/api/users/me", json={"first_name": "Refreshed"},
+               headers=auth_headers)
+
+    response = client.get("/api/auth/users/me", headers=auth_headers)
+    assert response.json()["first_name"] == "Refreshed"
+
+
+def test_email_change_rejects_old_token(auth_headers):
+    """Test a cached user is not served for a token with the old email"""
+    import uuid
+    client.get("/api/auth/users/me", headers=auth_headers)
+    client.put("/api/users/me", json={
+        "email": f"moved_{uuid.uuid4().hex[:8]}@example.com"}, headers=auth_headers)
+
+    response = client.get("/api/auth/users/me", headers=auth_headers)
+    assert response.status_code == 401
+
+
 # Fixtures
 @pytest.fixture
 def auth_headers(create_user_and_login):